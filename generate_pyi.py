@@ -17,6 +17,8 @@ TYPE_MAPPING = {
     "String": "str",
 }
 
+NDARRAY_TYPE = "NDArray[np.float64]"
+
 CUSTOM_TUPLE_MAPPING = {
     "Vec4F64": "tuple[list[float], list[float], list[float], list[float]]",
     "Vec5F64": "tuple[list[float], list[float], list[float], list[float], list[float]]",
@@ -99,7 +101,7 @@ class OhlcvFrame:
     def bollinger_bands(self, period: int, std_dev: float) -> tuple[list[float], list[float], list[float]]: ...
     def rsi(self, period: int) -> list[float]: ...
     def macd(self, fast: int, slow: int, signal: int) -> tuple[list[float], list[float], list[float]]: ...
-    def stochastic(self, k_period: int, d_period: int) -> tuple[list[float], list[float]]: ...
+    def stochastic(self, k_period: int, smooth_k: int, d_period: int) -> tuple[list[float], list[float]]: ...
     def cci(self, period: int) -> list[float]: ...
     def williams_r(self, period: int) -> list[float]: ...
     def supertrend(self, period: int, multiplier: float) -> tuple[list[float], list[float], list[float], list[float]]: ...
@@ -136,20 +138,158 @@ class SFGModel:
     def is_trained(self) -> bool: ...
     def features_dim(self) -> int: ...
     def predict(self, features: list[float], n_samples: int) -> list[float]: ...
+
+# Streaming/Incremental Indicator Classes
+
+class OnlineSMA:
+    \"\"\"Online Simple Moving Average calculator.\"\"\"
+    def __init__(self, period: int) -> None: ...
+    def update(self, value: float) -> float | None: ...
+    def reset(self) -> None: ...
+    def is_ready(self) -> bool: ...
+
+class OnlineEMA:
+    \"\"\"Online Exponential Moving Average calculator.\"\"\"
+    def __init__(self, period: int) -> None: ...
+    def update(self, value: float) -> float | None: ...
+    def reset(self) -> None: ...
+    def is_ready(self) -> bool: ...
+
+class OnlineRSI:
+    \"\"\"Online RSI calculator.\"\"\"
+    def __init__(self, period: int) -> None: ...
+    def update(self, value: float) -> float | None: ...
+    def reset(self) -> None: ...
+    def is_ready(self) -> bool: ...
+
+class OnlineATR:
+    \"\"\"Online ATR calculator.\"\"\"
+    def __init__(self, period: int) -> None: ...
+    def update(self, high: float, low: float, close: float) -> float | None: ...
+    def reset(self) -> None: ...
+    def is_ready(self) -> bool: ...
+
+class OnlineMACD:
+    \"\"\"Online MACD calculator. Returns (macd, signal, histogram).\"\"\"
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9) -> None: ...
+    def update(self, value: float) -> tuple[float, float, float] | None: ...
+    def reset(self) -> None: ...
+    def is_ready(self) -> bool: ...
+
+class OnlineBollingerBands:
+    \"\"\"Online Bollinger Bands calculator. Returns (upper, middle, lower).\"\"\"
+    def __init__(self, period: int = 20, std_dev: float = 2.0) -> None: ...
+    def update(self, value: float) -> tuple[float, float, float] | None: ...
+    def reset(self) -> None: ...
+    def is_ready(self) -> bool: ...
+
+class OnlineStochastic:
+    \"\"\"Online Stochastic calculator. Returns (k, d).\"\"\"
+    def __init__(self, k_period: int = 14, smooth_k: int = 3, d_period: int = 3) -> None: ...
+    def update(self, high: float, low: float, close: float) -> tuple[float, float] | None: ...
+    def reset(self) -> None: ...
+    def is_ready(self) -> bool: ...
+
+class OnlineSuperTrend:
+    \"\"\"Online SuperTrend calculator. Returns (value, direction).\"\"\"
+    def __init__(self, period: int = 10, multiplier: float = 3.0) -> None: ...
+    def update(self, high: float, low: float, close: float) -> tuple[float, int] | None: ...
+    def reset(self) -> None: ...
+    def is_ready(self) -> bool: ...
+
+class OnlineAdaptiveRSI:
+    \"\"\"Online Adaptive RSI calculator. Returns (rsi, period).\"\"\"
+    def __init__(self, min_period: int = 7, max_period: int = 21, volatility_period: int = 10) -> None: ...
+    def update(self, value: float) -> tuple[float, int] | None: ...
+    def reset(self) -> None: ...
+    def is_ready(self) -> bool: ...
+
+class EnsembleResult:
+    \"\"\"Ensemble signal result container.\"\"\"
+    signal: float
+    rsi_contrib: float
+    macd_contrib: float
+    stoch_contrib: float
+    trend_contrib: float
+
+class OnlineEnsembleSignal:
+    \"\"\"Online Ensemble Signal calculator.\"\"\"
+    def __init__(
+        self,
+        rsi_period: int = 14,
+        macd_fast: int = 12,
+        macd_slow: int = 26,
+        macd_signal: int = 9,
+        stoch_k: int = 14,
+        stoch_smooth_k: int = 3,
+        stoch_d: int = 3,
+        st_period: int = 10,
+        st_multiplier: float = 3.0,
+        rsi_weight: float = 0.25,
+        macd_weight: float = 0.25,
+        stoch_weight: float = 0.25,
+        st_weight: float = 0.25,
+    ) -> None: ...
+    @staticmethod
+    def with_defaults() -> "OnlineEnsembleSignal": ...
+    def update(self, high: float, low: float, close: float) -> EnsembleResult | None: ...
+    def reset(self) -> None: ...
+    def is_ready(self) -> bool: ...
+
+class MLSuperTrendResult:
+    \"\"\"ML SuperTrend result container.\"\"\"
+    value: float
+    confirmed_trend: float
+    raw_trend: float
+    confidence: float
+    effective_multiplier: float
+
+class OnlineMLSuperTrend:
+    \"\"\"Online ML-enhanced SuperTrend calculator.\"\"\"
+    def __init__(self, period: int = 10, multiplier: float = 3.0, confirmation_bars: int = 2, volatility_period: int = 10) -> None: ...
+    @staticmethod
+    def with_defaults() -> "OnlineMLSuperTrend": ...
+    def update(self, high: float, low: float, close: float) -> MLSuperTrendResult | None: ...
+    def reset(self) -> None: ...
+    def is_ready(self) -> bool: ...
+
+class AISuperTrendMLResult:
+    \"\"\"AI SuperTrend ML result container.\"\"\"
+    supertrend: float
+    direction: int
+    trend_offset: float
+    buy_signal: bool
+    sell_signal: bool
+    stop_loss: float
+    take_profit: float
+
+class OnlineAISuperTrendML:
+    \"\"\"Online AI SuperTrend ML calculator with sliding window regression.\"\"\"
+    def __init__(self, st_length: int = 10, st_multiplier: float = 3.0, lookback: int = 10, train_window: int = 200) -> None: ...
+    @staticmethod
+    def with_defaults() -> "OnlineAISuperTrendML": ...
+    def update(self, high: float, low: float, close: float) -> AISuperTrendMLResult | None: ...
+    def reset(self) -> None: ...
+    def is_ready(self) -> bool: ...
 """
 
 
-def map_rust_type_to_python(rust_type: str, has_default: bool = False) -> str:
+def map_rust_type_to_python(rust_type: str, default: Optional[str] = None) -> str:
     """Map Rust type to Python type annotation."""
     rust_type = rust_type.strip()
 
+    # NumPy arrays (zero-copy bindings); drop path and lifetime qualifiers
+    rust_type = re.sub(r"\b(?:pyo3|numpy)::", "", rust_type)
+    if re.fullmatch(r"(?:Py<)?(?:PyReadonlyArray|PyArray)[12]<.*>>?", rust_type):
+        return NDARRAY_TYPE
+
     # Handle Option<T>
     if rust_type.startswith("Option<"):
         inner_match = re.search(r"Option<(.+)>$", rust_type)
         if inner_match:
             inner_type = inner_match.group(1).strip()
             base_type = map_rust_type_to_python(inner_type)
-            if has_default:
+            if default is not None and default != "None":
                 return base_type
             return f"{base_type} | None"
 
@@ -202,22 +342,26 @@ def map_rust_type_to_python(rust_type: str, has_default: bool = False) -> str:
 def extract_function_signature(block: str) -> Optional[Dict]:
     """Extract function signature from a #[pyfunction] block."""
     # Extract function name
-    fn_match = re.search(r"fn (py_\w+)\s*\(", block)
+    fn_match = re.search(r"fn (py_\w+)\s*(?:<[^>]*>)?\s*\(", block)
     if not fn_match:
         return None
 
     fn_name = fn_match.group(1)
 
     # Extract full function signature
-    fn_sig_match = re.search(r"fn py_\w+\s*\((.*?)\)\s*->\s*([^{]+)", block, re.DOTALL)
+    fn_sig_match = re.search(
+        r"fn py_\w+\s*(?:<[^>]*>)?\s*\((.*?)\)\s*->\s*([^{]+)", block, re.DOTALL
+    )
     if not fn_sig_match:
         return None
 
     params_str = fn_sig_match.group(1)
     return_type_str = fn_sig_match.group(2).strip()
 
-    # Extract text_signature for defaults
+    # Extract text_signature (or signature) for defaults
     text_sig_match = re.search(r'text_signature = "([^"]+)"', block)
+    if not text_sig_match:
+        text_sig_match = re.search(r"#\[pyo3\(signature = (\(.*?\))\)\]", block)
     defaults = {}
     if text_sig_match:
         text_sig = text_sig_match.group(1)
@@ -252,6 +396,9 @@ def extract_function_signature(block: str) -> Optional[Dict]:
             param = param.strip()
             if not param or param.startswith("_"):
                 continue
+            # The GIL token is injected by PyO3, not passed from Python
+            if re.search(r":\s*Python\b", param):
+                continue
 
             if ":" in param:
                 parts = param.split(":", 1)
@@ -259,7 +406,7 @@ def extract_function_signature(block: str) -> Optional[Dict]:
                 rust_type = parts[1].strip()
 
                 has_default = param_name in defaults
-                python_type = map_rust_type_to_python(rust_type, has_default)
+                python_type = map_rust_type_to_python(rust_type, defaults.get(param_name))
 
                 if has_default:
                     params.append((param_name, python_type, defaults[param_name]))
@@ -273,6 +420,8 @@ def extract_function_signature(block: str) -> Optional[Dict]:
         if inner_match:
             inner_type = inner_match.group(1).strip()
             return_type = map_rust_type_to_python(inner_type)
+    elif return_type_str:
+        return_type = map_rust_type_to_python(return_type_str)
 
     # Extract first line of docstring
     doc_match = re.search(r"/// (.+?)(?=\n///\s*\n|\nfn|\n#)", block, re.DOTALL)
@@ -292,7 +441,7 @@ def extract_functions(rust_file: Path) -> List[Dict]:
     content = rust_file.read_text()
 
     # Find all #[pyfunction] blocks
-    pattern = r"#\[pyfunction\].*?(?=\n#\[pyfunction\]|\nstruct|\npub struct|\Z)"
+    pattern = r"#\[pyfunction(?:\(.*?\))?\].*?(?=\n#\[pyfunction|\nstruct|\npub struct|\Z)"
     matches = re.finditer(pattern, content, re.DOTALL)
 
     functions = []
@@ -674,6 +823,9 @@ def generate_pyi(categories: Dict) -> str:
     output.append("This module provides technical analysis indicators implemented in Rust.")
     output.append('"""')
     output.append("")
+    output.append("import numpy as np")
+    output.append("from numpy.typing import NDArray")
+    output.append("")
 
     if PYCLASS_STUBS.strip():
         output.extend(PYCLASS_STUBS.strip().splitlines())
@@ -497,11 +497,16 @@ fn haze_library(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(py_three_black_crows, m)?)?;
     // 统计指标
     m.add_function(wrap_pyfunction!(py_linear_regression, m)?)?;
+    m.add_function(wrap_pyfunction!(py_linear_regression_legacy, m)?)?;  // Legacy API for backward compatibility
+    m.add_function(wrap_pyfunction!(py_linear_regression_batch, m)?)?;
     m.add_function(wrap_pyfunction!(py_correlation, m)?)?;
+    m.add_function(wrap_pyfunction!(py_correlation_legacy, m)?)?;  // Legacy API for backward compatibility
     m.add_function(wrap_pyfunction!(py_zscore, m)?)?;
     m.add_function(wrap_pyfunction!(py_zscore_legacy, m)?)?;  // Legacy API for backward compatibility
     m.add_function(wrap_pyfunction!(py_covariance, m)?)?;
+    m.add_function(wrap_pyfunction!(py_covariance_legacy, m)?)?;  // Legacy API for backward compatibility
     m.add_function(wrap_pyfunction!(py_beta, m)?)?;
+    m.add_function(wrap_pyfunction!(py_beta_legacy, m)?)?;  // Legacy API for backward compatibility
     m.add_function(wrap_pyfunction!(py_standard_error, m)?)?;
     m.add_function(wrap_pyfunction!(py_standard_error_legacy, m)?)?;  // Legacy API for backward compatibility
     m.add_function(wrap_pyfunction!(py_stderr, m)?)?;
@@ -660,6 +665,7 @@ fn haze_library(m: &Bound<'_, PyModule>) -> PyResult<()> {
 
     // 统计函数 (TA-Lib Compatible)
     m.add_function(wrap_pyfunction!(py_correl, m)?)?;
+    m.add_function(wrap_pyfunction!(py_correl_legacy, m)?)?;  // Legacy API for backward compatibility
     m.add_function(wrap_pyfunction!(py_linearreg, m)?)?;
     m.add_function(wrap_pyfunction!(py_linearreg_legacy, m)?)?;  // Legacy API for backward compatibility
     m.add_function(wrap_pyfunction!(py_linearreg_slope, m)?)?;
@@ -3698,7 +3704,7 @@ fn py_three_black_crows(open: Vec<f64>, low: Vec<f64>, close: Vec<f64>) -> PyRes
 /// Returns
 /// -------
 /// tuple of (list, list, list) - (slope, intercept, r_squared)
-fn py_linear_regression(
+fn py_linear_regression_legacy(
     y_values: Vec<f64>,
     period: usize,
 ) -> PyResult<(Vec<f64>, Vec<f64>, Vec<f64>)> {
@@ -3706,6 +3712,67 @@ fn py_linear_regression(
     validate_period!(period, len);
     Ok(utils::linear_regression(&y_values, period))
 }
+// === 迁移后 (零拷贝版本) ===
+#[cfg(feature = "python")]
+#[pyfunction]
+fn py_linear_regression<'py>(
+    py: Python<'py>,
+    y_values: numpy::PyReadonlyArray1<'py, f64>,
+    period: usize,
+) -> PyResult<(pyo3::Py<numpy::PyArray1<f64>>, pyo3::Py<numpy::PyArray1<f64>>, pyo3::Py<numpy::PyArray1<f64>>)> {
+    use crate::ffi::zero_copy;
+
+    let y_values_slice = y_values.as_slice()?;
+    let len = validate_single!(y_values_slice, "y_values");
+    validate_period!(period, len);
+
+    // 调用核心算法
+    let result = Some(utils::linear_regression(y_values_slice, period));
+
+    let (arr1, arr2, arr3) = zero_copy::to_pyarray3_or_nan(py, result, len)?;
+
+    Ok((arr1.unbind(), arr2.unbind(), arr3.unbind()))
+}
+
+#[cfg(feature = "python")]
+#[pyfunction]
+#[pyo3(text_signature = "(data, period)")]
+/// Calculate Linear Regression for many series at once
+///
+/// Row-wise rolling regression over a 2-D array, one series per row.
+///
+/// Parameters
+/// ----------
+/// data : np.ndarray
+///     C-contiguous float64 array of shape (n_series, n_samples)
+/// period : int
+///     Lookback period
+///
+/// Returns
+/// -------
+/// tuple of (np.ndarray, np.ndarray, np.ndarray) - (slope, intercept, r_squared),
+/// each with the same shape as ``data``
+fn py_linear_regression_batch<'py>(
+    py: Python<'py>,
+    data: numpy::PyReadonlyArray2<'py, f64>,
+    period: usize,
+) -> PyResult<(pyo3::Py<numpy::PyArray2<f64>>, pyo3::Py<numpy::PyArray2<f64>>, pyo3::Py<numpy::PyArray2<f64>>)> {
+    use numpy::{PyArray1, PyArrayMethods, PyUntypedArrayMethods};
+
+    let (rows, cols) = (data.shape()[0], data.shape()[1]);
+    let data_slice = data.as_slice()?;
+    validate_single!(data_slice, "data");
+    validate_period!(period, cols);
+
+    // 调用核心算法
+    let (slope, intercept, r_squared) = utils::linear_regression_batch(data_slice, rows, period);
+
+    Ok((
+        PyArray1::from_vec(py, slope).reshape([rows, cols])?.unbind(),
+        PyArray1::from_vec(py, intercept).reshape([rows, cols])?.unbind(),
+        PyArray1::from_vec(py, r_squared).reshape([rows, cols])?.unbind(),
+    ))
+}
 
 #[cfg(feature = "python")]
 #[pyfunction]
@@ -3726,11 +3793,32 @@ fn py_linear_regression(
 /// Returns
 /// -------
 /// list of float - Correlation values (-1 to +1)
-fn py_correlation(x: Vec<f64>, y: Vec<f64>, period: usize) -> PyResult<Vec<f64>> {
+fn py_correlation_legacy(x: Vec<f64>, y: Vec<f64>, period: usize) -> PyResult<Vec<f64>> {
     let len = validate_pair!(&x, "x", &y, "y");
     validate_period!(period, len);
     Ok(utils::correlation(&x, &y, period))
 }
+// === 迁移后 (零拷贝版本) ===
+#[cfg(feature = "python")]
+#[pyfunction]
+fn py_correlation<'py>(
+    py: Python<'py>,
+    x: numpy::PyReadonlyArray1<'py, f64>,
+    y: numpy::PyReadonlyArray1<'py, f64>,
+    period: usize,
+) -> PyResult<pyo3::Py<numpy::PyArray1<f64>>> {
+    use crate::ffi::zero_copy;
+
+    let x_slice = x.as_slice()?;
+    let y_slice = y.as_slice()?;
+    let len = validate_pair!(x_slice, "x", y_slice, "y");
+    validate_period!(period, len);
+
+    // 调用核心算法
+    let result = Some(utils::correlation(x_slice, y_slice, period));
+
+    Ok(zero_copy::to_pyarray_or_nan(py, result, len)?.unbind())
+}
 
 #[cfg(feature = "python")]
 #[pyfunction]
@@ -3798,11 +3886,32 @@ fn py_zscore<'py>(
 /// Returns
 /// -------
 /// list of float - Covariance values
-fn py_covariance(x: Vec<f64>, y: Vec<f64>, period: usize) -> PyResult<Vec<f64>> {
+fn py_covariance_legacy(x: Vec<f64>, y: Vec<f64>, period: usize) -> PyResult<Vec<f64>> {
     let len = validate_pair!(&x, "x", &y, "y");
     validate_period!(period, len);
     Ok(utils::covariance(&x, &y, period))
 }
+// === 迁移后 (零拷贝版本) ===
+#[cfg(feature = "python")]
+#[pyfunction]
+fn py_covariance<'py>(
+    py: Python<'py>,
+    x: numpy::PyReadonlyArray1<'py, f64>,
+    y: numpy::PyReadonlyArray1<'py, f64>,
+    period: usize,
+) -> PyResult<pyo3::Py<numpy::PyArray1<f64>>> {
+    use crate::ffi::zero_copy;
+
+    let x_slice = x.as_slice()?;
+    let y_slice = y.as_slice()?;
+    let len = validate_pair!(x_slice, "x", y_slice, "y");
+    validate_period!(period, len);
+
+    // 调用核心算法
+    let result = Some(utils::covariance(x_slice, y_slice, period));
+
+    Ok(zero_copy::to_pyarray_or_nan(py, result, len)?.unbind())
+}
 
 #[cfg(feature = "python")]
 #[pyfunction]
@@ -3824,7 +3933,7 @@ fn py_covariance(x: Vec<f64>, y: Vec<f64>, period: usize) -> PyResult<Vec<f64>>
 /// Returns
 /// -------
 /// list of float - Beta values
-fn py_beta(
+fn py_beta_legacy(
     asset_returns: Vec<f64>,
     benchmark_returns: Vec<f64>,
     period: usize,
@@ -3838,6 +3947,27 @@ fn py_beta(
     validate_period!(period, len);
     Ok(utils::beta(&asset_returns, &benchmark_returns, period))
 }
+// === 迁移后 (零拷贝版本) ===
+#[cfg(feature = "python")]
+#[pyfunction]
+fn py_beta<'py>(
+    py: Python<'py>,
+    asset_returns: numpy::PyReadonlyArray1<'py, f64>,
+    benchmark_returns: numpy::PyReadonlyArray1<'py, f64>,
+    period: usize,
+) -> PyResult<pyo3::Py<numpy::PyArray1<f64>>> {
+    use crate::ffi::zero_copy;
+
+    let asset_returns_slice = asset_returns.as_slice()?;
+    let benchmark_returns_slice = benchmark_returns.as_slice()?;
+    let len = validate_pair!(asset_returns_slice, "asset_returns", benchmark_returns_slice, "benchmark_returns");
+    validate_period!(period, len);
+
+    // 调用核心算法
+    let result = Some(utils::beta(asset_returns_slice, benchmark_returns_slice, period));
+
+    Ok(zero_copy::to_pyarray_or_nan(py, result, len)?.unbind())
+}
 
 #[cfg(feature = "python")]
 #[pyfunction]
@@ -6820,11 +6950,32 @@ mod coverage_tests;
 // ==================== 统计函数包装 (TA-Lib Compatible) ====================
 #[cfg(feature = "python")]
 #[pyfunction]
-fn py_correl(values1: Vec<f64>, values2: Vec<f64>, period: usize) -> PyResult<Vec<f64>> {
+fn py_correl_legacy(values1: Vec<f64>, values2: Vec<f64>, period: usize) -> PyResult<Vec<f64>> {
     let len = validate_pair!(&values1, "values1", &values2, "values2");
     validate_period!(period, len);
     Ok(utils::correl(&values1, &values2, period))
 }
+// === 迁移后 (零拷贝版本) ===
+#[cfg(feature = "python")]
+#[pyfunction]
+fn py_correl<'py>(
+    py: Python<'py>,
+    values1: numpy::PyReadonlyArray1<'py, f64>,
+    values2: numpy::PyReadonlyArray1<'py, f64>,
+    period: usize,
+) -> PyResult<pyo3::Py<numpy::PyArray1<f64>>> {
+    use crate::ffi::zero_copy;
+
+    let values1_slice = values1.as_slice()?;
+    let values2_slice = values2.as_slice()?;
+    let len = validate_pair!(values1_slice, "values1", values2_slice, "values2");
+    validate_period!(period, len);
+
+    // 调用核心算法
+    let result = Some(utils::correl(values1_slice, values2_slice, period));
+
+    Ok(zero_copy::to_pyarray_or_nan(py, result, len)?.unbind())
+}
 
 #[cfg(feature = "python")]
 #[pyfunction]
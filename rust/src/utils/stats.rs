@@ -1078,6 +1078,44 @@ pub fn linear_regression(y_values: &[f64], period: usize) -> (Vec<f64>, Vec<f64>
     (slope, intercept, r_squared)
 }
 
+/// 批量线性回归（Linear Regression Batch）
+///
+/// 对按行存储（C 连续，形状 `[rows, values.len() / rows]`）的多条序列
+/// 逐行计算滚动线性回归，结果写入同形状的扁平输出。
+///
+/// 返回：(slope, intercept, r_squared)，布局与输入相同
+pub fn linear_regression_batch(
+    values: &[f64],
+    rows: usize,
+    period: usize,
+) -> (Vec<f64>, Vec<f64>, Vec<f64>) {
+    let n = values.len();
+    let mut slope = init_result!(n);
+    let mut intercept = init_result!(n);
+    let mut r_squared = init_result!(n);
+
+    if rows == 0 || n % rows != 0 {
+        return (slope, intercept, r_squared);
+    }
+    let cols = n / rows;
+    if period < 2 || period > cols {
+        return (slope, intercept, r_squared);
+    }
+
+    for (row, y_values) in values.chunks_exact(cols).enumerate() {
+        let offset = row * cols;
+        rolling_linreg_apply(y_values, period, |i, computed| {
+            if let Some(stats) = computed {
+                slope[offset + i] = stats.slope;
+                intercept[offset + i] = stats.intercept;
+                r_squared[offset + i] = stats.r_squared;
+            }
+        });
+    }
+
+    (slope, intercept, r_squared)
+}
+
 /// Pearson 相关系数（Correlation Coefficient）
 ///
 /// 计算两个序列的滚动相关系数
@@ -1676,6 +1714,42 @@ mod tests_advanced {
         assert!((r_squared[4] - 1.0).abs() < 1e-10); // 完美拟合
     }
 
+    #[test]
+    fn test_linearreg_angle_matches_slope() {
+        let values = vec![1.0, 3.0, 2.0, 5.0, 4.0, 6.0, 8.0, 7.0];
+        let slopes = linearreg_slope(&values, 4);
+        let angles = linearreg_angle(&values, 4);
+
+        for (angle, slope) in angles.iter().zip(&slopes) {
+            if slope.is_nan() {
+                assert!(angle.is_nan());
+            } else {
+                assert!((angle - slope.atan().to_degrees()).abs() < 1e-12);
+            }
+        }
+    }
+
+    #[test]
+    fn test_linear_regression_batch_matches_rows() {
+        let rows = [
+            vec![1.0, 3.0, 5.0, 7.0, 9.0, 8.0],
+            vec![10.0, 9.5, 9.0, 9.2, 8.1, 7.7],
+        ];
+        let flat: Vec<f64> = rows.iter().flatten().copied().collect();
+        let (slope, intercept, r_squared) = linear_regression_batch(&flat, 2, 3);
+
+        for (r, row) in rows.iter().enumerate() {
+            let (s, ic, r2) = linear_regression(row, 3);
+            let base = r * row.len();
+            for i in 0..row.len() {
+                let got = [slope[base + i], intercept[base + i], r_squared[base + i]];
+                for (g, e) in got.iter().zip([s[i], ic[i], r2[i]]) {
+                    assert!((g.is_nan() && e.is_nan()) || (g - e).abs() < 1e-12);
+                }
+            }
+        }
+    }
+
     #[test]
     fn test_correlation() {
         // 完全正相关
@@ -1776,17 +1850,21 @@ pub fn linearreg_slope(values: &[f64], period: usize) -> Vec<f64> {
 ///
 /// 线性回归角度（度数）
 pub fn linearreg_angle(values: &[f64], period: usize) -> Vec<f64> {
-    let slopes = linearreg_slope(values, period);
-    slopes
-        .iter()
-        .map(|&slope| {
-            if slope.is_nan() {
-                f64::NAN
-            } else {
-                slope.atan().to_degrees()
-            }
-        })
-        .collect()
+    let n = values.len();
+    let mut result = init_result!(n);
+
+    if period < 2 || period > n {
+        return result;
+    }
+
+    // 在回归回调中直接换算角度，省去中间斜率数组
+    rolling_linreg_apply(values, period, |i, computed| {
+        if let Some(stats) = computed {
+            result[i] = stats.slope.atan().to_degrees();
+        }
+    });
+
+    result
 }
 
 /// LINEARREG_INTERCEPT - Linear Regression Intercept
@@ -983,13 +983,15 @@ impl OnlineAdaptiveRSI {
         }
 
         // 计算波动率并确定自适应周期
-        let volatility: f64 =
-            kahan_sum(self.changes.make_contiguous()) / self.volatility_period as f64;
-        let max_change: f64 = self
-            .changes
-            .iter()
-            .copied()
-            .fold(f64::NEG_INFINITY, f64::max);
+        // 单次遍历同时完成 Kahan 求和与最大值，避免 make_contiguous 搬移环形缓冲
+        let mut change_sum = 0.0;
+        let mut change_comp = 0.0;
+        let mut max_change = f64::NEG_INFINITY;
+        for &c in &self.changes {
+            kahan_add(&mut change_sum, &mut change_comp, c);
+            max_change = max_change.max(c);
+        }
+        let volatility = change_sum / self.volatility_period as f64;
 
         let volatility_ratio = if is_zero(max_change) {
             0.5
@@ -1004,10 +1006,18 @@ impl OnlineAdaptiveRSI {
         let effective_period = adaptive_period.clamp(self.min_period, self.gains.len());
 
         // 计算自适应 RSI
-        let recent_gains: f64 =
-            kahan_sum_iter(self.gains.iter().rev().take(effective_period).copied());
-        let recent_losses: f64 =
-            kahan_sum_iter(self.losses.iter().rev().take(effective_period).copied());
+        let (mut recent_gains, mut gain_comp) = (0.0, 0.0);
+        let (mut recent_losses, mut loss_comp) = (0.0, 0.0);
+        for (&g, &l) in self
+            .gains
+            .iter()
+            .rev()
+            .zip(self.losses.iter().rev())
+            .take(effective_period)
+        {
+            kahan_add(&mut recent_gains, &mut gain_comp, g);
+            kahan_add(&mut recent_losses, &mut loss_comp, l);
+        }
         let avg_gain = recent_gains / effective_period as f64;
         let avg_loss = recent_losses / effective_period as f64;
 
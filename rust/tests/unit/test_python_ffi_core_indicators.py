@@ -767,8 +767,9 @@ class TestStatisticalIndicators(IndicatorTestBase):
     # ---- Correlation Tests ----
     def test_correlation_valid_output(self):
         """Correlation returns values in [-1, 1] range"""
-        x = self.valid_data(50)
-        y = self.valid_data(50, start=200.0)
+        # Zero-copy stats bindings take float64 ndarrays; lists go through *_legacy
+        x = np.asarray(self.valid_data(50), dtype=np.float64)
+        y = np.asarray(self.valid_data(50, start=200.0), dtype=np.float64)
         result = haze.py_correlation(x, y, 20)
 
         assert len(result) == 50
@@ -788,8 +789,8 @@ class TestStatisticalIndicators(IndicatorTestBase):
     # ---- Covariance Tests ----
     def test_covariance_valid_output(self):
         """Covariance returns correct output format"""
-        x = self.valid_data(50)
-        y = self.valid_data(50, start=200.0)
+        x = np.asarray(self.valid_data(50), dtype=np.float64)
+        y = np.asarray(self.valid_data(50, start=200.0), dtype=np.float64)
         result = haze.py_covariance(x, y, 20)
 
         assert len(result) == 50
@@ -797,8 +798,8 @@ class TestStatisticalIndicators(IndicatorTestBase):
     # ---- Beta Tests ----
     def test_beta_valid_output(self):
         """Beta returns correct output format"""
-        asset = self.valid_data(50)
-        market = self.valid_data(50, start=200.0)
+        asset = np.asarray(self.valid_data(50), dtype=np.float64)
+        market = np.asarray(self.valid_data(50, start=200.0), dtype=np.float64)
         result = haze.py_beta(asset, market, 20)
 
         assert len(result) == 50
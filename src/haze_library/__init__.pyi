@@ -1205,7 +1205,7 @@ def realtime_multi_indicator(high: ArrayLike, low: ArrayLike, close: ArrayLike,
 
     ...
 
-def get_available_streaming_indicators() -> List[str]:
+def get_available_streaming_indicators() -> Tuple[str, ...]:
 
     ...
 
@@ -4,6 +4,9 @@ Auto-generated from Rust source code.
 This module provides technical analysis indicators implemented in Rust.
 """
 
+import numpy as np
+from numpy.typing import NDArray
+
 class Candle:
     """OHLCV Candle data structure."""
     timestamp: int
@@ -242,9 +245,10 @@ class OnlineAISuperTrendML:
 # Volatility Indicators
 
 def py_aberration(high: list[float], low: list[float], close: list[float], period: int = 20, atr_period: int = 20) -> list[float]: ...
-def py_atr(high: list[float], low: list[float], close: list[float], period: int = 14) -> list[float]: ...
+def py_atr(high: NDArray[np.float64], low: NDArray[np.float64], close: NDArray[np.float64], period: int = 14) -> NDArray[np.float64]: ...
 def py_atr2_signals(high: list[float], low: list[float], close: list[float], volume: list[float], trend_length: int | None, confirmation_threshold: float | None, momentum_window: int | None) -> tuple[list[float], list[float], list[float]]: ...
 def py_atr2_signals_ml(high: list[float], low: list[float], close: list[float], volume: list[float], rsi_period: int | None, atr_period: int | None, ridge_alpha: float | None, momentum_window: int | None) -> tuple[list[float], list[float], list[float], list[float], list[float], list[float]]: ...
+def py_atr_legacy(high: list[float], low: list[float], close: list[float], period: int = 14) -> list[float]: ...
 def py_bollinger_bands(close: list[float], period: int = 20, std_multiplier: float = 2.0) -> tuple[list[float], list[float], list[float]]: ...
 def py_chandelier_exit(high: list[float], low: list[float], close: list[float], period: int = 22, atr_period: int = 22, multiplier: float = 3.0) -> tuple[list[float], list[float]]: ...
 def py_donchian_channel(high: list[float], low: list[float], period: int = 20) -> tuple[list[float], list[float], list[float]]: ...
@@ -253,7 +257,7 @@ def py_keltner_channel(high: list[float], low: list[float], close: list[float],
 def py_mass_index(high: list[float], low: list[float], fast: int = 9, slow: int = 25) -> list[float]: ...
 def py_natr(high: list[float], low: list[float], close: list[float], period: int = 14) -> list[float]: ...
 def py_prepare_atr2_features(close: list[float], atr: list[float], volume: list[float], lookback: int) -> tuple[list[float], int, int]: ...
-def py_train_atr2_model(close: list[float], atr: list[float], volume: list[float], train_window: int | None, lookback: int | None, ridge_alpha: float | None) -> SFGModel: ...
+def py_train_atr2_model(close: list[float], atr: list[float], volume: list[float], train_window: int | None = None, lookback: int | None = None, ridge_alpha: float | None = None) -> SFGModel: ...
 def py_true_range(high: list[float], low: list[float], close: list[float], drift: int = 1) -> list[float]: ...
 def py_ulcer_index(close: list[float], period: int = 14) -> list[float]: ...
 
@@ -284,15 +288,18 @@ def py_fibonacci_retracement(start_price: float, end_price: float) -> list[tuple
 def py_fisher_transform(high: list[float], low: list[float], close: list[float], period: int = 10) -> tuple[list[float], list[float]]: ...
 def py_general_parameters_signals(high: list[float], low: list[float], close: list[float], ema_fast: int | None, ema_slow: int | None, atr_period: int | None, grid_multiplier: float | None) -> tuple[list[float], list[float], list[float], list[float]]: ...
 def py_hammer(open: list[float], high: list[float], low: list[float], close: list[float]) -> list[float]: ...
-def py_harmonics_patterns(high: list[float], low: list[float], left_bars: int | None, right_bars: int | None, include_forming: bool | None) -> list[PyHarmonicPattern]: ...
-def py_ht_dcperiod(values: list[float]) -> list[float]: ...
+def py_harmonics_patterns(high: list[float], low: list[float], left_bars: int | None = None, right_bars: int | None = None, include_forming: bool | None = None) -> list[PyHarmonicPattern]: ...
+def py_ht_dcperiod(values: NDArray[np.float64]) -> NDArray[np.float64]: ...
+def py_ht_dcperiod_legacy(values: list[float]) -> list[float]: ...
 def py_inertia(open: list[float], high: list[float], low: list[float], close: list[float], rvi_period: int | None, regression_period: int | None) -> list[float]: ...
 def py_inverted_hammer(open: list[float], high: list[float], low: list[float], close: list[float]) -> list[float]: ...
 def py_kdj(high: list[float], low: list[float], close: list[float], k_period: int = 9, smooth_k: int = 3, d_period: int = 3) -> tuple[list[float], list[float], list[float]]: ...
 def py_kst(close: list[float], roc1: int | None, roc2: int | None, roc3: int | None, roc4: int | None, signal_period: int | None) -> tuple[list[float], list[float]]: ...
 def py_ladder_bottom(open: list[float], high: list[float], low: list[float], close: list[float]) -> list[float]: ...
-def py_linearreg_intercept(values: list[float], period: int) -> list[float]: ...
-def py_macd(close: list[float], fast_period: int = 12, slow_period: int = 26, signal_period: int = 9) -> tuple[list[float], list[float], list[float]]: ...
+def py_linearreg_intercept(values: NDArray[np.float64], period: int) -> NDArray[np.float64]: ...
+def py_linearreg_intercept_legacy(values: list[float], period: int) -> list[float]: ...
+def py_macd(close: NDArray[np.float64], fast_period: int = 12, slow_period: int = 26, signal_period: int = 9) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]: ...
+def py_macd_legacy(close: list[float], fast_period: int = 12, slow_period: int = 26, signal_period: int = 9) -> tuple[list[float], list[float], list[float]]: ...
 def py_mom(values: list[float], period: int = 10) -> list[float]: ...
 def py_percent_rank(values: list[float], period: int | None) -> list[float]: ...
 def py_pgo(high: list[float], low: list[float], close: list[float], period: int | None) -> list[float]: ...
@@ -303,13 +310,16 @@ def py_psl(close: list[float], period: int | None) -> list[float]: ...
 def py_qqe(close: list[float], rsi_period: int = 14, smooth: int = 5, multiplier: float = 4.236) -> tuple[list[float], list[float], list[float]]: ...
 def py_qstick(open: list[float], close: list[float], period: int = 14) -> list[float]: ...
 def py_roc(values: list[float], period: int = 10) -> list[float]: ...
-def py_rsi(close: list[float], period: int = 14) -> list[float]: ...
+def py_rsi(close: NDArray[np.float64], period: int = 14) -> NDArray[np.float64]: ...
+def py_rsi_legacy(close: list[float], period: int = 14) -> list[float]: ...
 def py_rvi(open: list[float], high: list[float], low: list[float], close: list[float], period: int | None, signal_period: int | None) -> tuple[list[float], list[float]]: ...
 def py_smi(high: list[float], low: list[float], close: list[float], period: int | None, smooth1: int | None, smooth2: int | None) -> list[float]: ...
 def py_stalled_pattern(open: list[float], high: list[float], low: list[float], close: list[float]) -> list[float]: ...
-def py_standard_error(y_values: list[float], period: int) -> list[float]: ...
+def py_standard_error(y_values: NDArray[np.float64], period: int) -> NDArray[np.float64]: ...
+def py_standard_error_legacy(y_values: list[float], period: int) -> list[float]: ...
 def py_stc(close: list[float], fast: int | None, slow: int | None, cycle: int | None) -> list[float]: ...
-def py_stderr(y_values: list[float], period: int) -> list[float]: ...
+def py_stderr(y_values: NDArray[np.float64], period: int) -> NDArray[np.float64]: ...
+def py_stderr_legacy(y_values: list[float], period: int) -> list[float]: ...
 def py_stoch_rsi(close: list[float], rsi_period: int = 14, stoch_period: int = 14, k_period: int = 3, d_period: int = 3) -> tuple[list[float], list[float]]: ...
 def py_stochastic(high: list[float], low: list[float], close: list[float], k_period: int = 14, smooth_k: int = 3, d_period: int = 3) -> tuple[list[float], list[float]]: ...
 def py_stochrsi(close: list[float], rsi_period: int = 14, stoch_period: int = 14, k_period: int = 3, d_period: int = 3) -> tuple[list[float], list[float]]: ...
@@ -317,8 +327,8 @@ def py_supertrend(high: list[float], low: list[float], close: list[float], perio
 def py_tdfi(close: list[float], period: int | None, smooth: int | None) -> list[float]: ...
 def py_three_outside(open: list[float], high: list[float], low: list[float], close: list[float]) -> list[float]: ...
 def py_three_white_soldiers(open: list[float], high: list[float], close: list[float]) -> list[float]: ...
-def py_train_momentum_model(rsi: list[float], train_window: int | None, lookback: int | None) -> SFGModel: ...
-def py_train_supertrend_model(close: list[float], atr: list[float], train_window: int | None, lookback: int | None, use_ridge: bool | None, ridge_alpha: float | None) -> SFGModel: ...
+def py_train_momentum_model(rsi: list[float], train_window: int | None = None, lookback: int | None = None) -> SFGModel: ...
+def py_train_supertrend_model(close: list[float], atr: list[float], train_window: int | None = None, lookback: int | None = None, use_ridge: bool | None = None, ridge_alpha: float | None = None) -> SFGModel: ...
 def py_tsi(close: list[float], long_period: int = 25, short_period: int = 13, signal_period: int = 13) -> tuple[list[float], list[float]]: ...
 def py_tweezers_bottom(open: list[float], low: list[float], close: list[float], tolerance: float = 0.01) -> list[float]: ...
 def py_tweezers_top(open: list[float], high: list[float], close: list[float], tolerance: float = 0.01) -> list[float]: ...
@@ -336,8 +346,10 @@ def py_aroon(high: list[float], low: list[float], period: int = 25) -> tuple[lis
 def py_choppiness(high: list[float], low: list[float], close: list[float], period: int = 14) -> list[float]: ...
 def py_dpo(close: list[float], period: int = 20) -> list[float]: ...
 def py_dx(high: list[float], low: list[float], close: list[float], period: int = 14) -> list[float]: ...
-def py_linearreg_slope(values: list[float], period: int) -> list[float]: ...
-def py_midpoint(values: list[float], period: int) -> list[float]: ...
+def py_linearreg_slope(values: NDArray[np.float64], period: int) -> NDArray[np.float64]: ...
+def py_linearreg_slope_legacy(values: list[float], period: int) -> list[float]: ...
+def py_midpoint(values: NDArray[np.float64], period: int) -> NDArray[np.float64]: ...
+def py_midpoint_legacy(values: list[float], period: int) -> list[float]: ...
 def py_minus_di(high: list[float], low: list[float], close: list[float], period: int = 14) -> list[float]: ...
 def py_plus_di(high: list[float], low: list[float], close: list[float], period: int = 14) -> list[float]: ...
 def py_psar(high: list[float], low: list[float], close: list[float], af_init: float | None, af_increment: float = 0.02, af_max: float = 0.2) -> tuple[list[float], list[float]]: ...
@@ -363,35 +375,45 @@ def py_pvi(close: list[float], volume: list[float]) -> list[float]: ...
 def py_pvt(close: list[float], volume: list[float]) -> list[float]: ...
 def py_volume_oscillator(volume: list[float], short_period: int = 5, long_period: int = 10) -> list[float]: ...
 def py_volume_profile(high: list[float], low: list[float], close: list[float], volume: list[float], num_bins: int | None) -> tuple[list[float], list[float], float]: ...
+def py_volume_profile_signals(high: list[float], low: list[float], close: list[float], volume: list[float], period: int | None, num_bins: int | None) -> tuple[list[float], list[float], list[float], list[float], list[float], list[float]]: ...
 def py_vwap(high: list[float], low: list[float], close: list[float], volume: list[float], period: int | None) -> list[float]: ...
 def py_vwma(close: list[float], volume: list[float], period: int | None) -> list[float]: ...
 
 # Overlap/MA Indicators
 
 def py_alma(values: list[float], period: int | None, offset: float | None, sigma: float | None) -> list[float]: ...
-def py_dema(values: list[float], period: int) -> list[float]: ...
+def py_dema(values: NDArray[np.float64], period: int) -> NDArray[np.float64]: ...
+def py_dema_legacy(values: list[float], period: int) -> list[float]: ...
 def py_demark_pivots(open: float, high: float, low: float, close: float) -> tuple[float, float, float, float, float, float, float]: ...
-def py_ema(values: list[float], period: int) -> list[float]: ...
+def py_ema(values: NDArray[np.float64], period: int) -> NDArray[np.float64]: ...
+def py_ema_legacy(values: list[float], period: int) -> list[float]: ...
 def py_frama(values: list[float], period: int | None) -> list[float]: ...
-def py_hma(values: list[float], period: int) -> list[float]: ...
+def py_hma(values: NDArray[np.float64], period: int) -> NDArray[np.float64]: ...
+def py_hma_legacy(values: list[float], period: int) -> list[float]: ...
 def py_kama(values: list[float], period: int = 10, fast_period: int = 2, slow_period: int = 30) -> list[float]: ...
 def py_linreg_supply_demand_signals(high: list[float], low: list[float], close: list[float], volume: list[float], linreg_period: int | None, tolerance: float | None) -> tuple[list[float], list[float], list[float], list[float]]: ...
 def py_mama(values: list[float], fast_limit: float | None, slow_limit: float | None) -> tuple[list[float], list[float]]: ...
 def py_parabolic_sar(high: list[float], low: list[float], close: list[float], af_init: float = 0.02, af_increment: float = 0.02, af_max: float = 0.2) -> tuple[list[float], list[float]]: ...
 def py_pwma(values: list[float], period: int | None) -> list[float]: ...
-def py_rma(values: list[float], period: int) -> list[float]: ...
+def py_rma(values: NDArray[np.float64], period: int) -> NDArray[np.float64]: ...
+def py_rma_legacy(values: list[float], period: int) -> list[float]: ...
 def py_sar(high: list[float], low: list[float], acceleration: float = 0.02, maximum: float = 0.2) -> list[float]: ...
 def py_sarext(high: list[float], low: list[float], start_value: float | None, offset_on_reverse: float | None, af_init_long: float | None, af_long: float | None, af_max_long: float | None, af_init_short: float | None, af_short: float | None, af_max_short: float | None) -> list[float]: ...
 def py_sinwma(values: list[float], period: int | None) -> list[float]: ...
-def py_sma(values: list[float], period: int) -> list[float]: ...
+def py_sma(values: NDArray[np.float64], period: int) -> NDArray[np.float64]: ...
+def py_sma_legacy(values: list[float], period: int) -> list[float]: ...
 def py_ssl_channel(high: list[float], low: list[float], close: list[float], period: int | None) -> tuple[list[float], list[float]]: ...
 def py_swma(values: list[float], period: int | None) -> list[float]: ...
 def py_t3(values: list[float], period: int = 5, vfactor: float = 0.7) -> list[float]: ...
-def py_tema(values: list[float], period: int) -> list[float]: ...
-def py_trima(values: list[float], period: int) -> list[float]: ...
+def py_tema(values: NDArray[np.float64], period: int) -> NDArray[np.float64]: ...
+def py_tema_legacy(values: list[float], period: int) -> list[float]: ...
+def py_trima(values: NDArray[np.float64], period: int) -> NDArray[np.float64]: ...
+def py_trima_legacy(values: list[float], period: int) -> list[float]: ...
 def py_vidya(close: list[float], period: int | None) -> list[float]: ...
-def py_wma(values: list[float], period: int) -> list[float]: ...
-def py_zlma(values: list[float], period: int) -> list[float]: ...
+def py_wma(values: NDArray[np.float64], period: int) -> NDArray[np.float64]: ...
+def py_wma_legacy(values: list[float], period: int) -> list[float]: ...
+def py_zlma(values: NDArray[np.float64], period: int) -> NDArray[np.float64]: ...
+def py_zlma_legacy(values: list[float], period: int) -> list[float]: ...
 
 # Pattern Recognition
 
@@ -414,7 +436,7 @@ def py_gap_sidesidewhite(open: list[float], high: list[float], low: list[float],
 def py_gravestone_doji(open: list[float], high: list[float], low: list[float], close: list[float], body_threshold: float = 0.1) -> list[float]: ...
 def py_hanging_man(open: list[float], high: list[float], low: list[float], close: list[float]) -> list[float]: ...
 def py_harami_cross(open: list[float], high: list[float], low: list[float], close: list[float], body_threshold: float = 0.1) -> list[float]: ...
-def py_harmonics(high: list[float], low: list[float], close: list[float], left_bars: int | None, right_bars: int | None, min_probability: float | None) -> tuple[list[float], list[float], list[float], list[float]]: ...
+def py_harmonics(high: list[float], low: list[float], close: list[float], left_bars: int | None = None, right_bars: int | None = None, min_probability: float | None = None) -> tuple[list[float], list[float], list[float], list[float]]: ...
 def py_highwave(open: list[float], high: list[float], low: list[float], close: list[float], body_threshold: float = 0.15) -> list[float]: ...
 def py_hikkake(open: list[float], high: list[float], low: list[float], close: list[float]) -> list[float]: ...
 def py_hikkake_mod(open: list[float], high: list[float], low: list[float], close: list[float]) -> list[float]: ...
@@ -437,7 +459,7 @@ def py_shooting_star(open: list[float], high: list[float], low: list[float], clo
 def py_short_line(open: list[float], high: list[float], low: list[float], close: list[float], lookback: int = 10) -> list[float]: ...
 def py_spinning_top(open: list[float], high: list[float], low: list[float], close: list[float]) -> list[float]: ...
 def py_stick_sandwich(open: list[float], high: list[float], low: list[float], close: list[float], tolerance: float = 0.01) -> list[float]: ...
-def py_swing_points(high: list[float], low: list[float], left_bars: int | None, right_bars: int | None) -> list[tuple[int, float, bool]]: ...
+def py_swing_points(high: list[float], low: list[float], left_bars: int | None = None, right_bars: int | None = None) -> list[tuple[int, float, bool]]: ...
 def py_takuri(open: list[float], high: list[float], low: list[float], close: list[float]) -> list[float]: ...
 def py_three_black_crows(open: list[float], low: list[float], close: list[float]) -> list[float]: ...
 def py_three_inside(open: list[float], high: list[float], low: list[float], close: list[float]) -> list[float]: ...
@@ -448,16 +470,27 @@ def py_xside_gap_3_methods(open: list[float], high: list[float], low: list[float
 
 # Statistical Functions
 
-def py_beta(asset_returns: list[float], benchmark_returns: list[float], period: int) -> list[float]: ...
-def py_correl(values1: list[float], values2: list[float], period: int) -> list[float]: ...
-def py_correlation(x: list[float], y: list[float], period: int) -> list[float]: ...
-def py_covariance(x: list[float], y: list[float], period: int) -> list[float]: ...
-def py_linear_regression(y_values: list[float], period: int) -> tuple[list[float], list[float], list[float]]: ...
-def py_linearreg(values: list[float], period: int) -> list[float]: ...
-def py_linearreg_angle(values: list[float], period: int) -> list[float]: ...
-def py_tsf(values: list[float], period: int) -> list[float]: ...
-def py_var(values: list[float], period: int) -> list[float]: ...
-def py_zscore(values: list[float], period: int) -> list[float]: ...
+def py_beta(asset_returns: NDArray[np.float64], benchmark_returns: NDArray[np.float64], period: int) -> NDArray[np.float64]: ...
+def py_beta_legacy(asset_returns: list[float], benchmark_returns: list[float], period: int) -> list[float]: ...
+def py_correl(values1: NDArray[np.float64], values2: NDArray[np.float64], period: int) -> NDArray[np.float64]: ...
+def py_correl_legacy(values1: list[float], values2: list[float], period: int) -> list[float]: ...
+def py_correlation(x: NDArray[np.float64], y: NDArray[np.float64], period: int) -> NDArray[np.float64]: ...
+def py_correlation_legacy(x: list[float], y: list[float], period: int) -> list[float]: ...
+def py_covariance(x: NDArray[np.float64], y: NDArray[np.float64], period: int) -> NDArray[np.float64]: ...
+def py_covariance_legacy(x: list[float], y: list[float], period: int) -> list[float]: ...
+def py_linear_regression(y_values: NDArray[np.float64], period: int) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]: ...
+def py_linear_regression_batch(data: NDArray[np.float64], period: int) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]: ...
+def py_linear_regression_legacy(y_values: list[float], period: int) -> tuple[list[float], list[float], list[float]]: ...
+def py_linearreg(values: NDArray[np.float64], period: int) -> NDArray[np.float64]: ...
+def py_linearreg_angle(values: NDArray[np.float64], period: int) -> NDArray[np.float64]: ...
+def py_linearreg_angle_legacy(values: list[float], period: int) -> list[float]: ...
+def py_linearreg_legacy(values: list[float], period: int) -> list[float]: ...
+def py_tsf(values: NDArray[np.float64], period: int) -> NDArray[np.float64]: ...
+def py_tsf_legacy(values: list[float], period: int) -> list[float]: ...
+def py_var(values: NDArray[np.float64], period: int) -> NDArray[np.float64]: ...
+def py_var_legacy(values: list[float], period: int) -> list[float]: ...
+def py_zscore(values: NDArray[np.float64], period: int) -> NDArray[np.float64]: ...
+def py_zscore_legacy(values: list[float], period: int) -> list[float]: ...
 
 # Price Transforms
 
@@ -469,32 +502,51 @@ def py_wclprice(high: list[float], low: list[float], close: list[float]) -> list
 
 # Math Operators
 
-def py_abs(values: list[float]) -> list[float]: ...
-def py_acos(values: list[float]) -> list[float]: ...
-def py_asin(values: list[float]) -> list[float]: ...
-def py_atan(values: list[float]) -> list[float]: ...
-def py_ceil(values: list[float]) -> list[float]: ...
-def py_cos(values: list[float]) -> list[float]: ...
-def py_cosh(values: list[float]) -> list[float]: ...
+def py_abs(values: NDArray[np.float64]) -> NDArray[np.float64]: ...
+def py_abs_legacy(values: list[float]) -> list[float]: ...
+def py_acos(values: NDArray[np.float64]) -> NDArray[np.float64]: ...
+def py_acos_legacy(values: list[float]) -> list[float]: ...
+def py_asin(values: NDArray[np.float64]) -> NDArray[np.float64]: ...
+def py_asin_legacy(values: list[float]) -> list[float]: ...
+def py_atan(values: NDArray[np.float64]) -> NDArray[np.float64]: ...
+def py_atan_legacy(values: list[float]) -> list[float]: ...
+def py_ceil(values: NDArray[np.float64]) -> NDArray[np.float64]: ...
+def py_ceil_legacy(values: list[float]) -> list[float]: ...
+def py_cos(values: NDArray[np.float64]) -> NDArray[np.float64]: ...
+def py_cos_legacy(values: list[float]) -> list[float]: ...
+def py_cosh(values: NDArray[np.float64]) -> NDArray[np.float64]: ...
+def py_cosh_legacy(values: list[float]) -> list[float]: ...
 def py_div(values1: list[float], values2: list[float]) -> list[float]: ...
-def py_exp(values: list[float]) -> list[float]: ...
-def py_floor(values: list[float]) -> list[float]: ...
+def py_exp(values: NDArray[np.float64]) -> NDArray[np.float64]: ...
+def py_exp_legacy(values: list[float]) -> list[float]: ...
+def py_floor(values: NDArray[np.float64]) -> NDArray[np.float64]: ...
+def py_floor_legacy(values: list[float]) -> list[float]: ...
 def py_ht_sine(values: list[float]) -> tuple[list[float], list[float]]: ...
-def py_ln(values: list[float]) -> list[float]: ...
-def py_log10(values: list[float]) -> list[float]: ...
-def py_max(values: list[float], period: int) -> list[float]: ...
-def py_min(values: list[float], period: int) -> list[float]: ...
+def py_ln(values: NDArray[np.float64]) -> NDArray[np.float64]: ...
+def py_ln_legacy(values: list[float]) -> list[float]: ...
+def py_log10(values: NDArray[np.float64]) -> NDArray[np.float64]: ...
+def py_log10_legacy(values: list[float]) -> list[float]: ...
+def py_max(values: NDArray[np.float64], period: int) -> NDArray[np.float64]: ...
+def py_max_legacy(values: list[float], period: int) -> list[float]: ...
+def py_min(values: NDArray[np.float64], period: int) -> NDArray[np.float64]: ...
+def py_min_legacy(values: list[float], period: int) -> list[float]: ...
 def py_minmax(values: list[float], period: int) -> tuple[list[float], list[float]]: ...
 def py_minmaxindex(values: list[float], period: int) -> tuple[list[float], list[float]]: ...
 def py_mult(values1: list[float], values2: list[float]) -> list[float]: ...
-def py_sin(values: list[float]) -> list[float]: ...
-def py_sinh(values: list[float]) -> list[float]: ...
-def py_sqrt(values: list[float]) -> list[float]: ...
+def py_sin(values: NDArray[np.float64]) -> NDArray[np.float64]: ...
+def py_sin_legacy(values: list[float]) -> list[float]: ...
+def py_sinh(values: NDArray[np.float64]) -> NDArray[np.float64]: ...
+def py_sinh_legacy(values: list[float]) -> list[float]: ...
+def py_sqrt(values: NDArray[np.float64]) -> NDArray[np.float64]: ...
+def py_sqrt_legacy(values: list[float]) -> list[float]: ...
 def py_standard_pivots(high: float, low: float, close: float) -> tuple[float, float, float, float, float, float, float]: ...
 def py_sub(values1: list[float], values2: list[float]) -> list[float]: ...
-def py_sum(values: list[float], period: int) -> list[float]: ...
-def py_tan(values: list[float]) -> list[float]: ...
-def py_tanh(values: list[float]) -> list[float]: ...
+def py_sum(values: NDArray[np.float64], period: int) -> NDArray[np.float64]: ...
+def py_sum_legacy(values: list[float], period: int) -> list[float]: ...
+def py_tan(values: NDArray[np.float64]) -> NDArray[np.float64]: ...
+def py_tan_legacy(values: list[float]) -> list[float]: ...
+def py_tanh(values: NDArray[np.float64]) -> NDArray[np.float64]: ...
+def py_tanh_legacy(values: list[float]) -> list[float]: ...
 
 # Utility Functions
 
@@ -511,6 +563,7 @@ def py_fib_extension(start_price: float, end_price: float, retracement_price: fl
 def py_fib_fan_lines(start_index: int, end_index: int, start_price: float, end_price: float, target_index: int) -> tuple[float, float, float]: ...
 def py_fib_retracement(start_price: float, end_price: float) -> list[tuple[str, float]]: ...
 def py_fib_time_zones(start_index: int, max_zones: int) -> list[int]: ...
+def py_heikin_ashi_signals(open: list[float], high: list[float], low: list[float], close: list[float], lookback: int | None) -> float: ...
 def py_ichimoku_cloud(high: list[float], low: list[float], close: list[float], tenkan_period: int | None, kijun_period: int | None, senkou_b_period: int | None) -> tuple[list[float], list[float], list[float], list[float], list[float]]: ...
 def py_ichimoku_signals(close: list[float], tenkan_sen: list[float], kijun_sen: list[float], senkou_span_a: list[float], senkou_span_b: list[float], chikou_span: list[float]) -> list[int]: ...
 def py_ichimoku_tk_cross(tenkan_sen: list[float], kijun_sen: list[float], senkou_span_a: list[float], senkou_span_b: list[float], chikou_span: list[float]) -> list[float]: ...
@@ -531,6 +584,8 @@ def py_wae(close: list[float], fast: int | None, slow: int | None, signal: int |
 
 # Hilbert Transform
 
-def py_ht_dcphase(values: list[float]) -> list[float]: ...
+def py_ht_dcphase(values: NDArray[np.float64]) -> NDArray[np.float64]: ...
+def py_ht_dcphase_legacy(values: list[float]) -> list[float]: ...
 def py_ht_phasor(values: list[float]) -> tuple[list[float], list[float]]: ...
-def py_ht_trendmode(values: list[float]) -> list[float]: ...
+def py_ht_trendmode(values: NDArray[np.float64]) -> NDArray[np.float64]: ...
+def py_ht_trendmode_legacy(values: list[float]) -> list[float]: ...
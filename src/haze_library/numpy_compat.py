@@ -21,14 +21,22 @@ Usage:
 from __future__ import annotations
 
 from collections import deque
+from types import ModuleType
 from typing import Tuple
 
 import numpy as np
-# Import Rust extension
-try:
-    from . import haze_library as _lib
-except ImportError:
-    import haze_library as _lib
+
+
+def _resolve_lib() -> ModuleType:
+    """Import the Rust extension, falling back to the package namespace."""
+    try:
+        from . import haze_library as ext
+    except ImportError:
+        import haze_library as ext
+    return ext
+
+
+_lib = _resolve_lib()
 
 # Type alias for array-like inputs
 ArrayLike = np.ndarray | list
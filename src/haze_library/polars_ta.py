@@ -3,12 +3,20 @@ from __future__ import annotations
 from typing import Any, Iterable
 
 
+# Cached result of the optional import; None until first checked.
+_HAS_POLARS: bool | None = None
+
+
 def is_available() -> bool:
-    try:
-        import polars  # noqa: F401
-    except Exception:
-        return False
-    return True
+    global _HAS_POLARS
+    if _HAS_POLARS is None:
+        try:
+            import polars  # noqa: F401
+        except Exception:
+            _HAS_POLARS = False
+        else:
+            _HAS_POLARS = True
+    return _HAS_POLARS
 
 
 def get_available_functions() -> list[str]:
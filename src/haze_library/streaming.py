@@ -9,10 +9,13 @@ The underlying implementation uses Rust "Online*" calculators.
 """
 from __future__ import annotations
 
+import functools
 import math
 import threading
 from typing import Any, Iterable, Mapping
 
+import numpy as np
+
 # Import Rust streaming calculators directly from the extension module
 # These are registered in streaming_py.rs via PyO3
 # Use relative import to avoid circular dependency with __init__.py
@@ -54,11 +57,34 @@ __all__ = [
 ]
 
 _NAN = float("nan")
+# Direct alias (not a wrapper) so per-tick NaN checks cost one C call
+_is_nan = math.isnan
+
 
+def _ohlc_columns(
+    high: Iterable[float], low: Iterable[float], close: Iterable[float]
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Coerce high/low/close columns to equal-length float64 arrays."""
+    cols = tuple(np.asarray(col, dtype=np.float64) for col in (high, low, close))
+    if any(col.ndim != 1 for col in cols):
+        raise ValueError("high/low/close must be one-dimensional")
+    if not (cols[0].size == cols[1].size == cols[2].size):
+        raise ValueError("high/low/close must have the same length")
+    return cols
 
-def _is_nan(value: float) -> bool:
-    """Check if value is NaN."""
-    return math.isnan(value)
+
+def _batch_values(values: Iterable[float]) -> np.ndarray:
+    """Coerce a scalar batch to a float64 array, rejecting it before any update.
+
+    Validating up front keeps update_batch all-or-nothing: a non-finite value
+    must not leave the leading part of the batch applied to the indicator.
+    """
+    arr = np.asarray(values if isinstance(values, np.ndarray) else list(values), dtype=np.float64)
+    if arr.ndim != 1:
+        raise ValueError("values must be one-dimensional")
+    if not np.all(np.isfinite(arr)):
+        raise ValueError("values contains non-finite value")
+    return arr
 
 
 _ENSEMBLE_COMPONENTS = ("rsi", "macd", "stochastic", "supertrend")
@@ -81,6 +107,8 @@ class IncrementalSMA:
     Thin wrapper around Rust OnlineSMA for O(1) updates.
     """
 
+    __slots__ = ("period", "_inner", "_lock", "count", "_current")
+
     def __init__(self, period: int) -> None:
         if period <= 0:
             raise ValueError("period must be > 0")
@@ -116,8 +144,30 @@ class IncrementalSMA:
             self._current = result if result is not None else _NAN
             return self._current
 
-    def update_batch(self, values: Iterable[float]) -> list[float]:
-        return [self.update(v) for v in values]
+    def update_batch(self, values: Iterable[float]) -> np.ndarray:
+        """Feed a block of values under a single lock acquisition.
+
+        Every value goes through the same Rust ``update`` as per-tick calls,
+        so batch and streaming outputs are identical. Unlike repeated
+        ``update`` calls, a non-finite value rejects the whole batch without
+        touching state.
+        """
+        arr = _batch_values(values)
+        out = np.full(arr.size, _NAN)
+        with self._lock:
+            update = self._inner.update
+            done = 0
+            try:
+                for v in arr.tolist():
+                    result = update(v)
+                    if result is not None:
+                        out[done] = result
+                    done += 1
+            finally:
+                self.count += done
+                if done:
+                    self._current = float(out[done - 1])
+        return out
 
     def status(self) -> dict[str, Any]:
         return {"count": self.count, "is_ready": self.is_ready, "current": self.current}
@@ -129,6 +179,8 @@ class IncrementalEMA:
     Thin wrapper around Rust OnlineEMA for O(1) updates.
     """
 
+    __slots__ = ("period", "_inner", "_lock", "count", "_current")
+
     def __init__(self, period: int) -> None:
         if period <= 0:
             raise ValueError("period must be > 0")
@@ -160,6 +212,28 @@ class IncrementalEMA:
             self._current = result if result is not None else _NAN
             return self._current
 
+    def update_batch(self, values: Iterable[float]) -> np.ndarray:
+        """Feed a block of values under a single lock acquisition.
+
+        A non-finite value rejects the whole batch without touching state.
+        """
+        vals = _batch_values(values)
+        out = np.full(vals.size, _NAN)
+        with self._lock:
+            update = self._inner.update
+            done = 0
+            try:
+                for v in vals.tolist():
+                    result = update(v)
+                    if result is not None:
+                        out[done] = result
+                    done += 1
+            finally:
+                self.count += done
+                if done:
+                    self._current = float(out[done - 1])
+        return out
+
     def status(self) -> dict[str, Any]:
         return {"count": self.count, "is_ready": self.is_ready, "current": self.current}
 
@@ -170,6 +244,8 @@ class IncrementalRSI:
     Thin wrapper around Rust OnlineRSI for O(1) updates.
     """
 
+    __slots__ = ("period", "_inner", "_lock", "count", "_current", "_is_ready")
+
     def __init__(self, period: int = 14) -> None:
         if period <= 0:
             raise ValueError("period must be > 0")
@@ -208,6 +284,32 @@ class IncrementalRSI:
                 self._is_ready = False
             return self._current
 
+    def update_batch(self, values: Iterable[float]) -> np.ndarray:
+        """Feed a block of values under a single lock acquisition.
+
+        A non-finite value rejects the whole batch without touching state.
+        """
+        vals = _batch_values(values)
+        out = np.full(vals.size, _NAN)
+        with self._lock:
+            update = self._inner.update
+            done = 0
+            # Result of the last accepted tick; a rejected value leaves it untouched
+            result = None
+            try:
+                for v in vals.tolist():
+                    result = update(v)
+                    if result is not None:
+                        out[done] = result
+                    done += 1
+            finally:
+                self.count += done
+                if done:
+                    # Same rule as update(): ready iff the last tick produced a value
+                    self._is_ready = result is not None
+                    self._current = result if result is not None else _NAN
+        return out
+
     def status(self) -> dict[str, Any]:
         return {"count": self.count, "is_ready": self.is_ready, "current": self.current}
 
@@ -219,6 +321,8 @@ class IncrementalMACD:
     Returns (MACD line, Signal line, Histogram).
     """
 
+    __slots__ = ("fast", "slow", "signal", "_inner", "_lock", "count", "_current", "_is_ready")
+
     def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9) -> None:
         if fast <= 0 or slow <= 0 or signal <= 0:
             raise ValueError("fast/slow/signal must be > 0")
@@ -259,6 +363,37 @@ class IncrementalMACD:
                 self._is_ready = False
             return self._current
 
+    def update_batch(
+        self, values: Iterable[float]
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+        """Feed a block of values under a single lock acquisition.
+
+        Returns (line, signal, histogram, ready_index), where ready_index is
+        the first position with all three outputs finite, or -1 if none.
+        A non-finite value rejects the whole batch without touching state.
+        """
+        vals = _batch_values(values)
+        out = np.full((3, vals.size), _NAN)
+        ready_index = -1
+        with self._lock:
+            update = self._inner.update
+            done = 0
+            try:
+                for v in vals.tolist():
+                    result = update(v)
+                    if result is not None:
+                        out[:, done] = result
+                        if ready_index < 0:
+                            ready_index = done
+                    done += 1
+            finally:
+                self.count += done
+                if done:
+                    last = out[:, done - 1]
+                    self._is_ready = not np.isnan(last).any()
+                    self._current = tuple(last.tolist()) if self._is_ready else (_NAN, _NAN, _NAN)
+        return out[0], out[1], out[2], ready_index
+
     def status(self) -> dict[str, Any]:
         line, sig, hist = self._current
         return {
@@ -276,6 +411,8 @@ class IncrementalATR:
     Thin wrapper around Rust OnlineATR for O(1) updates.
     """
 
+    __slots__ = ("period", "_inner", "_lock", "count", "_atr")
+
     def __init__(self, period: int = 14) -> None:
         if period <= 0:
             raise ValueError("period must be > 0")
@@ -309,6 +446,27 @@ class IncrementalATR:
             self._atr = result if result is not None else _NAN
             return self._atr
 
+    def update_batch(
+        self, high: Iterable[float], low: Iterable[float], close: Iterable[float]
+    ) -> np.ndarray:
+        """Feed high/low/close columns in one call and return the ATR series."""
+        highs, lows, closes = _ohlc_columns(high, low, close)
+        out = np.full(highs.size, _NAN)
+        with self._lock:
+            update = self._inner.update
+            done = 0
+            try:
+                for h, lo, c in zip(highs.tolist(), lows.tolist(), closes.tolist()):
+                    result = update(h, lo, c)
+                    if result is not None:
+                        out[done] = result
+                    done += 1
+            finally:
+                self.count += done
+                if done:
+                    self._atr = float(out[done - 1])
+        return out
+
     def status(self) -> dict[str, Any]:
         return {"count": self.count, "is_ready": self.is_ready, "current": self.current}
 
@@ -320,6 +478,11 @@ class IncrementalSuperTrend:
     Returns (trend_value, direction) where direction is 1 (up) or -1 (down).
     """
 
+    __slots__ = (
+        "period", "multiplier", "_inner", "_lock", "count", "_trend", "_direction",
+        "current_direction",
+    )
+
     def __init__(self, period: int = 10, multiplier: float = 3.0) -> None:
         if period <= 0:
             raise ValueError("period must be > 0")
@@ -377,6 +540,8 @@ class IncrementalBollingerBands:
     Returns (upper_band, middle_band, lower_band).
     """
 
+    __slots__ = ("period", "std_dev", "_inner", "_lock", "count", "_current")
+
     def __init__(self, period: int = 20, std_dev: float = 2.0) -> None:
         if period <= 0:
             raise ValueError("period must be > 0")
@@ -426,6 +591,8 @@ class IncrementalStochastic:
     Returns (%K, %D).
     """
 
+    __slots__ = ("k_period", "smooth_k", "d_period", "_inner", "_lock", "count", "_current")
+
     def __init__(self, k_period: int = 14, smooth_k: int = 3, d_period: int = 3) -> None:
         if k_period <= 0 or smooth_k <= 0 or d_period <= 0:
             raise ValueError("k_period/smooth_k/d_period must be > 0")
@@ -460,6 +627,28 @@ class IncrementalStochastic:
                 self._current = (_NAN, _NAN)
             return self._current
 
+    def update_batch(
+        self, high: Iterable[float], low: Iterable[float], close: Iterable[float]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Feed high/low/close columns in one call and return (%K, %D) series."""
+        highs, lows, closes = _ohlc_columns(high, low, close)
+        k_out = np.full(highs.size, _NAN)
+        d_out = np.full(highs.size, _NAN)
+        with self._lock:
+            update = self._inner.update
+            done = 0
+            try:
+                for h, lo, c in zip(highs.tolist(), lows.tolist(), closes.tolist()):
+                    result = update(h, lo, c)
+                    if result is not None:
+                        k_out[done], d_out[done] = result
+                    done += 1
+            finally:
+                self.count += done
+                if done:
+                    self._current = (float(k_out[done - 1]), float(d_out[done - 1]))
+        return k_out, d_out
+
     def status(self) -> dict[str, Any]:
         k, d = self._current
         return {"count": self.count, "is_ready": self.is_ready, "k": k, "d": d}
@@ -473,6 +662,11 @@ class IncrementalAdaptiveRSI:
     Returns (rsi_value, effective_period).
     """
 
+    __slots__ = (
+        "base_period", "min_period", "max_period", "volatility_window", "_default_period",
+        "_inner", "_lock", "count", "_is_ready",
+    )
+
     def __init__(
         self,
         *,
@@ -536,6 +730,8 @@ class IncrementalEnsembleSignal:
     Returns (combined_signal, component_breakdown).
     """
 
+    __slots__ = ("_lock", "_inner", "weights", "_weight_vec", "_is_ready", "count")
+
     def __init__(self, *, weights: Mapping[str, float] | None = None) -> None:
         self._lock = threading.Lock()
         # Use default parameters - Rust implementation has sensible defaults
@@ -544,7 +740,11 @@ class IncrementalEnsembleSignal:
         for name, weight in self.weights.items():
             if not math.isfinite(weight):
                 raise ValueError(f"weights contains non-finite value for {name}: {weight}")
-        self._weight_map: dict[str, float] | None = None
+        # Normalized weights in _ENSEMBLE_COMPONENTS order, resolved once up front
+        self._weight_vec: tuple[float, ...] | None = None
+        if self.weights:
+            weight_map = _normalize_weights(self.weights, _ENSEMBLE_COMPONENTS)
+            self._weight_vec = tuple(weight_map[k] for k in _ENSEMBLE_COMPONENTS)
         self._is_ready = False
         self.count = 0
 
@@ -568,21 +768,17 @@ class IncrementalEnsembleSignal:
             if result is not None:
                 self._is_ready = True
                 # EnsembleSignalResult has: signal, rsi_contrib, macd_contrib, stoch_contrib, trend_contrib, confidence
-                components = {
-                    "rsi": result.rsi_contrib,
-                    "macd": result.macd_contrib,
-                    "stochastic": result.stoch_contrib,
-                    "supertrend": result.trend_contrib,
-                }
-
-                weight_map = self._weight_map
-                if weight_map is None and self.weights:
-                    weight_map = _normalize_weights(self.weights, _ENSEMBLE_COMPONENTS)
-                    self._weight_map = weight_map
+                rsi = float(result.rsi_contrib)
+                macd = float(result.macd_contrib)
+                stoch = float(result.stoch_contrib)
+                trend = float(result.trend_contrib)
+                components = {"rsi": rsi, "macd": macd, "stochastic": stoch, "supertrend": trend}
 
                 # Apply custom weights if provided
-                if weight_map is not None:
-                    signal = sum(float(weight_map.get(k, 0.0)) * float(v) for k, v in components.items())
+                weight_vec = self._weight_vec
+                if weight_vec is not None:
+                    w_rsi, w_macd, w_stoch, w_trend = weight_vec
+                    signal = w_rsi * rsi + w_macd * macd + w_stoch * stoch + w_trend * trend
                     signal = max(-1.0, min(1.0, signal))
                 else:
                     signal = result.signal
@@ -602,6 +798,11 @@ class IncrementalMLSuperTrend:
     Returns (trend_value, confirmed_direction, confidence).
     """
 
+    __slots__ = (
+        "period", "multiplier", "confirmation_bars", "use_atr_filter", "_inner", "_lock",
+        "count", "current_direction", "_is_ready",
+    )
+
     def __init__(
         self,
         *,
@@ -679,6 +880,11 @@ class IncrementalAISuperTrend:
     - take_profit: float - Suggested take-profit level
     """
 
+    __slots__ = (
+        "st_length", "st_multiplier", "lookback", "train_window", "_inner", "_lock",
+        "count", "current_direction", "_is_ready",
+    )
+
     def __init__(
         self,
         *,
@@ -768,6 +974,53 @@ class IncrementalAISuperTrend:
                 "take_profit": _NAN,
             }
 
+    def update_batch(
+        self, high: Iterable[float], low: Iterable[float], close: Iterable[float]
+    ) -> dict[str, np.ndarray]:
+        """Feed high/low/close columns in one call.
+
+        Returns the same keys as ``update``, each as an array over the bars;
+        bars before the model is ready hold NaN / 0 / False.
+        """
+        highs, lows, closes = _ohlc_columns(high, low, close)
+        n = highs.size
+        out = {
+            "supertrend": np.full(n, _NAN),
+            "direction": np.zeros(n, dtype=np.int64),
+            "trend_offset": np.full(n, _NAN),
+            "buy_signal": np.zeros(n, dtype=bool),
+            "sell_signal": np.zeros(n, dtype=bool),
+            "stop_loss": np.full(n, _NAN),
+            "take_profit": np.full(n, _NAN),
+        }
+        supertrend, direction, trend_offset = out["supertrend"], out["direction"], out["trend_offset"]
+        buy, sell = out["buy_signal"], out["sell_signal"]
+        stop_loss, take_profit = out["stop_loss"], out["take_profit"]
+        with self._lock:
+            update = self._inner.update
+            done = 0
+            last = None
+            try:
+                for h, lo, c in zip(highs.tolist(), lows.tolist(), closes.tolist()):
+                    result = update(h, lo, c)
+                    if result is not None:
+                        supertrend[done] = result.supertrend
+                        direction[done] = result.direction
+                        trend_offset[done] = result.trend_offset
+                        buy[done] = result.buy_signal
+                        sell[done] = result.sell_signal
+                        stop_loss[done] = result.stop_loss
+                        take_profit[done] = result.take_profit
+                    last = result
+                    done += 1
+            finally:
+                self.count += done
+                if done:
+                    self._is_ready = last is not None
+                    if last is not None:
+                        self.current_direction = last.direction
+        return out
+
     def status(self) -> dict[str, Any]:
         return {
             "count": self.count,
@@ -786,17 +1039,36 @@ class CCXTStreamProcessor:
     Add indicators by name, then process candles to update all at once.
     """
 
+    _HLC_TYPES = (
+        IncrementalATR,
+        IncrementalSuperTrend,
+        IncrementalStochastic,
+        IncrementalEnsembleSignal,
+        IncrementalMLSuperTrend,
+        IncrementalAISuperTrend,
+    )
+
     def __init__(self) -> None:
         self._lock = threading.Lock()
         self._indicators: dict[str, Any] = {}
+        # (name, bound update, takes high/low/close), rebuilt on add/remove
+        self._fast_path: list[tuple[str, Any, bool]] = []
+
+    def _rebuild_fast_path(self) -> None:
+        self._fast_path = [
+            (name, ind.update, isinstance(ind, self._HLC_TYPES))
+            for name, ind in self._indicators.items()
+        ]
 
     def add_indicator(self, name: str, indicator: Any) -> None:
         with self._lock:
             self._indicators[name] = indicator
+            self._rebuild_fast_path()
 
     def remove_indicator(self, name: str) -> None:
         with self._lock:
             self._indicators.pop(name, None)
+            self._rebuild_fast_path()
 
     def reset_all(self) -> None:
         with self._lock:
@@ -815,31 +1087,27 @@ class CCXTStreamProcessor:
             return status
 
     def process_candle(self, candle: Iterable[float]) -> dict[str, Any]:
-        data = list(candle)
-        if len(data) == 6:
-            _ts, open_, high, low, close, volume = data
-        elif len(data) == 5:
-            open_, high, low, close, volume = data
-        else:
+        data = candle if isinstance(candle, (list, tuple)) else list(candle)
+        if len(data) not in (5, 6):
             raise ValueError("candle must be length 5 or 6")
+        # [ts,] open, high, low, close, volume: HLC sit at fixed offsets from the end
+        high, low, close = data[-4], data[-3], data[-2]
 
-        results: dict[str, Any] = {}
         with self._lock:
-            for name, ind in self._indicators.items():
-                if isinstance(ind, (IncrementalATR, IncrementalSuperTrend, IncrementalStochastic,
-                                   IncrementalEnsembleSignal, IncrementalMLSuperTrend,
-                                   IncrementalAISuperTrend)):
-                    out = ind.update(high, low, close)
-                else:
-                    out = ind.update(close)
+            # A fresh dict per candle: callers may hold results across awaits/ticks
+            return {
+                name: update(high, low, close) if hlc else update(close)
+                for name, update, hlc in self._fast_path
+            }
 
-                results[name] = out
-        return results
 
+@functools.lru_cache(maxsize=1)
+def get_available_streaming_indicators() -> tuple[str, ...]:
+    """Return available streaming indicator class names.
 
-def get_available_streaming_indicators() -> list[str]:
-    """Return list of available streaming indicator class names."""
-    return [
+    The result is computed once and shared, hence an immutable tuple.
+    """
+    return (
         "IncrementalSMA",
         "IncrementalEMA",
         "IncrementalRSI",
@@ -852,7 +1120,28 @@ def get_available_streaming_indicators() -> list[str]:
         "IncrementalEnsembleSignal",
         "IncrementalMLSuperTrend",
         "IncrementalAISuperTrend",
-    ]
+    )
+
+
+# Lower-case name/alias -> indicator class, used by create_indicator
+_INDICATOR_ALIASES: dict[str, type] = {
+    "sma": IncrementalSMA,
+    "ema": IncrementalEMA,
+    "rsi": IncrementalRSI,
+    "macd": IncrementalMACD,
+    "atr": IncrementalATR,
+    "supertrend": IncrementalSuperTrend,
+    "stochastic": IncrementalStochastic,
+    "stoch": IncrementalStochastic,
+    "bb": IncrementalBollingerBands,
+    "bollinger": IncrementalBollingerBands,
+    "bollinger_bands": IncrementalBollingerBands,
+    "adaptive_rsi": IncrementalAdaptiveRSI,
+    "ensemble": IncrementalEnsembleSignal,
+    "ml_supertrend": IncrementalMLSuperTrend,
+    "ai_supertrend": IncrementalAISuperTrend,
+    "ai_supertrend_ml": IncrementalAISuperTrend,
+}
 
 
 def create_indicator(name: str, /, **kwargs: Any) -> Any:
@@ -877,25 +1166,7 @@ def create_indicator(name: str, /, **kwargs: Any) -> Any:
         If indicator name is unknown
     """
     key = name.strip().lower()
-    aliases: dict[str, Any] = {
-        "sma": IncrementalSMA,
-        "ema": IncrementalEMA,
-        "rsi": IncrementalRSI,
-        "macd": IncrementalMACD,
-        "atr": IncrementalATR,
-        "supertrend": IncrementalSuperTrend,
-        "stochastic": IncrementalStochastic,
-        "stoch": IncrementalStochastic,
-        "bb": IncrementalBollingerBands,
-        "bollinger": IncrementalBollingerBands,
-        "bollinger_bands": IncrementalBollingerBands,
-        "adaptive_rsi": IncrementalAdaptiveRSI,
-        "ensemble": IncrementalEnsembleSignal,
-        "ml_supertrend": IncrementalMLSuperTrend,
-        "ai_supertrend": IncrementalAISuperTrend,
-        "ai_supertrend_ml": IncrementalAISuperTrend,
-    }
-    cls = aliases.get(key)
+    cls = _INDICATOR_ALIASES.get(key)
     if cls is None:
         raise ValueError(f"Unknown indicator: {name}")
     return cls(**kwargs)
@@ -3,12 +3,20 @@ from __future__ import annotations
 from typing import Any, Sequence
 
 
+# Cached result of the optional import; None until first checked.
+_HAS_TORCH: bool | None = None
+
+
 def is_available() -> bool:
-    try:
-        import torch  # noqa: F401
-    except Exception:
-        return False
-    return True
+    global _HAS_TORCH
+    if _HAS_TORCH is None:
+        try:
+            import torch  # noqa: F401
+        except Exception:
+            _HAS_TORCH = False
+        else:
+            _HAS_TORCH = True
+    return _HAS_TORCH
 
 
 def get_available_functions() -> list[str]:
@@ -89,7 +89,7 @@ def main() -> int:
         },
         "py_correlation": {
             "params": {"period": 10},
-            "output": _to_jsonable(hz.py_correlation(close, volume, 10)),
+            "output": _to_jsonable(hz.py_correlation_legacy(close, volume, 10)),
         },
         "py_zscore": {"params": {"period": 10}, "output": _to_jsonable(hz.py_zscore(close, 10))},
     }
@@ -0,0 +1,20 @@
+"""
+Shared Output Assertions
+========================
+
+单元测试共用的指标输出检查。
+"""
+
+import numpy as np
+
+
+def assert_numeric(result) -> np.ndarray:
+    """
+    断言指标输出为一维数值数组（NaN 视为合法值）
+
+    一次性转换为 float64：转换成功即说明所有元素均为数值，
+    替代逐元素的 isinstance/np.isnan 检查。
+    """
+    arr = np.asarray(result, dtype=np.float64)
+    assert arr.ndim == 1, f"期望一维数组，实际维度为 {arr.ndim}"
+    return arr
@@ -0,0 +1,68 @@
+"""
+Statistical Reference Oracles
+=============================
+
+统计指标的向量化参考实现，供单元测试逐点比对 Rust 内核。
+
+约定（与 rust/src/utils/stats.rs 一致）：
+- 前 period-1 个位置为 NaN
+- x 取窗口内下标 0..period-1，截距对应窗口起点
+- 方差 / 标准差使用总体口径（除以 period）
+"""
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def _pad(values: np.ndarray, period: int, tail: np.ndarray) -> np.ndarray:
+    """在前 period-1 个位置补 NaN"""
+    result = np.full(values.shape, np.nan)
+    result[period - 1:] = tail
+    return result
+
+
+def rolling_linear_regression(values: np.ndarray, period: int):
+    """滚动最小二乘：返回 (slope, intercept, r_squared)"""
+    windows = sliding_window_view(values, period)
+    x = np.arange(period, dtype=np.float64)
+    x_dev = x - x.mean()
+    y_mean = windows.mean(axis=1)
+    y_dev = windows - y_mean[:, None]
+
+    sxx = x_dev @ x_dev
+    sxy = y_dev @ x_dev
+    ss_total = np.einsum("ij,ij->i", y_dev, y_dev)
+
+    slope = sxy / sxx
+    intercept = y_mean - slope * x.mean()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r_squared = np.where(ss_total > 0.0, sxy * sxy / (sxx * ss_total), 1.0)
+
+    return (
+        _pad(values, period, slope),
+        _pad(values, period, intercept),
+        _pad(values, period, np.clip(r_squared, 0.0, 1.0)),
+    )
+
+
+def rolling_correlation(x: np.ndarray, y: np.ndarray, period: int) -> np.ndarray:
+    """滚动 Pearson 相关系数"""
+    wx = sliding_window_view(x, period)
+    wy = sliding_window_view(y, period)
+    dx = wx - wx.mean(axis=1)[:, None]
+    dy = wy - wy.mean(axis=1)[:, None]
+    cov = np.einsum("ij,ij->i", dx, dy)
+    denom = np.sqrt(np.einsum("ij,ij->i", dx, dx) * np.einsum("ij,ij->i", dy, dy))
+    return _pad(x, period, np.clip(cov / denom, -1.0, 1.0))
+
+
+def rolling_var(values: np.ndarray, period: int) -> np.ndarray:
+    """滚动总体方差"""
+    return _pad(values, period, sliding_window_view(values, period).var(axis=1))
+
+
+def rolling_zscore(values: np.ndarray, period: int) -> np.ndarray:
+    """滚动 Z-Score（总体标准差）"""
+    windows = sliding_window_view(values, period)
+    tail = (values[period - 1:] - windows.mean(axis=1)) / windows.std(axis=1)
+    return _pad(values, period, tail)
@@ -15,13 +15,23 @@ Date: 2025-12-25
 
 import pytest
 import numpy as np
-from typing import Dict, List
+from typing import Dict, List, Tuple
+
+
+def pytest_configure(config):
+    """注册自定义 markers"""
+    config.addinivalue_line(
+        "markers", "slow: marks tests as slow (deselect with '-m \"not slow\"')"
+    )
+    config.addinivalue_line(
+        "markers", "compat: list-return contract tests for *_legacy bindings (opt-in)"
+    )
 
 
 # ==================== 基础价格数据 ====================
 
-@pytest.fixture
-def simple_prices() -> List[float]:
+@pytest.fixture(scope="session")
+def simple_prices() -> Tuple[float, ...]:
     """
     简单价格序列（10 个数据点，手动验证）
 
@@ -29,10 +39,45 @@ def simple_prices() -> List[float]:
     - 整数和半整数，易于手算
     - 包含上涨（10→11）和下跌（12→11.5）
     - 适用于 MA、RSI、ROC 等单序列指标
+    - 会话级共享，返回不可变 tuple；需要修改时请自行 list() 拷贝
+
+    返回：(10.0, 11.0, 12.0, 11.5, 13.0, 12.5, 14.0, 13.5, 15.0, 14.5)
+    """
+    return (10.0, 11.0, 12.0, 11.5, 13.0, 12.5, 14.0, 13.5, 15.0, 14.5)
+
+
+@pytest.fixture(scope="session")
+def n(simple_prices: Tuple[float, ...]) -> int:
+    """simple_prices 的长度，供输出形状断言复用"""
+    return len(simple_prices)
+
 
-    返回：[10.0, 11.0, 12.0, 11.5, 13.0, 12.5, 14.0, 13.5, 15.0, 14.5]
+@pytest.fixture(scope="session")
+def simple_prices_np(simple_prices: Tuple[float, ...]) -> np.ndarray:
+    """与 simple_prices 数值相同的只读 float64 数组，可直接广播缩放
+
+    需要修改时请使用 simple_prices_np.copy()。
     """
-    return [10.0, 11.0, 12.0, 11.5, 13.0, 12.5, 14.0, 13.5, 15.0, 14.5]
+    prices = np.asarray(simple_prices, dtype=np.float64)
+    prices.setflags(write=False)
+    return prices
+
+
+@pytest.fixture(scope="session")
+def scaled_prices(simple_prices_np: np.ndarray) -> Dict[float, np.ndarray]:
+    """simple_prices_np 的缩放副本（k → 只读数组），用于相关性/Beta 等双序列测试"""
+    scaled = {k: simple_prices_np * k for k in (0.9, 1.1)}
+    for values in scaled.values():
+        values.setflags(write=False)
+    return scaled
+
+
+@pytest.fixture(scope="session")
+def normal_100() -> np.ndarray:
+    """标准正态分布样本（100 个数据点，default_rng(42)，只读）"""
+    values = np.random.default_rng(42).standard_normal(100)
+    values.setflags(write=False)
+    return values
 
 
 @pytest.fixture
@@ -51,6 +96,61 @@ def simple_prices_short() -> List[float]:
 
 # ==================== OHLCV 数据 ====================
 
+def _random_walk_ohlcv(n: int, rng) -> Dict[str, np.ndarray]:
+    """
+    生成随机游走 OHLCV 数组
+
+    rng 可以是 ``np.random`` 模块（沿用全局种子）或 ``np.random.RandomState``，
+    两者在相同种子下产生相同序列。
+    """
+    # 生成随机游走价格
+    returns = rng.normal(0.0005, 0.015, n)
+    close = 100.0 * np.exp(np.cumsum(returns))
+
+    # 生成 OHLC
+    high = close * (1 + np.abs(rng.normal(0, 0.008, n)))
+    low = close * (1 - np.abs(rng.normal(0, 0.008, n)))
+    open_ = np.roll(close, 1)
+    open_[0] = close[0]
+
+    # 生成成交量
+    volume = rng.lognormal(8, 0.5, n)
+
+    return {'open': open_, 'high': high, 'low': low, 'close': close, 'volume': volume}
+
+
+def _linear_ohlcv(n: int) -> Dict[str, np.ndarray]:
+    """线性上涨 OHLCV 数组（close 从 100 到 120，high/low 为 ±1）"""
+    close = np.linspace(100.0, 120.0, n)
+    return {
+        'close': close,
+        'high': close + 1.0,
+        'low': close - 1.0,
+        'open': close + 0.5,
+        'volume': np.linspace(1000.0, 1200.0, n),
+    }
+
+
+def _stack_hlc(data: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """high/low/close 放入同一块 (3, n) C 连续内存，各列为其行视图"""
+    block = np.stack([data['high'], data['low'], data['close']])
+    data['high'], data['low'], data['close'] = block
+    return data
+
+
+def _readonly(data: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    统一为 float64、C 连续后冻结，防止会话级共享数据被测试意外修改
+
+    已满足条件的数组（包括 _stack_hlc 的行视图）不会被复制。
+    """
+    for key, values in data.items():
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        values.setflags(write=False)
+        data[key] = values
+    return data
+
+
 @pytest.fixture
 def ohlcv_data() -> Dict[str, List[float]]:
     """
@@ -85,28 +185,8 @@ def ohlcv_data_extended() -> Dict[str, List[float]]:
     - Bollinger Bands（需要 20+ 个数据点）
     """
     np.random.seed(42)
-    n = 20
-
-    # 生成随机游走价格
-    returns = np.random.normal(0.0005, 0.015, n)
-    close = 100.0 * np.exp(np.cumsum(returns))
-
-    # 生成 OHLC
-    high = close * (1 + np.abs(np.random.normal(0, 0.008, n)))
-    low = close * (1 - np.abs(np.random.normal(0, 0.008, n)))
-    open_ = np.roll(close, 1)
-    open_[0] = close[0]
-
-    # 生成成交量
-    volume = np.random.lognormal(8, 0.5, n)
-
-    return {
-        'open': open_.tolist(),
-        'high': high.tolist(),
-        'low': low.tolist(),
-        'close': close.tolist(),
-        'volume': volume.tolist()
-    }
+    data = _random_walk_ohlcv(20, np.random)
+    return {key: values.tolist() for key, values in data.items()}
 
 
 @pytest.fixture
@@ -119,28 +199,29 @@ def ohlcv_data_large() -> Dict[str, List[float]]:
     - 长周期均线组合
     """
     np.random.seed(42)
-    n = 50
+    data = _random_walk_ohlcv(50, np.random)
+    return {key: values.tolist() for key, values in data.items()}
 
-    # 生成随机游走价格
-    returns = np.random.normal(0.0005, 0.015, n)
-    close = 100.0 * np.exp(np.cumsum(returns))
 
-    # 生成 OHLC
-    high = close * (1 + np.abs(np.random.normal(0, 0.008, n)))
-    low = close * (1 - np.abs(np.random.normal(0, 0.008, n)))
-    open_ = np.roll(close, 1)
-    open_[0] = close[0]
+# ==================== 会话级 NumPy OHLCV 数组 ====================
+# float64、C 连续、只读；整个测试会话只构建一次
 
-    # 生成成交量
-    volume = np.random.lognormal(8, 0.5, n)
+@pytest.fixture(scope="session")
+def ohlcv_np_extended() -> Dict[str, np.ndarray]:
+    """与 ohlcv_data_extended 数值相同的 float64 数组（20 个数据点）"""
+    return _readonly(_stack_hlc(_random_walk_ohlcv(20, np.random.RandomState(42))))
 
-    return {
-        'open': open_.tolist(),
-        'high': high.tolist(),
-        'low': low.tolist(),
-        'close': close.tolist(),
-        'volume': volume.tolist()
-    }
+
+@pytest.fixture(scope="session")
+def n_extended(ohlcv_np_extended: Dict[str, np.ndarray]) -> int:
+    """ohlcv_np_extended 的长度，供输出形状断言复用"""
+    return len(ohlcv_np_extended['close'])
+
+
+@pytest.fixture(scope="session")
+def ohlcv_np_small() -> Dict[str, np.ndarray]:
+    """线性 OHLCV 数组（50 个数据点）"""
+    return _readonly(_linear_ohlcv(50))
 
 
 # ==================== 已知结果（手动计算）====================
@@ -23,6 +23,11 @@ import numpy as np
 import haze_library as haze
 
 
+def _f64(values) -> np.ndarray:
+    """py_linear_regression 只接受 float64 ndarray（list 请用 *_legacy）"""
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
 class TestLinearRegression:
     """线性回归测试
 
@@ -31,7 +36,7 @@ class TestLinearRegression:
 
     def test_basic_calculation(self, simple_prices):
         """测试基本线性回归"""
-        result = haze.py_linear_regression(simple_prices, 5)
+        result = haze.py_linear_regression(_f64(simple_prices), 5)
 
         # 返回 (slope, intercept, r_squared) 三元组
         assert isinstance(result, tuple)
@@ -47,7 +52,7 @@ class TestLinearRegression:
         # y = 100 + 2x
         prices = [100.0 + 2 * i for i in range(20)]
 
-        slope, intercept, r_squared = haze.py_linear_regression(prices, 5)
+        slope, intercept, r_squared = haze.py_linear_regression(_f64(prices), 5)
 
         # 完美线性，斜率应接近2，R²应接近1
         valid_slope = [v for v in slope if not np.isnan(v)]
@@ -66,7 +71,7 @@ class TestLinearRegression:
         noise = np.random.randn(n) * 5
         prices = (trend + noise).tolist()
 
-        slope, intercept, r_squared = haze.py_linear_regression(prices, 10)
+        slope, intercept, r_squared = haze.py_linear_regression(_f64(prices), 10)
 
         assert len(slope) == n
         assert len(intercept) == n
@@ -77,12 +82,16 @@ class TestLinearRegression:
         prices = [100.0 + i * 0.5 for i in range(30)]
 
         for period in [3, 5, 10, 14, 20]:
-            slope, intercept, r_squared = haze.py_linear_regression(prices, period)
+            slope, intercept, r_squared = haze.py_linear_regression(
+                _f64(prices), period
+            )
             assert len(slope) == len(prices)
 
     def test_constant_prices(self, constant_values):
         """测试常数价格"""
-        slope, intercept, r_squared = haze.py_linear_regression(constant_values, 5)
+        slope, intercept, r_squared = haze.py_linear_regression(
+            _f64(constant_values), 5
+        )
 
         # 常数数据，斜率应为0
         valid_slope = [v for v in slope if not np.isnan(v)]
@@ -92,14 +101,14 @@ class TestLinearRegression:
     def test_empty_input(self):
         """测试空输入"""
         with pytest.raises(Exception):
-            haze.py_linear_regression([], 5)
+            haze.py_linear_regression(_f64([]), 5)
 
     def test_period_larger_than_data(self):
         """测试周期大于数据长度"""
         prices = [100.0, 101.0, 102.0]
         # 周期大于数据长度应该抛出异常
         with pytest.raises(Exception):
-            haze.py_linear_regression(prices, 10)
+            haze.py_linear_regression(_f64(prices), 10)
 
 
 class TestZScore:
@@ -410,7 +419,7 @@ class TestAdvancedEdgeCases:
         n = 10000
         prices = [100.0 + i * 0.01 for i in range(n)]
 
-        slope, intercept, r_squared = haze.py_linear_regression(prices, 20)
+        slope, intercept, r_squared = haze.py_linear_regression(_f64(prices), 20)
         assert len(slope) == n
 
     def test_period_equals_one(self):
@@ -418,7 +427,7 @@ class TestAdvancedEdgeCases:
         prices = [100.0, 101.0, 102.0, 103.0, 104.0]
 
         try:
-            slope, intercept, r_squared = haze.py_linear_regression(prices, 1)
+            slope, intercept, r_squared = haze.py_linear_regression(_f64(prices), 1)
             assert len(slope) == len(prices)
         except Exception:
             pass  # 周期1可能不被支持
@@ -428,4 +437,4 @@ class TestAdvancedEdgeCases:
         prices = [100.0, 101.0, 102.0, 103.0, 104.0]
 
         with pytest.raises(Exception):
-            haze.py_linear_regression(prices, -5)
+            haze.py_linear_regression(_f64(prices), -5)
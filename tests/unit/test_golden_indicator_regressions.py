@@ -88,7 +88,11 @@ def _call_indicator(
     if name == "py_vwap":
         return haze.py_vwap(high, low, close, volume, int(params["period"]))
     if name == "py_correlation":
-        return haze.py_correlation(close, volume, int(params["period"]))
+        return haze.py_correlation(
+            np.asarray(close, dtype=np.float64),
+            np.asarray(volume, dtype=np.float64),
+            int(params["period"]),
+        )
     if name == "py_zscore":
         return haze.py_zscore(close, int(params["period"]))
 
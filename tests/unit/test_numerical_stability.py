@@ -17,11 +17,35 @@ Author: Haze Team
 Date: 2025-12-26
 """
 
+import functools
+import math
+import os
+
 import numpy as np
+import pandas as pd
 import pytest
 import haze_library as haze
 
 
+# Only a handful of (n, step) pairs are used; bound the cache so large series are evicted
+@functools.lru_cache(maxsize=4)
+def _sine_series(n, step):
+    """Read-only ``100 + sin(i * step)`` series shared by the large-input tests."""
+    data = 100.0 + np.sin(np.arange(n, dtype=np.float64) * step)
+    data.setflags(write=False)
+    return data
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_indicator(name, n, step, period):
+    """Read-only indicator result on ``_sine_series(n, step)``, shared across tests."""
+    result = np.asarray(
+        getattr(haze, name)(_sine_series(n, step), period=period), dtype=np.float64
+    )
+    result.setflags(write=False)
+    return result
+
+
 class TestNumericalStability:
     """Test numerical stability of indicators under extreme conditions."""
 
@@ -102,11 +126,10 @@ class TestNumericalStability:
         - RSI should be near 50 (balanced state)
         - RSI in range [45, 55]
         """
-        # Construct nearly symmetric price fluctuations
-        data = [100.0]
-        for i in range(1000):
-            # Alternate up/down by same magnitude
-            data.append(data[-1] * (1.001 if i % 2 == 0 else 0.999))
+        # Construct nearly symmetric price fluctuations:
+        # data[i + 1] = data[i] * (1.001 if i is even else 0.999)
+        multipliers = np.where(np.arange(1000) % 2 == 0, 1.001, 0.999)
+        data = np.concatenate(([100.0], 100.0 * np.cumprod(multipliers)))
 
         result = haze.rsi(data, period=14)
 
@@ -119,46 +142,39 @@ class TestNumericalStability:
                 f"RSI should be near 50 for balanced gains/losses, got {r:.2f}"
             )
 
-    def test_long_sequence_precision(self):
+    @pytest.mark.parametrize(
+        "n", [10_000, pytest.param(100_000, marks=pytest.mark.slow)]
+    )
+    def test_long_sequence_precision(self, n):
         """
         Test cumulative errors in long sequences.
 
         Scenario:
-        - 100,000 data points
+        - 10,000 data points (100,000 in the slow tier)
         - Sinusoidal pattern
         - Challenge: Accumulation of rounding errors
 
         Expected:
         - Final value should be finite (not NaN or Inf)
-        - Match NumPy reference implementation within 1e-6
+        - Match pandas ewm(adjust=False) reference within 1e-6
         """
-        # 100k data points long sequence
-        data = [100.0 + np.sin(i * 0.01) for i in range(100000)]
+        data = _sine_series(n, 0.01)
 
-        result = haze.ema(data, period=20)
+        result = _cached_indicator("ema", n, 0.01, 20)
 
         # Final value should be finite (not NaN or Inf)
         assert np.isfinite(result[-1]), (
             f"Final EMA value is not finite: {result[-1]}"
         )
 
-        # Compare with NumPy implementation (allow small error)
-        numpy_ema = self._numpy_ema(data, 20)
-        error = abs(result[-1] - numpy_ema[-1])
+        # Compare with pandas reference (same IIR recurrence, Cython loop)
+        alpha = 2.0 / (20 + 1)
+        expected_last = pd.Series(data).ewm(alpha=alpha, adjust=False).mean().iloc[-1]
+        error = abs(result[-1] - expected_last)
         assert error < 1e-6, (
-            f"EMA differs from NumPy reference: {error:.2e}"
+            f"EMA differs from pandas reference: {error:.2e}"
         )
 
-    @staticmethod
-    def _numpy_ema(data, period):
-        """NumPy EMA implementation for comparison."""
-        alpha = 2.0 / (period + 1)
-        result = np.zeros(len(data))
-        result[0] = data[0]
-        for i in range(1, len(data)):
-            result[i] = alpha * data[i] + (1 - alpha) * result[i - 1]
-        return result
-
     def test_nan_propagation(self):
         """
         Test NaN handling in indicators.
@@ -352,40 +368,30 @@ class TestNumericalStability:
 class TestKahanSummation:
     """Test Kahan summation algorithm for improved numerical stability."""
 
-    def test_kahan_vs_naive_summation(self):
+    @pytest.mark.benchmark(group="summation")
+    @pytest.mark.skipif(not os.environ.get("RUN_BENCH"), reason="benchmark only")
+    def test_kahan_vs_naive_summation(self, benchmark):
         """
-        Compare Kahan summation with naive summation.
+        Compare compensated summation with naive summation.
 
         Scenario:
         - Sum many small numbers with large base
         - Challenge: Precision loss in naive summation
 
         Expected:
-        - Kahan summation should be more accurate
+        - Compensated summation (math.fsum) should be at least as accurate
         """
-        # Create scenario where naive summation loses precision
-        base = 1e10
-        n = 10000
-        small_value = 1.0
-
-        # Naive summation
-        naive_sum = base
-        for _ in range(n):
-            naive_sum += small_value
-
-        # Expected result
+        n, base, small_value = 10_000, 1e10, 0.1
+        values = np.full(n + 1, small_value)
+        values[0] = base
         expected = base + n * small_value
 
-        # Kahan summation (if implemented in Haze)
-        # This test documents the expected behavior
-        # Actual implementation depends on Rust backend
-
-        # Check if naive summation has error
-        abs(naive_sum - expected)
+        # Naive left-to-right accumulation (np.cumsum is strictly sequential)
+        naive_sum = benchmark(lambda: np.cumsum(values)[-1])
+        # Shewchuk summation, equivalent to Kahan for this purpose
+        compensated_sum = math.fsum(values)
 
-        # Document the precision issue
-        # In production, Kahan summation should reduce this error
-        # This test serves as documentation and benchmark
+        assert abs(compensated_sum - expected) <= abs(naive_sum - expected)
 
 
 class TestEdgeCaseParameters:
@@ -433,27 +439,26 @@ class TestEdgeCaseParameters:
 class TestMemoryEfficiency:
     """Test memory efficiency with large datasets."""
 
-    def test_large_dataset_no_overflow(self):
+    @pytest.mark.parametrize(
+        "n", [10_000, pytest.param(1_000_000, marks=pytest.mark.slow)]
+    )
+    def test_large_dataset_no_overflow(self, n):
         """Test that large datasets don't cause memory overflow."""
-        # 1 million data points
-        n = 1_000_000
-        data = [100.0 + np.sin(i * 0.001) for i in range(n)]
-
         # Should complete without memory error
-        result = haze.sma(data, period=100)
+        result = _cached_indicator("sma", n, 0.001, 100)
 
         assert len(result) == n, "Output length should match input length"
         assert np.isfinite(result[-1]), "Final result should be finite"
 
-    def test_multiple_indicators_sequentially(self):
+    @pytest.mark.parametrize(
+        "n", [10_000, pytest.param(100_000, marks=pytest.mark.slow)]
+    )
+    def test_multiple_indicators_sequentially(self, n):
         """Test running multiple indicators on large dataset sequentially."""
-        n = 100_000
-        data = [100.0 + np.sin(i * 0.01) for i in range(n)]
-
         # Run multiple indicators
-        sma = haze.sma(data, period=20)
-        ema = haze.ema(data, period=20)
-        rsi = haze.rsi(data, period=14)
+        sma = _cached_indicator("sma", n, 0.01, 20)
+        ema = _cached_indicator("ema", n, 0.01, 20)
+        rsi = _cached_indicator("rsi", n, 0.01, 14)
 
         # All should complete successfully
         for result, name in [(sma, 'SMA'), (ema, 'EMA'), (rsi, 'RSI')]:
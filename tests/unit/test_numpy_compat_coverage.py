@@ -7,8 +7,23 @@ import pytest
 
 from haze_library import numpy_compat as nc
 
-
-def _arrays(n: int = 300) -> dict[str, np.ndarray]:
+# (function, required parameter names) for every public numpy_compat function,
+# resolved once at import instead of per call.
+_DISPATCH = [
+    (
+        obj,
+        tuple(
+            param.name
+            for param in inspect.signature(obj).parameters.values()
+            if param.default is inspect.Parameter.empty
+        ),
+    )
+    for name, obj in nc.__dict__.items()
+    if not name.startswith("_") and inspect.isfunction(obj)
+]
+
+
+def _build_arrays(n: int = 300) -> dict[str, np.ndarray]:
     close = np.linspace(100.0, 120.0, n, dtype=np.float32)
     high = close + 1.0
     low = close - 1.0
@@ -54,6 +69,11 @@ def _arrays(n: int = 300) -> dict[str, np.ndarray]:
     }
 
 
+@pytest.fixture(scope="module")
+def arrays() -> dict[str, np.ndarray]:
+    return _build_arrays(300)
+
+
 def test_numpy_compat_helpers() -> None:
     arr32 = np.array([1.0, 2.0], dtype=np.float32)
     arr64 = np.array([1.0, 2.0], dtype=np.float64)
@@ -75,22 +95,9 @@ def test_numpy_compat_helpers() -> None:
     assert result.dtype == np.float64
 
 
-def test_numpy_compat_call_all_functions() -> None:
-    arrays = _arrays()
-
-    for name, obj in nc.__dict__.items():
-        if name.startswith("_"):
-            continue
-        if not inspect.isfunction(obj):
-            continue
-
-        sig = inspect.signature(obj)
-        kwargs = {}
-        for param in sig.parameters.values():
-            if param.default is inspect._empty:
-                kwargs[param.name] = arrays[param.name]
-
-        result = obj(**kwargs)
+def test_numpy_compat_call_all_functions(arrays) -> None:
+    for obj, names in _DISPATCH:
+        result = obj(*(arrays[name] for name in names))
         if isinstance(result, tuple):
             assert len(result) > 0
         else:
@@ -120,20 +127,10 @@ def test_numpy_compat_edge_branches(monkeypatch) -> None:
 
 def test_numpy_compat_import_fallback(monkeypatch) -> None:
     """Test import fallback when haze_library is not available."""
-    import importlib
     import sys
     import haze_library as hl
 
-    original_ext = sys.modules.get("haze_library.haze_library")
-    sys.modules["haze_library.haze_library"] = None
+    monkeypatch.setitem(sys.modules, "haze_library.haze_library", None)
     monkeypatch.delattr(hl, "haze_library", raising=False)
 
-    importlib.reload(nc)
-    assert nc._lib is hl
-
-    if original_ext is not None:
-        sys.modules["haze_library.haze_library"] = original_ext
-        hl.haze_library = original_ext
-    else:
-        sys.modules.pop("haze_library.haze_library", None)
-    importlib.reload(nc)
+    assert nc._resolve_lib() is hl
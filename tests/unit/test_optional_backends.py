@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import builtins
+import sys
 import types
 
 import numpy as np
@@ -8,22 +8,26 @@ import numpy as np
 from haze_library import polars_ta, torch_ta
 
 
+def _as_list(values) -> list:
+    return values.tolist() if hasattr(values, "tolist") else list(values)
+
+
 class FakeSeries:
     def __init__(self, name: str, values):
         self.name = name
-        self.values = list(values)
+        self.values = values
 
 
 class FakeColumn:
     def __init__(self, values):
-        self._values = list(values)
+        self._values = values
 
     def to_list(self):
-        return list(self._values)
+        return _as_list(self._values)
 
 
 class FakeDataFrame:
-    def __init__(self, data: dict[str, list[float]]):
+    def __init__(self, data: dict[str, np.ndarray]):
         self._data = data
 
     def __getitem__(self, key: str) -> FakeColumn:
@@ -35,7 +39,7 @@ class FakeDataFrame:
 
 class FakeTensor:
     def __init__(self, values):
-        self._values = list(values)
+        self._values = values
         self.device = "cpu"
 
     def detach(self):
@@ -47,31 +51,20 @@ class FakeTensor:
         return self
 
     def tolist(self):
-        return list(self._values)
-
+        return _as_list(self._values)
 
-def test_polars_backend(monkeypatch) -> None:
-    original_import = builtins.__import__
 
-    def blocked_import(name, globals=None, locals=None, fromlist=(), level=0):
-        if name == "polars":
-            raise ImportError("blocked")
-        return original_import(name, globals, locals, fromlist, level)
-
-    monkeypatch.setattr(builtins, "__import__", blocked_import)
+def test_polars_backend(monkeypatch, ohlcv_np_small) -> None:
+    # A None entry in sys.modules makes `import polars` raise ImportError
+    monkeypatch.setitem(sys.modules, "polars", None)
+    monkeypatch.setattr(polars_ta, "_HAS_POLARS", None)
     assert polars_ta.is_available() is False
 
     fake_polars = types.SimpleNamespace(Series=FakeSeries)
-    monkeypatch.setitem(__import__("sys").modules, "polars", fake_polars)
-    monkeypatch.setattr(builtins, "__import__", original_import)
+    monkeypatch.setitem(sys.modules, "polars", fake_polars)
+    monkeypatch.setattr(polars_ta, "_HAS_POLARS", None)
 
-    data = {
-        "close": list(np.linspace(100, 120, 50)),
-        "high": list(np.linspace(101, 121, 50)),
-        "low": list(np.linspace(99, 119, 50)),
-        "volume": list(np.linspace(1000, 1200, 50)),
-    }
-    df = FakeDataFrame(data)
+    df = FakeDataFrame(ohlcv_np_small)
 
     assert polars_ta.is_available() is True
     assert "sma" in polars_ta.get_available_functions()
@@ -90,28 +83,22 @@ def test_polars_backend(monkeypatch) -> None:
     _ = polars_ta.vwap(df)
 
 
-def test_torch_backend(monkeypatch) -> None:
-    original_import = builtins.__import__
-
-    def blocked_import(name, globals=None, locals=None, fromlist=(), level=0):
-        if name == "torch":
-            raise ImportError("blocked")
-        return original_import(name, globals, locals, fromlist, level)
-
-    monkeypatch.setattr(builtins, "__import__", blocked_import)
+def test_torch_backend(monkeypatch, ohlcv_np_small) -> None:
+    monkeypatch.setitem(sys.modules, "torch", None)
+    monkeypatch.setattr(torch_ta, "_HAS_TORCH", None)
     assert torch_ta.is_available() is False
 
     fake_torch = types.SimpleNamespace(
         tensor=lambda values, device=None, dtype=None: FakeTensor(values),
         float64=object(),
     )
-    monkeypatch.setitem(__import__("sys").modules, "torch", fake_torch)
-    monkeypatch.setattr(builtins, "__import__", original_import)
+    monkeypatch.setitem(sys.modules, "torch", fake_torch)
+    monkeypatch.setattr(torch_ta, "_HAS_TORCH", None)
 
-    close = FakeTensor(np.linspace(100, 120, 50))
-    high = FakeTensor(np.linspace(101, 121, 50))
-    low = FakeTensor(np.linspace(99, 119, 50))
-    volume = FakeTensor(np.linspace(1000, 1200, 50))
+    close = FakeTensor(ohlcv_np_small["close"])
+    high = FakeTensor(ohlcv_np_small["high"])
+    low = FakeTensor(ohlcv_np_small["low"])
+    volume = FakeTensor(ohlcv_np_small["volume"])
 
     assert torch_ta.is_available() is True
     assert "sma" in torch_ta.get_available_functions()
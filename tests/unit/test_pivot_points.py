@@ -18,6 +18,7 @@ Date: 2025-12-28
 """
 
 import numpy as np
+import pytest
 import haze_library as haze
 
 
@@ -140,11 +141,16 @@ class TestPivotBuySell:
     包含各种枢轴点相关的信号
     """
 
-    def test_basic_signals(self):
+    @pytest.fixture(scope="class")
+    def linear_hlc(self):
+        """线性上涨序列 (close, high, low)，类内共享"""
+        idx = np.arange(50, dtype=np.float64)
+        close = 100.0 + 0.5 * idx
+        return close, close + 2.0, close - 2.0
+
+    def test_basic_signals(self, linear_hlc):
         """测试基本买卖信号生成"""
-        close = [100.0 + i * 0.5 for i in range(50)]
-        high = [c + 2 for c in close]
-        low = [c - 2 for c in close]
+        close, high, low = linear_hlc
 
         result = haze.py_pivot_buy_sell(close, high, low, 10)
 
@@ -156,11 +162,9 @@ class TestPivotBuySell:
         for r in result:
             assert len(r) == len(close)
 
-    def test_signal_values(self):
+    def test_signal_values(self, linear_hlc):
         """测试信号值范围"""
-        close = [100.0 + i * 0.5 for i in range(50)]
-        high = [c + 2 for c in close]
-        low = [c - 2 for c in close]
+        close, high, low = linear_hlc
 
         result = haze.py_pivot_buy_sell(close, high, low, 10)
 
@@ -170,9 +174,9 @@ class TestPivotBuySell:
 
     def test_uptrend_signals(self):
         """测试上涨趋势信号"""
-        close = [100.0 + i * 2 for i in range(50)]
-        high = [v + 3 for v in close]
-        low = [v - 1 for v in close]
+        close = 100.0 + 2.0 * np.arange(50, dtype=np.float64)
+        high = close + 3.0
+        low = close - 1.0
 
         result = haze.py_pivot_buy_sell(close, high, low, 10)
         assert len(result) == 7
@@ -180,63 +184,51 @@ class TestPivotBuySell:
 
     def test_downtrend_signals(self):
         """测试下跌趋势信号"""
-        close = [200.0 - i * 2 for i in range(50)]
-        high = [v + 1 for v in close]
-        low = [v - 3 for v in close]
+        close = 200.0 - 2.0 * np.arange(50, dtype=np.float64)
+        high = close + 1.0
+        low = close - 3.0
 
         result = haze.py_pivot_buy_sell(close, high, low, 10)
         assert len(result) == 7
         assert all(len(r) == len(close) for r in result)
 
-    def test_different_lookback(self):
-        """测试不同回看周期"""
-        close = [100.0 + np.sin(i / 5) * 10 for i in range(100)]
-        high = [v + 2 for v in close]
-        low = [v - 2 for v in close]
-
-        for lookback in [5, 10, 20, 30]:
-            result = haze.py_pivot_buy_sell(close, high, low, lookback)
-            assert len(result) == 7
-
-
-class TestOtherPivotTypes:
-    """其他枢轴点类型测试"""
-
-    def test_classic_pivots(self):
-        """测试经典枢轴点"""
-        result = haze.py_classic_pivots(120.0, 80.0, 100.0)
+    @pytest.fixture(scope="class")
+    def sine_hlc(self):
+        """正弦波动序列 (close, high, low)，类内共享"""
+        close = 100.0 + np.sin(np.arange(100, dtype=np.float64) / 5) * 10
+        return close, close + 2.0, close - 2.0
 
-        assert isinstance(result, tuple)
-        assert len(result) >= 5  # PP, R1, R2, S1, S2 at minimum
-
-    def test_camarilla_pivots(self):
-        """测试卡马里拉枢轴点"""
-        result = haze.py_camarilla_pivots(120.0, 80.0, 100.0)
+    @pytest.mark.parametrize("lookback", [5, 10, 20, 30])
+    def test_different_lookback(self, sine_hlc, lookback):
+        """测试不同回看周期"""
+        close, high, low = sine_hlc
 
-        assert isinstance(result, tuple)
-        assert len(result) >= 5
+        result = haze.py_pivot_buy_sell(close, high, low, lookback)
+        assert len(result) == 7
 
-    def test_woodie_pivots(self):
-        """测试伍迪枢轴点"""
-        result = haze.py_woodie_pivots(120.0, 80.0, 100.0)
 
-        assert isinstance(result, tuple)
-        assert len(result) >= 5
+# (函数名, 参数, 最少返回级别数)
+PIVOT_CASES = [
+    ("py_classic_pivots", (120.0, 80.0, 100.0), 5),  # PP, R1, R2, S1, S2 at minimum
+    ("py_camarilla_pivots", (120.0, 80.0, 100.0), 5),
+    ("py_woodie_pivots", (120.0, 80.0, 100.0), 5),
+    ("py_demark_pivots", (120.0, 80.0, 100.0, 95.0), 3),  # 需要 open 价格；PP, R1, S1
+    ("py_standard_pivots", (120.0, 80.0, 100.0), 5),
+]
 
-    def test_demark_pivots(self):
-        """测试德马克枢轴点"""
-        # 需要 open 价格
-        result = haze.py_demark_pivots(120.0, 80.0, 100.0, 95.0)
 
-        assert isinstance(result, tuple)
-        assert len(result) >= 3  # PP, R1, S1
+class TestOtherPivotTypes:
+    """其他枢轴点类型测试（经典/卡马里拉/伍迪/德马克/标准）"""
 
-    def test_standard_pivots(self):
-        """测试标准枢轴点"""
-        result = haze.py_standard_pivots(120.0, 80.0, 100.0)
+    @pytest.mark.parametrize(
+        "name, args, min_len", PIVOT_CASES, ids=[case[0] for case in PIVOT_CASES]
+    )
+    def test_pivot_levels(self, name, args, min_len):
+        """测试返回枢轴点级别元组"""
+        result = getattr(haze, name)(*args)
 
         assert isinstance(result, tuple)
-        assert len(result) >= 5
+        assert len(result) >= min_len
 
 
 class TestPivotEdgeCases:
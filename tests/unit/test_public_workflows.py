@@ -9,12 +9,25 @@ Public Workflow Smoke Tests
 
 from __future__ import annotations
 
-import haze_library as haze
-import haze_library as haze_library
+import pytest
+
+
+@pytest.fixture(scope="session")
+def hl():
+    import haze_library
+
+    return haze_library
+
+
+@pytest.fixture(scope="session")
+def haze_mod():
+    import haze
+
+    return haze
 
 
 class TestCleanAPIWorkflows:
-    def test_clean_functions_exist(self):
+    def test_clean_functions_exist(self, hl):
         expected = [
             "sma",
             "ema",
@@ -27,30 +40,30 @@ class TestCleanAPIWorkflows:
             "supertrend",
             "adx",
         ]
-        for name in expected:
-            assert hasattr(haze_library, name), f"Missing: {name}"
-            assert callable(getattr(haze_library, name)), f"Not callable: {name}"
+        namespace = vars(hl)
+        missing = [name for name in expected if not callable(namespace.get(name))]
+        assert not missing, f"Missing or non-callable: {missing}"
 
-    def test_clean_keyword_aliases(self):
+    def test_clean_keyword_aliases(self, hl):
         close = [100.0, 101.0, 102.0, 101.5, 103.0]
         high = [101.0, 102.0, 103.0, 102.5, 104.0]
         low = [99.0, 100.0, 101.0, 100.5, 102.0]
 
-        _ = haze_library.sma(close=close, period=3)
-        _ = haze_library.ema(close=close, period=3)
-        _ = haze_library.hma(close=close, period=3)
+        _ = hl.sma(close=close, period=3)
+        _ = hl.ema(close=close, period=3)
+        _ = hl.hma(close=close, period=3)
 
-        _ = haze_library.macd(close, fast=2, slow=3, signal=2)
-        _ = haze_library.bollinger_bands(close=close, period=3, std_dev=2.0)
-        _ = haze_library.bollinger_bands(close=close, period=3, std=2.0)
-        _ = haze_library.stochastic(high, low, close, k_period=3, smooth_k=2, d_period=2)
+        _ = hl.macd(close, fast=2, slow=3, signal=2)
+        _ = hl.bollinger_bands(close=close, period=3, std_dev=2.0)
+        _ = hl.bollinger_bands(close=close, period=3, std=2.0)
+        _ = hl.stochastic(high, low, close, k_period=3, smooth_k=2, d_period=2)
 
 
 class TestHazeAliasPackage:
-    def test_forwarded_attributes(self):
-        assert hasattr(haze, "sma")
-        assert hasattr(haze, "py_sma")
-        assert hasattr(haze, "stochastic")
+    def test_forwarded_attributes(self, haze_mod):
+        assert hasattr(haze_mod, "sma")
+        assert hasattr(haze_mod, "py_sma")
+        assert hasattr(haze_mod, "stochastic")
 
     def test_import_specific_name(self):
         from haze import py_sma
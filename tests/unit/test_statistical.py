@@ -32,6 +32,23 @@ import pytest
 import numpy as np
 import haze_library as haze
 
+from . import _oracles
+from ._asserts import assert_numeric
+
+
+def _f64(values):
+    """转换为 float64 连续数组，直接走零拷贝绑定"""
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+@pytest.fixture(scope="module")
+def lr5(simple_prices_np):
+    """simple_prices_np 上 period=5 的线性回归结果（模块内共享，只读）"""
+    outputs = haze.py_linear_regression(simple_prices_np, period=5)
+    for arr in outputs:
+        arr.setflags(write=False)
+    return outputs
+
 
 # ==================== 1. Linear Regression ====================
 
@@ -42,40 +59,58 @@ class TestLinearRegression:
     特点：预测趋势线，返回拟合值
     """
 
-    def test_basic_calculation(self, simple_prices):
+    def test_basic_calculation(self, lr5, n):
         """测试基本线性回归计算
 
-        Returns: (slope, intercept, r_squared) - 3 lists
+        Returns: (slope, intercept, r_squared) - 3 arrays
         """
-        slope, intercept, r_squared = haze.py_linear_regression(simple_prices, period=5)
+        slope, intercept, r_squared = lr5
 
-        assert isinstance(slope, list)
-        assert isinstance(intercept, list)
-        assert isinstance(r_squared, list)
-        assert len(slope) == len(simple_prices)
-        assert all(isinstance(x, (int, float)) or np.isnan(x) for x in slope)
+        assert isinstance(slope, np.ndarray)
+        assert isinstance(intercept, np.ndarray)
+        assert isinstance(r_squared, np.ndarray)
+        assert slope.shape == (n,)
+        assert_numeric(slope)
 
     def test_perfect_linear(self):
         """测试完美线性数据"""
         # y = 2x + 1: [1, 3, 5, 7, 9]
         linear_data = [1.0, 3.0, 5.0, 7.0, 9.0]
 
-        slope, intercept, r_squared = haze.py_linear_regression(linear_data, period=5)
+        slope, intercept, r_squared = haze.py_linear_regression(_f64(linear_data), period=5)
 
         # For perfect linear data, r_squared should be 1.0 (perfect fit)
         assert abs(r_squared[-1] - 1.0) < 0.01
+        assert abs(slope[-1] - 2.0) < 1e-10
+        assert abs(intercept[-1] - 1.0) < 1e-10
 
-    def test_different_periods(self, simple_prices):
+    @pytest.mark.parametrize("period", [3, 5, 10])
+    def test_matches_oracle(self, simple_prices_np, period):
+        """测试与向量化参考实现逐点一致"""
+        outputs = haze.py_linear_regression(simple_prices_np, period=period)
+        expected = _oracles.rolling_linear_regression(simple_prices_np, period)
+
+        for got, want in zip(outputs, expected):
+            np.testing.assert_allclose(got, want, rtol=1e-9, atol=1e-12, equal_nan=True)
+
+    def test_different_periods(self, simple_prices_np, lr5, n):
         """测试不同周期参数"""
-        slope_3, _, _ = haze.py_linear_regression(simple_prices, period=3)
-        slope_5, _, _ = haze.py_linear_regression(simple_prices, period=5)
+        slope_3, _, _ = haze.py_linear_regression(simple_prices_np, period=3)
+        slope_5 = lr5[0]
 
-        assert len(slope_3) == len(slope_5)
+        assert slope_3.shape == slope_5.shape == (n,)
 
-    def test_empty_array(self):
-        """测试空数组"""
-        with pytest.raises(ValueError):
-            haze.py_linear_regression([], period=5)
+    def test_batch_matches_single_series(self, simple_prices_np, lr5, scaled_prices):
+        """测试批量接口与逐条计算结果一致"""
+        batch = np.stack([simple_prices_np, scaled_prices[1.1]])
+
+        outputs = haze.py_linear_regression_batch(batch, period=5)
+
+        scaled = haze.py_linear_regression(batch[1], period=5)
+        for row, expected in enumerate((lr5, scaled)):
+            for got, want in zip(outputs, expected):
+                assert got.shape == batch.shape
+                np.testing.assert_allclose(got[row], want, rtol=1e-12, equal_nan=True)
 
 
 # ==================== 2. Correlation ====================
@@ -87,47 +122,55 @@ class TestCorrelation:
     特点：-1到1范围，衡量线性相关程度
     """
 
-    def test_basic_calculation(self, simple_prices):
+    def test_basic_calculation(self, simple_prices_np, n, scaled_prices):
         """测试基本相关性计算"""
-        prices_x = simple_prices
-        prices_y = [x * 1.1 for x in simple_prices]  # 正相关
+        prices_x = simple_prices_np
+        prices_y = scaled_prices[1.1]  # 正相关
 
         result = haze.py_correlation(prices_x, prices_y, period=5)
 
-        assert isinstance(result, list)
-        assert len(result) == len(prices_x)
-        assert all(isinstance(x, (int, float)) or np.isnan(x) for x in result)
+        assert isinstance(result, np.ndarray)
+        assert result.shape == (n,)
+        assert_numeric(result)
 
     def test_perfect_positive_correlation(self):
         """测试完美正相关"""
         x = [1.0, 2.0, 3.0, 4.0, 5.0]
         y = [2.0, 4.0, 6.0, 8.0, 10.0]  # y = 2x
 
-        result = haze.py_correlation(x, y, period=5)
+        result = haze.py_correlation(_f64(x), _f64(y), period=5)
 
         # 最后一个值应该接近1.0
         assert abs(result[-1] - 1.0) < 0.01
 
+    def test_matches_oracle(self, simple_prices_np, normal_100):
+        """测试与向量化参考实现逐点一致"""
+        x = normal_100[: simple_prices_np.size]
+        result = haze.py_correlation(x, simple_prices_np, period=5)
+
+        np.testing.assert_allclose(
+            result, _oracles.rolling_correlation(x, simple_prices_np, 5),
+            rtol=1e-9, atol=1e-12, equal_nan=True,
+        )
+
     def test_perfect_negative_correlation(self):
         """测试完美负相关"""
         x = [1.0, 2.0, 3.0, 4.0, 5.0]
         y = [10.0, 8.0, 6.0, 4.0, 2.0]  # y = -2x + 12
 
-        result = haze.py_correlation(x, y, period=5)
+        result = haze.py_correlation(_f64(x), _f64(y), period=5)
 
         # 最后一个值应该接近-1.0
         assert abs(result[-1] - (-1.0)) < 0.01
 
-    def test_correlation_range(self, simple_prices):
+    def test_correlation_range(self, simple_prices_np, scaled_prices):
         """测试相关系数在-1到1范围内"""
-        prices_x = simple_prices
-        prices_y = [x * 0.9 for x in simple_prices]
+        prices_x = simple_prices_np
+        prices_y = scaled_prices[0.9]
 
         result = haze.py_correlation(prices_x, prices_y, period=5)
 
-        for corr in result:
-            if not np.isnan(corr):
-                assert -1.0 <= corr <= 1.0
+        assert np.all(np.isnan(result) | ((result >= -1.0) & (result <= 1.0)))
 
 
 # ==================== 3. Z-Score ====================
@@ -139,38 +182,32 @@ class TestZScore:
     特点：标准化分数，衡量偏离均值的程度
     """
 
-    def test_basic_calculation(self, simple_prices):
+    def test_basic_calculation(self, simple_prices_np, n):
         """测试基本Z-Score计算"""
-        result = haze.py_zscore(simple_prices, period=5)
+        result = haze.py_zscore(simple_prices_np, period=5)
 
-        assert isinstance(result, list)
-        assert len(result) == len(simple_prices)
-        assert all(isinstance(x, (int, float)) or np.isnan(x) for x in result)
+        assert isinstance(result, np.ndarray)
+        assert result.shape == (n,)
+        assert_numeric(result)
 
-    def test_zero_mean_unit_variance(self):
+    def test_zero_mean_unit_variance(self, normal_100):
         """测试标准正态分布数据"""
-        # 标准正态分布数据
-        np.random.seed(42)
-        data = np.random.normal(0, 1, 100).tolist()
+        result = haze.py_zscore(normal_100, period=20)
 
-        result = haze.py_zscore(data, period=20)
+        # 与向量化参考实现逐点一致
+        np.testing.assert_allclose(result, _oracles.rolling_zscore(normal_100, 20), rtol=1e-9, equal_nan=True)
 
         # Z-score应该在合理范围内（大部分在-3到3之间）
-        valid_results = [z for z in result if not np.isnan(z)]
-        assert len(valid_results) > 0
-        assert all(-5 < z < 5 for z in valid_results)  # 允许一些极端值
+        valid = result[~np.isnan(result)]
+        assert valid.size > 0
+        assert np.all(np.abs(valid) < 5)  # 允许一些极端值
 
-    def test_different_periods(self, simple_prices):
+    def test_different_periods(self, simple_prices_np, n):
         """测试不同周期参数"""
-        result_3 = haze.py_zscore(simple_prices, period=3)
-        result_5 = haze.py_zscore(simple_prices, period=5)
+        result_3 = haze.py_zscore(simple_prices_np, period=3)
+        result_5 = haze.py_zscore(simple_prices_np, period=5)
 
-        assert len(result_3) == len(result_5)
-
-    def test_empty_array(self):
-        """测试空数组"""
-        with pytest.raises(ValueError):
-            haze.py_zscore([], period=5)
+        assert result_3.shape == result_5.shape == (n,)
 
 
 # ==================== 4. Covariance ====================
@@ -182,23 +219,23 @@ class TestCovariance:
     特点：衡量两变量联合变化程度
     """
 
-    def test_basic_calculation(self, simple_prices):
+    def test_basic_calculation(self, simple_prices_np, n, scaled_prices):
         """测试基本协方差计算"""
-        prices_x = simple_prices
-        prices_y = [x * 1.1 for x in simple_prices]
+        prices_x = simple_prices_np
+        prices_y = scaled_prices[1.1]
 
         result = haze.py_covariance(prices_x, prices_y, period=5)
 
-        assert isinstance(result, list)
-        assert len(result) == len(prices_x)
-        assert all(isinstance(x, (int, float)) or np.isnan(x) for x in result)
+        assert isinstance(result, np.ndarray)
+        assert result.shape == (n,)
+        assert_numeric(result)
 
     def test_positive_covariance(self):
         """测试正协方差"""
         x = [1.0, 2.0, 3.0, 4.0, 5.0]
         y = [2.0, 4.0, 6.0, 8.0, 10.0]  # 正相关
 
-        result = haze.py_covariance(x, y, period=5)
+        result = haze.py_covariance(_f64(x), _f64(y), period=5)
 
         # 协方差应该为正
         assert result[-1] > 0
@@ -208,16 +245,11 @@ class TestCovariance:
         x = [1.0, 2.0, 3.0, 4.0, 5.0]
         y = [10.0, 8.0, 6.0, 4.0, 2.0]  # 负相关
 
-        result = haze.py_covariance(x, y, period=5)
+        result = haze.py_covariance(_f64(x), _f64(y), period=5)
 
         # 协方差应该为负
         assert result[-1] < 0
 
-    def test_empty_array(self):
-        """测试空数组"""
-        with pytest.raises(ValueError):
-            haze.py_covariance([], [], period=5)
-
 
 # ==================== 5. Beta ====================
 
@@ -228,23 +260,23 @@ class TestBeta:
     特点：衡量股票相对市场的系统风险
     """
 
-    def test_basic_calculation(self, simple_prices):
+    def test_basic_calculation(self, simple_prices_np, n, scaled_prices):
         """测试基本Beta计算"""
-        stock = simple_prices
-        market = [x * 0.9 for x in simple_prices]
+        stock = simple_prices_np
+        market = scaled_prices[0.9]
 
         result = haze.py_beta(stock, market, period=5)
 
-        assert isinstance(result, list)
-        assert len(result) == len(stock)
-        assert all(isinstance(x, (int, float)) or np.isnan(x) for x in result)
+        assert isinstance(result, np.ndarray)
+        assert result.shape == (n,)
+        assert_numeric(result)
 
     def test_beta_one(self):
         """测试Beta=1的情况（股票=市场）"""
         stock = [1.0, 2.0, 3.0, 4.0, 5.0]
         market = [1.0, 2.0, 3.0, 4.0, 5.0]
 
-        result = haze.py_beta(stock, market, period=5)
+        result = haze.py_beta(_f64(stock), _f64(market), period=5)
 
         # Beta应该接近1.0
         assert abs(result[-1] - 1.0) < 0.01
@@ -254,20 +286,20 @@ class TestBeta:
         market = [1.0, 2.0, 3.0, 4.0, 5.0]
         stock = [1.0, 3.0, 5.0, 7.0, 9.0]  # 2倍波动
 
-        result = haze.py_beta(stock, market, period=5)
+        result = haze.py_beta(_f64(stock), _f64(market), period=5)
 
         # Beta应该接近2.0
         assert abs(result[-1] - 2.0) < 0.01
 
-    def test_different_periods(self, simple_prices):
+    def test_different_periods(self, simple_prices_np, n, scaled_prices):
         """测试不同周期参数"""
-        stock = simple_prices
-        market = [x * 0.9 for x in simple_prices]
+        stock = simple_prices_np
+        market = scaled_prices[0.9]
 
         result_5 = haze.py_beta(stock, market, period=5)
         result_10 = haze.py_beta(stock, market, period=10)
 
-        assert len(result_5) == len(result_10)
+        assert result_5.shape == result_10.shape == (n,)
 
 
 # ==================== 6. Standard Error ====================
@@ -279,36 +311,27 @@ class TestStandardError:
     特点：衡量样本均值的离散程度
     """
 
-    def test_basic_calculation(self, simple_prices):
+    def test_basic_calculation(self, simple_prices_np, n):
         """测试基本标准误差计算"""
-        result = haze.py_stderr(simple_prices, period=5)
+        result = haze.py_stderr(simple_prices_np, period=5)
 
-        assert isinstance(result, list)
-        assert len(result) == len(simple_prices)
-        assert all(isinstance(x, (int, float)) or np.isnan(x) for x in result)
+        assert isinstance(result, np.ndarray)
+        assert result.shape == (n,)
+        assert_numeric(result)
 
-    def test_stderr_positive(self, simple_prices):
+    def test_stderr_positive(self, simple_prices_np):
         """测试标准误差为正值"""
-        result = haze.py_stderr(simple_prices, period=5)
+        result = haze.py_stderr(simple_prices_np, period=5)
 
-        for se in result:
-            if not np.isnan(se):
-                assert se >= 0
+        assert np.all(np.isnan(result) | (result >= 0))
 
     def test_constant_values(self):
         """测试常数序列的标准误差为0"""
-        constant = [50.0] * 10
+        constant = np.full(10, 50.0, dtype=np.float64)
 
         result = haze.py_stderr(constant, period=5)
 
-        for se in result:
-            if not np.isnan(se):
-                assert abs(se) < 1e-10
-
-    def test_empty_array(self):
-        """测试空数组"""
-        with pytest.raises(ValueError):
-            haze.py_stderr([], period=5)
+        assert np.all(np.isnan(result) | (np.abs(result) < 1e-10))
 
 
 # ==================== 7. CORREL (TA-Lib) ====================
@@ -320,32 +343,25 @@ class TestCORREL:
     特点：TA-Lib实现的相关系数
     """
 
-    def test_basic_calculation(self, simple_prices):
+    def test_basic_calculation(self, simple_prices_np, n, scaled_prices):
         """测试基本CORREL计算"""
-        prices_x = simple_prices
-        prices_y = [x * 1.1 for x in simple_prices]
+        prices_x = simple_prices_np
+        prices_y = scaled_prices[1.1]
 
         result = haze.py_correl(prices_x, prices_y, period=5)
 
-        assert isinstance(result, list)
-        assert len(result) == len(prices_x)
-        assert all(isinstance(x, (int, float)) or np.isnan(x) for x in result)
+        assert isinstance(result, np.ndarray)
+        assert result.shape == (n,)
+        assert_numeric(result)
 
-    def test_correl_range(self, simple_prices):
+    def test_correl_range(self, simple_prices_np, scaled_prices):
         """测试CORREL在-1到1范围内"""
-        prices_x = simple_prices
-        prices_y = [x * 0.9 for x in simple_prices]
+        prices_x = simple_prices_np
+        prices_y = scaled_prices[0.9]
 
         result = haze.py_correl(prices_x, prices_y, period=5)
 
-        for corr in result:
-            if not np.isnan(corr):
-                assert -1.0 <= corr <= 1.0
-
-    def test_empty_array(self):
-        """测试空数组"""
-        with pytest.raises(ValueError):
-            haze.py_correl([], [], period=5)
+        assert np.all(np.isnan(result) | ((result >= -1.0) & (result <= 1.0)))
 
 
 # ==================== 8. LINEARREG (TA-Lib) ====================
@@ -357,25 +373,20 @@ class TestLINEARREG:
     特点：TA-Lib实现的线性回归
     """
 
-    def test_basic_calculation(self, simple_prices):
+    def test_basic_calculation(self, simple_prices_np, n):
         """测试基本LINEARREG计算"""
-        result = haze.py_linearreg(simple_prices, period=5)
+        result = haze.py_linearreg(simple_prices_np, period=5)
 
-        assert isinstance(result, list)
-        assert len(result) == len(simple_prices)
-        assert all(isinstance(x, (int, float)) or np.isnan(x) for x in result)
+        assert isinstance(result, np.ndarray)
+        assert result.shape == (n,)
+        assert_numeric(result)
 
-    def test_different_periods(self, simple_prices):
+    def test_different_periods(self, simple_prices_np, n):
         """测试不同周期参数"""
-        result_3 = haze.py_linearreg(simple_prices, period=3)
-        result_5 = haze.py_linearreg(simple_prices, period=5)
+        result_3 = haze.py_linearreg(simple_prices_np, period=3)
+        result_5 = haze.py_linearreg(simple_prices_np, period=5)
 
-        assert len(result_3) == len(result_5)
-
-    def test_empty_array(self):
-        """测试空数组"""
-        with pytest.raises(ValueError):
-            haze.py_linearreg([], period=5)
+        assert result_3.shape == result_5.shape == (n,)
 
 
 # ==================== 9. LINEARREG_SLOPE ====================
@@ -387,19 +398,19 @@ class TestLINEARREG_SLOPE:
     特点：衡量趋势强度和方向
     """
 
-    def test_basic_calculation(self, simple_prices):
+    def test_basic_calculation(self, simple_prices_np, n):
         """测试基本LINEARREG_SLOPE计算"""
-        result = haze.py_linearreg_slope(simple_prices, period=5)
+        result = haze.py_linearreg_slope(simple_prices_np, period=5)
 
-        assert isinstance(result, list)
-        assert len(result) == len(simple_prices)
-        assert all(isinstance(x, (int, float)) or np.isnan(x) for x in result)
+        assert isinstance(result, np.ndarray)
+        assert result.shape == (n,)
+        assert_numeric(result)
 
     def test_positive_slope(self):
         """测试上升趋势的正斜率"""
         increasing = [1.0, 2.0, 3.0, 4.0, 5.0]
 
-        result = haze.py_linearreg_slope(increasing, period=5)
+        result = haze.py_linearreg_slope(_f64(increasing), period=5)
 
         # 斜率应该为正
         assert result[-1] > 0
@@ -408,21 +419,19 @@ class TestLINEARREG_SLOPE:
         """测试下降趋势的负斜率"""
         decreasing = [5.0, 4.0, 3.0, 2.0, 1.0]
 
-        result = haze.py_linearreg_slope(decreasing, period=5)
+        result = haze.py_linearreg_slope(_f64(decreasing), period=5)
 
         # 斜率应该为负
         assert result[-1] < 0
 
     def test_zero_slope(self):
         """测试水平趋势的零斜率"""
-        flat = [3.0] * 10
+        flat = np.full(10, 3.0, dtype=np.float64)
 
         result = haze.py_linearreg_slope(flat, period=5)
 
         # 斜率应该接近0
-        for slope in result:
-            if not np.isnan(slope):
-                assert abs(slope) < 1e-10
+        assert np.all(np.isnan(result) | (np.abs(result) < 1e-10))
 
 
 # ==================== 10. LINEARREG_ANGLE ====================
@@ -434,26 +443,19 @@ class TestLINEARREG_ANGLE:
     特点：以角度表示趋势方向
     """
 
-    def test_basic_calculation(self, simple_prices):
+    def test_basic_calculation(self, simple_prices_np, n):
         """测试基本LINEARREG_ANGLE计算"""
-        result = haze.py_linearreg_angle(simple_prices, period=5)
+        result = haze.py_linearreg_angle(simple_prices_np, period=5)
 
-        assert isinstance(result, list)
-        assert len(result) == len(simple_prices)
-        assert all(isinstance(x, (int, float)) or np.isnan(x) for x in result)
+        assert isinstance(result, np.ndarray)
+        assert result.shape == (n,)
+        assert_numeric(result)
 
-    def test_angle_range(self, simple_prices):
+    def test_angle_range(self, simple_prices_np):
         """测试角度在-90到90度范围内"""
-        result = haze.py_linearreg_angle(simple_prices, period=5)
-
-        for angle in result:
-            if not np.isnan(angle):
-                assert -90.0 <= angle <= 90.0
+        result = haze.py_linearreg_angle(simple_prices_np, period=5)
 
-    def test_empty_array(self):
-        """测试空数组"""
-        with pytest.raises(ValueError):
-            haze.py_linearreg_angle([], period=5)
+        assert np.all(np.isnan(result) | ((result >= -90.0) & (result <= 90.0)))
 
 
 # ==================== 11. LINEARREG_INTERCEPT ====================
@@ -465,29 +467,24 @@ class TestLINEARREG_INTERCEPT:
     特点：线性方程的截距项
     """
 
-    def test_basic_calculation(self, simple_prices):
+    def test_basic_calculation(self, simple_prices_np, n):
         """测试基本LINEARREG_INTERCEPT计算"""
-        result = haze.py_linearreg_intercept(simple_prices, period=5)
+        result = haze.py_linearreg_intercept(simple_prices_np, period=5)
 
-        assert isinstance(result, list)
-        assert len(result) == len(simple_prices)
-        assert all(isinstance(x, (int, float)) or np.isnan(x) for x in result)
+        assert isinstance(result, np.ndarray)
+        assert result.shape == (n,)
+        assert_numeric(result)
 
     def test_known_intercept(self):
         """测试已知截距的线性数据"""
         # y = 2x + 3: [3, 5, 7, 9, 11]
         linear_data = [3.0, 5.0, 7.0, 9.0, 11.0]
 
-        result = haze.py_linearreg_intercept(linear_data, period=5)
+        result = haze.py_linearreg_intercept(_f64(linear_data), period=5)
 
         # 截距应该接近3.0
         assert abs(result[-1] - 3.0) < 0.1
 
-    def test_empty_array(self):
-        """测试空数组"""
-        with pytest.raises(ValueError):
-            haze.py_linearreg_intercept([], period=5)
-
 
 # ==================== 12. VAR ====================
 
@@ -498,42 +495,46 @@ class TestVAR:
     特点：衡量数据离散程度
     """
 
-    def test_basic_calculation(self, simple_prices):
+    def test_basic_calculation(self, simple_prices_np, n):
         """测试基本VAR计算"""
-        result = haze.py_var(simple_prices, period=5)
+        result = haze.py_var(simple_prices_np, period=5)
 
-        assert isinstance(result, list)
-        assert len(result) == len(simple_prices)
-        assert all(isinstance(x, (int, float)) or np.isnan(x) for x in result)
+        assert isinstance(result, np.ndarray)
+        assert result.shape == (n,)
+        assert_numeric(result)
 
-    def test_variance_positive(self, simple_prices):
+    def test_variance_positive(self, simple_prices_np):
         """测试方差为非负值"""
-        result = haze.py_var(simple_prices, period=5)
+        result = haze.py_var(simple_prices_np, period=5)
 
-        for var in result:
-            if not np.isnan(var):
-                assert var >= 0
+        assert np.all(np.isnan(result) | (result >= 0))
 
     def test_constant_zero_variance(self):
         """测试常数序列的方差为0"""
-        constant = [100.0] * 10
+        constant = np.full(10, 100.0, dtype=np.float64)
 
         result = haze.py_var(constant, period=5)
 
-        for var in result:
-            if not np.isnan(var):
-                assert abs(var) < 1e-10
+        assert np.all(np.isnan(result) | (np.abs(result) < 1e-10))
 
     def test_known_variance(self):
         """测试已知方差的数据"""
         # [1, 2, 3, 4, 5] 的方差 = 2.0
         data = [1.0, 2.0, 3.0, 4.0, 5.0]
 
-        result = haze.py_var(data, period=5)
+        result = haze.py_var(_f64(data), period=5)
 
         # 样本方差应该接近2.0（或2.5，取决于是总体方差还是样本方差）
         assert 1.5 < result[-1] < 3.0
 
+    def test_matches_oracle(self, normal_100):
+        """测试与向量化参考实现逐点一致（总体方差）"""
+        result = haze.py_var(normal_100, period=20)
+
+        np.testing.assert_allclose(
+            result, _oracles.rolling_var(normal_100, 20), rtol=1e-9, equal_nan=True
+        )
+
 
 # ==================== 13. TSF ====================
 
@@ -544,19 +545,19 @@ class TestTSF:
     特点：预测下一个时间点的值
     """
 
-    def test_basic_calculation(self, simple_prices):
+    def test_basic_calculation(self, simple_prices_np, n):
         """测试基本TSF计算"""
-        result = haze.py_tsf(simple_prices, period=5)
+        result = haze.py_tsf(simple_prices_np, period=5)
 
-        assert isinstance(result, list)
-        assert len(result) == len(simple_prices)
-        assert all(isinstance(x, (int, float)) or np.isnan(x) for x in result)
+        assert isinstance(result, np.ndarray)
+        assert result.shape == (n,)
+        assert_numeric(result)
 
     def test_uptrend_forecast(self):
         """测试上升趋势的预测"""
         increasing = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0]
 
-        result = haze.py_tsf(increasing, period=5)
+        result = haze.py_tsf(_f64(increasing), period=5)
 
         # 预测值应该大于当前值（上升趋势）
         valid_results = [(r, increasing[i]) for i, r in enumerate(result) if not np.isnan(r)]
@@ -568,7 +569,7 @@ class TestTSF:
         """测试下降趋势的预测"""
         decreasing = [10.0, 9.0, 8.0, 7.0, 6.0, 5.0, 4.0, 3.0, 2.0, 1.0]
 
-        result = haze.py_tsf(decreasing, period=5)
+        result = haze.py_tsf(_f64(decreasing), period=5)
 
         # 预测值应该小于当前值（下降趋势）
         valid_results = [(r, decreasing[i]) for i, r in enumerate(result) if not np.isnan(r)]
@@ -576,7 +577,78 @@ class TestTSF:
             last_forecast, last_actual = valid_results[-1]
             assert last_forecast < last_actual
 
-    def test_empty_array(self):
-        """测试空数组"""
+
+# ==================== 全部 13 个指标：空输入 / 列表兼容 ====================
+
+_STAT_INDICATORS = [
+    ("py_linear_regression", 1),
+    ("py_correlation", 2),
+    ("py_zscore", 1),
+    ("py_covariance", 2),
+    ("py_beta", 2),
+    ("py_stderr", 1),
+    ("py_correl", 2),
+    ("py_linearreg", 1),
+    ("py_linearreg_slope", 1),
+    ("py_linearreg_angle", 1),
+    ("py_linearreg_intercept", 1),
+    ("py_var", 1),
+    ("py_tsf", 1),
+]
+
+
+# 零拷贝单序列接口不校验输入长度：空输入返回空数组，
+# period 超过数据长度时返回全 NaN（*_legacy 则抛出 ValueError）
+_NAN_ON_LONG_PERIOD = [
+    "py_zscore",
+    "py_standard_error",
+    "py_stderr",
+    "py_linearreg",
+    "py_linearreg_slope",
+    "py_linearreg_angle",
+    "py_linearreg_intercept",
+    "py_var",
+    "py_tsf",
+]
+
+
+@pytest.mark.parametrize("name,arity", _STAT_INDICATORS)
+def test_empty_array(name, arity):
+    """测试空数组输入：校验型接口抛出 ValueError，其余返回空数组"""
+    inputs = (np.empty(0, dtype=np.float64),) * arity
+
+    if name in _NAN_ON_LONG_PERIOD:
+        result = getattr(haze, name)(*inputs, period=5)
+        assert result.shape == (0,)
+    else:
         with pytest.raises(ValueError):
-            haze.py_tsf([], period=5)
+            getattr(haze, name)(*inputs, period=5)
+
+
+@pytest.mark.parametrize("name", _NAN_ON_LONG_PERIOD)
+def test_period_longer_than_data(name, simple_prices_np, n):
+    """测试周期大于数据长度返回全 NaN（DataFrame 访问器依赖此行为处理短数据）"""
+    result = getattr(haze, name)(simple_prices_np, period=n + 1)
+
+    assert result.shape == (n,)
+    assert np.isnan(result).all()
+
+
+@pytest.mark.compat
+@pytest.mark.parametrize("name,arity", _STAT_INDICATORS)
+def test_list_compat(name, arity, simple_prices_np, scaled_prices):
+    """测试 *_legacy 列表接口：返回 list[float]，且与零拷贝接口结果一致"""
+    arrays = (simple_prices_np, scaled_prices[1.1])[:arity]
+
+    legacy = getattr(haze, f"{name}_legacy")(*(a.tolist() for a in arrays), period=5)
+    current = getattr(haze, name)(*arrays, period=5)
+
+    if name == "py_linear_regression":
+        pairs = list(zip(legacy, current))
+    else:
+        pairs = [(legacy, current)]
+
+    for values, expected in pairs:
+        assert isinstance(values, list)
+        assert all(isinstance(x, float) for x in values)
+        np.testing.assert_allclose(values, expected, rtol=0, atol=0, equal_nan=True)
@@ -10,11 +10,10 @@ Date: 2025-12-26
 
 import pytest
 import math
+import numpy as np
 import sys
 import os
 import threading
-import time
-from concurrent.futures import ThreadPoolExecutor
 
 # Add parent to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../rust/python'))
@@ -36,28 +35,29 @@ from haze_library.streaming import (
 
 # ==================== Fixtures ====================
 
-@pytest.fixture
+def _readonly(values: np.ndarray) -> np.ndarray:
+    """Mark a session-shared array read-only so tests cannot mutate it."""
+    values.setflags(write=False)
+    return values
+
+
+@pytest.fixture(scope="session")
 def sample_prices():
-    """Sample close prices for testing."""
-    return [
+    """Sample close prices for testing (read-only float64 array)."""
+    return _readonly(np.array([
         100.0, 101.0, 102.0, 101.5, 103.0, 102.5, 104.0, 103.5, 105.0, 104.5,
         106.0, 105.5, 107.0, 106.5, 108.0, 107.5, 109.0, 108.5, 110.0, 109.5,
         108.0, 107.0, 106.0, 105.0, 104.0, 105.0, 106.0, 107.0, 108.0, 109.0,
-    ]
+    ], dtype=np.float64))
 
 
-@pytest.fixture
-def sample_ohlc():
-    """Sample OHLC data for testing."""
-    base = [
-        100.0, 101.0, 102.0, 101.5, 103.0, 102.5, 104.0, 103.5, 105.0, 104.5,
-        106.0, 105.5, 107.0, 106.5, 108.0, 107.5, 109.0, 108.5, 110.0, 109.5,
-        108.0, 107.0, 106.0, 105.0, 104.0, 105.0, 106.0, 107.0, 108.0, 109.0,
-    ]
+@pytest.fixture(scope="session")
+def sample_ohlc(sample_prices):
+    """Sample OHLC columns for testing (read-only float64 arrays)."""
     return {
-        'high': [c + 1.0 for c in base],
-        'low': [c - 1.0 for c in base],
-        'close': base,
+        'high': _readonly(sample_prices + 1.0),
+        'low': _readonly(sample_prices - 1.0),
+        'close': sample_prices,
     }
 
 
@@ -70,12 +70,10 @@ class TestIncrementalSMA:
         """Test basic SMA calculation."""
         sma = IncrementalSMA(period=5)
 
-        results = []
-        for price in sample_prices:
-            results.append(sma.update(price))
+        results = np.asarray([sma.update(price) for price in sample_prices], dtype=float)
 
         # First 4 values should be NaN
-        assert all(math.isnan(r) for r in results[:4])
+        assert np.isnan(results[:4]).all()
         # 5th value should be average of first 5 prices
         expected = sum(sample_prices[:5]) / 5
         assert abs(results[4] - expected) < 0.0001
@@ -123,18 +121,15 @@ class TestIncrementalEMA:
     def test_basic_calculation(self, sample_prices):
         """Test basic EMA calculation."""
         ema = IncrementalEMA(period=5)
-
-        results = []
-        for price in sample_prices:
-            results.append(ema.update(price))
+        results = np.asarray(ema.update_batch(sample_prices), dtype=float)
 
         # First 4 values should be NaN
-        assert all(math.isnan(r) for r in results[:4])
+        assert np.isnan(results[:4]).all()
         # 5th value should be SMA of first 5 prices
         expected = sum(sample_prices[:5]) / 5
         assert abs(results[4] - expected) < 0.0001
         # Subsequent values should follow EMA formula
-        assert not math.isnan(results[5])
+        assert not np.isnan(results[5])
 
 # ==================== RSI Tests ====================
 
@@ -144,16 +139,13 @@ class TestIncrementalRSI:
     def test_basic_calculation(self, sample_prices):
         """Test basic RSI calculation."""
         rsi = IncrementalRSI(period=14)
-
-        results = []
-        for price in sample_prices:
-            results.append(rsi.update(price))
+        results = np.asarray(rsi.update_batch(sample_prices), dtype=float)
 
         # First 14 values should be NaN
-        assert all(math.isnan(r) for r in results[:14])
+        assert np.isnan(results[:14]).all()
         # 15th+ values should be valid RSI
-        valid_results = [r for r in results if not math.isnan(r)]
-        assert all(0 <= r <= 100 for r in valid_results)
+        valid_results = results[~np.isnan(results)]
+        assert ((valid_results >= 0) & (valid_results <= 100)).all()
 
     def test_is_ready(self):
         """RSI should only be ready after period + 1 updates."""
@@ -196,13 +188,28 @@ class TestIncrementalMACD:
     def test_is_ready(self):
         """MACD is_ready should track when outputs become finite."""
         macd = IncrementalMACD(fast=3, slow=5, signal=2)
-        ready_seen = False
-        for value in range(100, 140):
-            line, signal, hist = macd.update(float(value))
-            ready_now = not any(math.isnan(x) for x in (line, signal, hist))
-            assert macd.is_ready == ready_now
-            ready_seen = ready_seen or ready_now
-        assert ready_seen
+        line, signal, hist, ready_idx = macd.update_batch(
+            np.arange(100, 140, dtype=np.float64)
+        )
+
+        assert 0 <= ready_idx < 40
+        finite = ~(np.isnan(line) | np.isnan(signal) | np.isnan(hist))
+        # Not ready before ready_idx, ready from there on
+        assert not finite[:ready_idx].any()
+        assert finite[ready_idx:].all()
+        assert macd.is_ready
+        assert macd.count == 40
+
+    def test_update_batch_matches_update(self, sample_prices):
+        """Batch outputs match per-tick updates and state continues seamlessly."""
+        ref = IncrementalMACD(fast=5, slow=10, signal=3)
+        expected = np.array([ref.update(p) for p in sample_prices]).T
+
+        macd = IncrementalMACD(fast=5, slow=10, signal=3)
+        *outputs, _ = macd.update_batch(sample_prices)
+
+        np.testing.assert_allclose(outputs, expected, equal_nan=True)
+        assert macd.update(100.0) == pytest.approx(ref.update(100.0))
 
 
 # ==================== ATR Tests ====================
@@ -213,18 +220,38 @@ class TestIncrementalATR:
     def test_basic_calculation(self, sample_ohlc):
         """Test basic ATR calculation."""
         atr = IncrementalATR(period=7)
-
-        results = []
-        for h, l, c in zip(
+        results = atr.update_batch(
             sample_ohlc['high'], sample_ohlc['low'], sample_ohlc['close']
-        ):
-            results.append(atr.update(h, l, c))
+        )
 
+        assert results.shape == (len(sample_ohlc['close']),)
         # First 7 values should be NaN
-        assert all(math.isnan(r) for r in results[:7])
+        assert np.isnan(results[:7]).all()
         # ATR should be positive
-        valid_results = [r for r in results if not math.isnan(r)]
-        assert all(r > 0 for r in valid_results)
+        valid_results = results[~np.isnan(results)]
+        assert (valid_results > 0).all()
+        assert atr.current == results[-1]
+
+    def test_update_batch_matches_update(self, sample_ohlc):
+        """Batch ingest matches per-bar updates."""
+        ref = IncrementalATR(period=7)
+        expected = [
+            ref.update(h, l, c)
+            for h, l, c in zip(sample_ohlc['high'], sample_ohlc['low'], sample_ohlc['close'])
+        ]
+        atr = IncrementalATR(period=7)
+        results = atr.update_batch(
+            sample_ohlc['high'], sample_ohlc['low'], sample_ohlc['close']
+        )
+        np.testing.assert_allclose(results, expected, equal_nan=True)
+        assert atr.count == ref.count
+
+    def test_update_batch_length_mismatch(self, sample_ohlc):
+        """Columns of different length are rejected."""
+        atr = IncrementalATR(period=7)
+        with pytest.raises(ValueError, match="same length"):
+            atr.update_batch(sample_ohlc['high'][:-1], sample_ohlc['low'], sample_ohlc['close'])
+        assert atr.count == 0
 
 
 # ==================== SuperTrend Tests ====================
@@ -284,11 +311,10 @@ class TestIncrementalStochastic:
     def test_basic_calculation(self, sample_ohlc):
         """Test basic Stochastic calculation."""
         stoch = IncrementalStochastic(k_period=7, d_period=3)
-
-        for h, l, c in zip(
+        k_series, d_series = stoch.update_batch(
             sample_ohlc['high'], sample_ohlc['low'], sample_ohlc['close']
-        ):
-            k, d = stoch.update(h, l, c)
+        )
+        k, d = k_series[-1], d_series[-1]
 
         # After warmup, values should be valid
         assert not math.isnan(k)
@@ -347,6 +373,34 @@ class TestCCXTStreamProcessor:
 
         assert 'sma' in results
 
+    def test_process_candle_tracks_add_remove(self):
+        """Dispatch follows add/replace/remove of indicators."""
+        processor = CCXTStreamProcessor()
+        processor.add_indicator('sma', IncrementalSMA(1))
+        processor.add_indicator('atr', IncrementalATR(1))
+        candle = [100.0, 101.0, 99.0, 100.0, 1000.0]
+
+        results = processor.process_candle(candle)
+        assert list(results) == ['sma', 'atr']
+        assert results['sma'] == 100.0
+
+        processor.add_indicator('sma', IncrementalEMA(1))
+        processor.remove_indicator('atr')
+        results = processor.process_candle(candle)
+        assert list(results) == ['sma']
+        assert results['sma'] == 100.0
+        assert processor.get_status()['sma']['count'] == 1
+
+    def test_process_candle_returns_snapshot(self):
+        """Results from earlier candles are not overwritten by later ones."""
+        processor = CCXTStreamProcessor()
+        processor.add_indicator('sma', IncrementalSMA(1))
+
+        first = processor.process_candle([100.0, 101.0, 99.0, 100.0, 1000.0])
+        second = processor.process_candle([100.0, 101.0, 99.0, 105.0, 1000.0])
+        assert first['sma'] == 100.0
+        assert second['sma'] == 105.0
+
     def test_reset_all(self):
         """Test resetting all indicators."""
         processor = CCXTStreamProcessor()
@@ -372,22 +426,28 @@ class TestThreadSafety:
     def test_concurrent_updates(self):
         """Test concurrent updates from multiple threads."""
         sma = IncrementalSMA(period=10)
-        results = []
-        lock = threading.Lock()
+        values = np.arange(100, dtype=np.float64) + 100.0
+        results = np.full(values.size, np.nan)
 
-        def update_sma(value):
-            result = sma.update(value)
-            with lock:
-                results.append(result)
+        # Each worker owns a disjoint slice, so results need no lock
+        def worker(start, stop):
+            for i in range(start, stop):
+                results[i] = sma.update(values[i])
 
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            for i in range(100):
-                executor.submit(update_sma, 100.0 + i)
+        threads = [
+            threading.Thread(target=worker, args=(start, start + 25))
+            for start in range(0, values.size, 25)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
 
-        # Should have 100 results
-        assert len(results) == 100
+        # Every update was applied exactly once
+        assert sma.count == 100
         # After 100 updates, SMA should be ready
         assert sma.is_ready
+        assert not np.isnan(results[-1])
 
     def test_concurrent_read_write(self):
         """Test concurrent reads and writes."""
@@ -399,16 +459,19 @@ class TestThreadSafety:
         for i in range(10):
             sma.update(100.0 + i)
 
+        # Release both threads together so reads and writes actually overlap
+        barrier = threading.Barrier(2)
+
         def reader():
+            barrier.wait()
             for _ in range(50):
                 with lock:
                     read_results.append(sma.current)
-                time.sleep(0.001)
 
         def writer():
+            barrier.wait()
             for i in range(50):
                 sma.update(150.0 + i)
-                time.sleep(0.001)
 
         threads = [
             threading.Thread(target=reader),
@@ -432,7 +495,9 @@ class TestUtilities:
     def test_get_available_indicators(self):
         """Test get_available_streaming_indicators."""
         indicators = get_available_streaming_indicators()
-        assert isinstance(indicators, list)
+        assert isinstance(indicators, tuple)
+        # Memoized: repeated calls share one immutable result
+        assert get_available_streaming_indicators() is indicators
         assert 'IncrementalSMA' in indicators
         assert 'IncrementalRSI' in indicators
         assert 'IncrementalSuperTrend' in indicators
@@ -473,13 +538,80 @@ class TestBatchProcessing:
     def test_update_batch(self, sample_prices):
         """Test update_batch method."""
         sma = IncrementalSMA(period=5)
-        results = sma.update_batch(sample_prices)
+        results = np.asarray(sma.update_batch(sample_prices), dtype=float)
 
         assert len(results) == len(sample_prices)
         # First 4 should be NaN
-        assert all(math.isnan(r) for r in results[:4])
+        assert np.isnan(results[:4]).all()
         # Rest should be valid
-        assert all(not math.isnan(r) for r in results[4:])
+        assert not np.isnan(results[4:]).any()
+
+    def test_update_batch_matches_update(self, sample_prices):
+        """Batch output and state continuation match per-tick updates."""
+        ref = IncrementalSMA(period=5)
+        expected = [ref.update(p) for p in sample_prices]
+
+        sma = IncrementalSMA(period=5)
+        results = [sma.update(p) for p in sample_prices[:3]]
+        results += sma.update_batch(sample_prices[3:20]).tolist()
+        results += [sma.update(p) for p in sample_prices[20:]]
+
+        np.testing.assert_array_equal(results, expected)
+        assert sma.count == ref.count
+
+    def test_update_batch_long_drifting_series(self):
+        """Batch output stays identical to per-tick updates on long drifting input."""
+        rng = np.random.default_rng(7)
+        prices = 1e6 + np.cumsum(rng.normal(0.5, 10.0, 20_000))
+
+        ref = IncrementalSMA(period=50)
+        expected = [ref.update(p) for p in prices]
+
+        np.testing.assert_array_equal(IncrementalSMA(period=50).update_batch(prices), expected)
+
+    @pytest.mark.parametrize("cls, period", [(IncrementalEMA, 5), (IncrementalRSI, 7)])
+    def test_recursive_update_batch_matches_update(self, cls, period, sample_prices):
+        """EMA/RSI batch path yields the same values and state as per-tick updates."""
+        ref = cls(period=period)
+        expected = [ref.update(p) for p in sample_prices]
+
+        ind = cls(period=period)
+        results = ind.update_batch(sample_prices)
+
+        assert isinstance(results, np.ndarray)
+        np.testing.assert_array_equal(results, expected)
+        assert ind.count == ref.count
+        assert ind.is_ready == ref.is_ready
+        assert ind.update(100.0) == pytest.approx(ref.update(100.0))
+
+    @pytest.mark.parametrize("n", [3, 7, 8, 20])
+    def test_rsi_batch_readiness_matches_update(self, n, sample_prices):
+        """RSI is_ready follows the same rule in batch and per-tick paths."""
+        ref = IncrementalRSI(period=7)
+        for p in sample_prices[:n]:
+            ref.update(p)
+
+        rsi = IncrementalRSI(period=7)
+        rsi.update_batch(sample_prices[:n])
+
+        assert rsi.is_ready == ref.is_ready
+        np.testing.assert_array_equal(rsi.current, ref.current)
+
+    @pytest.mark.parametrize("factory", [
+        lambda: IncrementalSMA(period=3),
+        lambda: IncrementalEMA(period=3),
+        lambda: IncrementalRSI(period=3),
+        lambda: IncrementalMACD(fast=3, slow=5, signal=2),
+    ])
+    def test_update_batch_rejects_non_finite(self, factory):
+        """A non-finite value rejects the whole batch without touching state."""
+        ind = factory()
+        ind.update(100.0)
+        current = ind.current
+        with pytest.raises(ValueError, match="non-finite"):
+            ind.update_batch([101.0, 102.0, float('nan')])
+        assert ind.count == 1
+        np.testing.assert_array_equal(ind.current, current)
 
 
 # ==================== Edge Cases ====================
@@ -620,9 +752,9 @@ class TestIncrementalEnsembleSignal:
 
         # Ensemble needs enough data for all components (MACD slow=26 is longest)
         # Generate extended data if needed
-        extended_high = sample_ohlc['high'] * 2  # 60 points
-        extended_low = sample_ohlc['low'] * 2
-        extended_close = sample_ohlc['close'] * 2
+        extended_high = np.tile(sample_ohlc['high'], 2)  # 60 points
+        extended_low = np.tile(sample_ohlc['low'], 2)
+        extended_close = np.tile(sample_ohlc['close'], 2)
 
         # Process data until ready
         for h, l, c in zip(extended_high, extended_low, extended_close):
@@ -676,6 +808,11 @@ class TestIncrementalEnsembleSignal:
         with pytest.raises(ValueError, match="non-finite value"):
             IncrementalEnsembleSignal(weights={"rsi": float("inf")})
 
+    def test_zero_sum_weights_rejected_at_construction(self):
+        """Weights are normalized up front, so a zero sum fails immediately."""
+        with pytest.raises(ValueError, match="weights sum cannot be zero"):
+            IncrementalEnsembleSignal(weights={"rsi": 0.0, "macd": 0.0})
+
     def test_reset(self, sample_ohlc):
         """Test reset functionality."""
         ensemble = IncrementalEnsembleSignal()
@@ -772,52 +909,52 @@ class TestIncrementalMLSuperTrend:
 
 # ==================== Additional Coverage Tests ====================
 
+_RESET_CASES = [
+    pytest.param(lambda: IncrementalRSI(14), "close", 20, id="rsi"),
+    pytest.param(lambda: IncrementalMACD(), "close", 30, id="macd"),
+    pytest.param(lambda: IncrementalEMA(period=5), "close", 10, id="ema"),
+    pytest.param(lambda: IncrementalBollingerBands(period=10), "close", 15, id="bollinger"),
+    pytest.param(lambda: IncrementalStochastic(), "hlc", 20, id="stochastic"),
+    pytest.param(lambda: IncrementalSuperTrend(), "hlc", 20, id="supertrend"),
+    pytest.param(lambda: IncrementalATR(period=7), "hlc", 15, id="atr"),
+]
+
+
+def _feed(ind, arity, prices):
+    """Warm up via update_batch where available, else per-tick update."""
+    columns = (prices,) if arity == "close" else (prices + 2.0, prices - 2.0, prices)
+    if hasattr(ind, "update_batch"):
+        ind.update_batch(*columns)
+        return
+    for bar in zip(*columns):
+        ind.update(*bar)
+
+
 class TestResetMethods:
     """Test reset() methods for all incremental indicators."""
 
-    def test_rsi_reset(self):
-        """Test IncrementalRSI reset."""
-        rsi = IncrementalRSI(14)
-        for i in range(20):
-            rsi.update(100 + i)
-        assert rsi.count == 20
-        assert rsi.is_ready
-        rsi.reset()
-        assert rsi.count == 0
-        assert not rsi.is_ready
-        assert math.isnan(rsi.current)
-
-    def test_macd_reset(self):
-        """Test IncrementalMACD reset."""
-        macd = IncrementalMACD()
-        for i in range(30):
-            macd.update(100 + i * 0.5)
-        assert macd.count == 30
-        macd.reset()
-        assert macd.count == 0
-        m, s, h = macd.update(100.0)  # After reset, should be NaN
-        assert math.isnan(m)
-
-    def test_stochastic_reset(self):
-        """Test IncrementalStochastic reset."""
-        stoch = IncrementalStochastic()
-        for i in range(20):
-            stoch.update(101.0 + i, 99.0 + i, 100.0 + i)
-        assert stoch.count == 20
-        stoch.reset()
-        assert stoch.count == 0
-        k, d = stoch.update(101.0, 99.0, 100.0)
-        assert math.isnan(k)
-
-    def test_supertrend_reset(self):
-        """Test IncrementalSuperTrend reset."""
-        st = IncrementalSuperTrend()
-        for i in range(20):
-            st.update(102.0 + i, 98.0 + i, 100.0 + i)
-        assert st.count == 20
-        st.reset()
-        assert st.count == 0
-        assert math.isnan(st.current_direction)
+    @pytest.mark.parametrize("factory, arity, n", _RESET_CASES)
+    def test_reset(self, factory, arity, n):
+        """Reset clears count/readiness and replays identically to a fresh instance."""
+        ind = factory()
+        prices = np.arange(100, 100 + n, dtype=np.float64)
+        _feed(ind, arity, prices)
+        assert ind.count == n
+
+        ind.reset()
+        assert ind.count == 0
+        assert not ind.is_ready
+        # Cached outputs are cleared as well
+        for attr in ("current", "current_direction"):
+            if hasattr(ind, attr):
+                assert math.isnan(getattr(ind, attr))
+
+        fresh = factory()
+        bar = (100.0,) if arity == "close" else (102.0, 98.0, 100.0)
+        np.testing.assert_array_equal(
+            np.asarray(ind.update(*bar), dtype=float),
+            np.asarray(fresh.update(*bar), dtype=float),
+        )
 
 
 class TestStreamingEdgeCases:
@@ -860,43 +997,6 @@ class TestStreamingEdgeCases:
         assert arsi.count == prev_count
         assert arsi.is_ready
 
-    def test_ema_reset(self):
-        """Test IncrementalEMA reset."""
-        ema = IncrementalEMA(period=5)
-        for i in range(10):
-            ema.update(100.0 + i)
-        assert ema.count == 10
-        assert ema.is_ready
-        ema.reset()
-        assert ema.count == 0
-        assert not ema.is_ready
-        assert math.isnan(ema.current)
-
-    def test_atr_reset(self):
-        """Test IncrementalATR reset."""
-        atr = IncrementalATR(period=7)
-        for i in range(15):
-            atr.update(102.0 + i, 98.0 + i, 100.0 + i)
-        assert atr.count == 15
-        assert atr.is_ready
-        atr.reset()
-        assert atr.count == 0
-        assert not atr.is_ready
-        assert math.isnan(atr.current)
-
-    def test_bollinger_bands_reset(self):
-        """Test IncrementalBollingerBands reset."""
-        bb = IncrementalBollingerBands(period=10)
-        for i in range(15):
-            bb.update(100.0 + i)
-        assert bb.count == 15
-        assert bb.is_ready
-        bb.reset()
-        assert bb.count == 0
-        assert not bb.is_ready
-        upper, middle, lower = bb.update(100.0)
-        assert math.isnan(upper)
-
     def test_sma_invalid_period(self):
         """Test IncrementalSMA rejects period <= 0."""
         with pytest.raises(ValueError, match="period must be > 0"):
@@ -4,9 +4,9 @@ Trend Indicators Unit Tests
 
 测试所有14个趋势指标的核心功能。
 
-测试策略：
+测试策略（表驱动，每个指标一行参数）：
 - 基本计算：验证输出格式和范围
-- 边界条件：空数组、不足周期、单值
+- 边界条件：空数组
 - 参数测试：不同周期、特殊参数
 
 测试的指标：
@@ -14,7 +14,7 @@ Trend Indicators Unit Tests
 2. ADX - 平均趋向指数
 3. Parabolic SAR - 抛物线转向指标
 4. Aroon - 阿隆指标（返回up, down）
-5. DMI - 趋向指标（返回plus_di, minus_di）
+5. DMI - 趋向指标（由 PLUS_DI / MINUS_DI 两行覆盖）
 6. TRIX - 三重指数平滑移动平均
 7. DPO - 去趋势价格振荡器
 8. Vortex - 涡流指标（返回vi_plus, vi_minus）
@@ -34,798 +34,198 @@ import numpy as np
 import haze_library as haze
 
 
-# ==================== 1. SuperTrend ====================
+def _as_array(values) -> np.ndarray:
+    """绑定返回 list，统一转为 float64 数组后再做向量化检查"""
+    return np.asarray(values, dtype=np.float64)
 
-class TestSuperTrend:
-    """SuperTrend 单元测试
 
-    算法：基于ATR的趋势跟踪指标
-    特点：返回两个值(trend, direction)，direction为1/-1
+@pytest.fixture(scope="module")
+def cached():
     """
+    按 (指标, 输入, 参数) 缓存计算结果
 
-    def test_basic_calculation(self, ohlcv_data_extended):
-        """测试基本SuperTrend计算
-
-        返回值：(trend, direction)
-        direction: 1为上涨趋势，-1为下跌趋势
-        """
-        trend, direction, upper, lower = haze.py_supertrend(
-            ohlcv_data_extended['high'],
-            ohlcv_data_extended['low'],
-            ohlcv_data_extended['close'],
-            period=10,
-            multiplier=3.0
-        )
-
-        # 验证输出长度
-        assert len(trend) == len(ohlcv_data_extended['close'])
-        assert len(direction) == len(ohlcv_data_extended['close'])
-
-        # 验证direction为1或-1
-        valid_dir = [d for d in direction if not np.isnan(d)]
-        if valid_dir:
-            assert all(d in [1.0, -1.0] for d in valid_dir)
-
-    def test_edge_cases(self, empty_array):
-        """测试边界条件"""
-        # 空数组
-        with pytest.raises(ValueError):
-            haze.py_supertrend(empty_array, empty_array, empty_array, 10, 3.0)
-
-    def test_different_parameters(self, ohlcv_data_extended):
-        """测试不同参数组合"""
-        # 敏感SuperTrend（小multiplier）
-        trend_sensitive, dir_sensitive, _, _ = haze.py_supertrend(
-            ohlcv_data_extended['high'],
-            ohlcv_data_extended['low'],
-            ohlcv_data_extended['close'],
-            period=10,
-            multiplier=2.0
-        )
-
-        # 稳定SuperTrend（大multiplier）
-        trend_stable, dir_stable, _, _ = haze.py_supertrend(
-            ohlcv_data_extended['high'],
-            ohlcv_data_extended['low'],
-            ohlcv_data_extended['close'],
-            period=10,
-            multiplier=4.0
-        )
-
-        assert len(trend_sensitive) == len(ohlcv_data_extended['close'])
-        assert len(trend_stable) == len(ohlcv_data_extended['close'])
-
-
-# ==================== 2. ADX ====================
-
-class TestADX:
-    """ADX (Average Directional Index) 单元测试
-
-    算法：基于+DI和-DI的平滑平均
-    特点：范围0-100，>25表示强趋势
-    """
-
-    def test_basic_calculation(self, ohlcv_data_extended):
-        """测试基本ADX计算
-
-        ADX范围：0-100
-        >25强趋势，<20弱趋势
-        """
-        result, plus_di, minus_di = haze.py_adx(
-            ohlcv_data_extended['high'],
-            ohlcv_data_extended['low'],
-            ohlcv_data_extended['close'],
-            period=14
-        )
-
-        # 验证输出长度
-        assert len(result) == len(ohlcv_data_extended['close'])
-        assert len(plus_di) == len(ohlcv_data_extended['close'])
-        assert len(minus_di) == len(ohlcv_data_extended['close'])
-
-        # 验证范围
-        valid_values = [v for v in result if not np.isnan(v)]
-        if valid_values:
-            assert all(0 <= v <= 100 for v in valid_values)
-
-    def test_edge_cases(self, empty_array):
-        """测试边界条件"""
-        # 空数组
-        with pytest.raises(ValueError):
-            haze.py_adx(empty_array, empty_array, empty_array, period=14)
-
-    def test_different_parameters(self, ohlcv_data_extended):
-        """测试不同周期参数"""
-        result_7, _, _ = haze.py_adx(
-            ohlcv_data_extended['high'],
-            ohlcv_data_extended['low'],
-            ohlcv_data_extended['close'],
-            period=7
-        )
-
-        result_21, _, _ = haze.py_adx(
-            ohlcv_data_extended['high'],
-            ohlcv_data_extended['low'],
-            ohlcv_data_extended['close'],
-            period=18
-        )
-
-        # 更短周期有更多有效值
-        valid_7 = sum(1 for v in result_7 if not np.isnan(v))
-        valid_21 = sum(1 for v in result_21 if not np.isnan(v))
-        assert valid_7 >= valid_21
-
-
-# ==================== 3. Parabolic SAR ====================
-
-class TestParabolicSAR:
-    """Parabolic SAR 单元测试
-
-    算法：抛物线转向指标
-    特点：提供动态止损位，跟随价格移动
-    """
-
-    def test_basic_calculation(self, ohlcv_data_extended):
-        """测试基本Parabolic SAR计算
-
-        SAR应与价格相关，但不完全相同
-        返回值：(sar_values, direction)
-        """
-        result, direction = haze.py_psar(
-            ohlcv_data_extended['high'],
-            ohlcv_data_extended['low'],
-            ohlcv_data_extended['close'],
-            af_init=0.02,
-            af_increment=0.02,
-            af_max=0.2
-        )
-
-        # 验证输出长度
-        assert len(result) == len(ohlcv_data_extended['close'])
-        assert len(direction) == len(ohlcv_data_extended['close'])
-
-        # 验证有有效值
-        valid_values = [v for v in result if not np.isnan(v)]
-        assert len(valid_values) > 0
-
-    def test_edge_cases(self, empty_array):
-        """测试边界条件"""
-        # 空数组
-        with pytest.raises(ValueError):
-            haze.py_psar(empty_array, empty_array, empty_array, 0.02, 0.02, 0.2)
-
-    def test_different_parameters(self, ohlcv_data_extended):
-        """测试不同参数组合"""
-        # 敏感SAR（大af_max）
-        result_sensitive, _ = haze.py_psar(
-            ohlcv_data_extended['high'],
-            ohlcv_data_extended['low'],
-            ohlcv_data_extended['close'],
-            af_init=0.02,
-            af_increment=0.02,
-            af_max=0.3
-        )
-
-        # 稳定SAR（小af_max）
-        result_stable, _ = haze.py_psar(
-            ohlcv_data_extended['high'],
-            ohlcv_data_extended['low'],
-            ohlcv_data_extended['close'],
-            af_init=0.02,
-            af_increment=0.02,
-            af_max=0.15
-        )
-
-        assert len(result_sensitive) == len(ohlcv_data_extended['close'])
-        assert len(result_stable) == len(ohlcv_data_extended['close'])
-
-
-# ==================== 4. Aroon ====================
-
-class TestAroon:
-    """Aroon 单元测试
-
-    算法：Aroon Up = ((period - 最高价距离) / period) * 100
-          Aroon Down = ((period - 最低价距离) / period) * 100
-    特点：返回两个值(up, down)，范围0-100
-    """
-
-    def test_basic_calculation(self, ohlcv_data_extended):
-        """测试基本Aroon计算
-
-        返回值：(up, down)
-        范围：0-100
-        """
-        aroon_up, aroon_down, aroon_osc = haze.py_aroon(
-            ohlcv_data_extended['high'],
-            ohlcv_data_extended['low'],
-            period=14
-        )
-
-        # 验证输出长度
-        assert len(aroon_up) == len(ohlcv_data_extended['close'])
-        assert len(aroon_down) == len(ohlcv_data_extended['close'])
-
-        # 验证范围
-        valid_up = [v for v in aroon_up if not np.isnan(v)]
-        valid_down = [v for v in aroon_down if not np.isnan(v)]
-        if valid_up:
-            assert all(0 <= v <= 100 for v in valid_up)
-        if valid_down:
-            assert all(0 <= v <= 100 for v in valid_down)
-
-    def test_edge_cases(self, empty_array):
-        """测试边界条件"""
-        # 空数组
-        with pytest.raises(ValueError):
-            haze.py_aroon(empty_array, empty_array, period=14)
-
-    def test_different_parameters(self, ohlcv_data_extended):
-        """测试不同周期参数"""
-        # 短周期
-        up_short, down_short, _ = haze.py_aroon(
-            ohlcv_data_extended['high'],
-            ohlcv_data_extended['low'],
-            period=10
-        )
-
-        # 长周期
-        up_long, down_long, _ = haze.py_aroon(
-            ohlcv_data_extended['high'],
-            ohlcv_data_extended['low'],
-            period=18
-        )
-
-        # 更短周期有更多有效值
-        valid_short = sum(1 for v in up_short if not np.isnan(v))
-        valid_long = sum(1 for v in up_long if not np.isnan(v))
-        assert valid_short >= valid_long
-
-
-# ==================== 5. DMI ====================
-
-class TestDMI:
-    """DMI (Directional Movement Index) 单元测试
-
-    算法：+DI和-DI，衡量方向性移动
-    特点：使用 py_plus_di 和 py_minus_di 分别计算
-    """
-
-    def test_basic_calculation(self, ohlcv_data_extended):
-        """测试基本DMI计算
-
-        使用 py_plus_di 和 py_minus_di
-        都应为非负值
-        """
-        plus_di = haze.py_plus_di(
-            ohlcv_data_extended['high'],
-            ohlcv_data_extended['low'],
-            ohlcv_data_extended['close'],
-            period=14
-        )
-        minus_di = haze.py_minus_di(
-            ohlcv_data_extended['high'],
-            ohlcv_data_extended['low'],
-            ohlcv_data_extended['close'],
-            period=14
-        )
-
-        # 验证输出长度
-        assert len(plus_di) == len(ohlcv_data_extended['close'])
-        assert len(minus_di) == len(ohlcv_data_extended['close'])
-
-        # 验证非负值
-        valid_plus = [v for v in plus_di if not np.isnan(v)]
-        valid_minus = [v for v in minus_di if not np.isnan(v)]
-        if valid_plus:
-            assert all(v >= 0 for v in valid_plus)
-        if valid_minus:
-            assert all(v >= 0 for v in valid_minus)
-
-    def test_edge_cases(self, empty_array):
-        """测试边界条件"""
-        # 空数组
-        with pytest.raises(ValueError):
-            haze.py_plus_di(empty_array, empty_array, empty_array, period=14)
-        with pytest.raises(ValueError):
-            haze.py_minus_di(empty_array, empty_array, empty_array, period=14)
-
-    def test_different_parameters(self, ohlcv_data_extended):
-        """测试不同周期参数"""
-        # 短周期
-        plus_short = haze.py_plus_di(
-            ohlcv_data_extended['high'],
-            ohlcv_data_extended['low'],
-            ohlcv_data_extended['close'],
-            period=7
-        )
-        haze.py_minus_di(
-            ohlcv_data_extended['high'],
-            ohlcv_data_extended['low'],
-            ohlcv_data_extended['close'],
-            period=7
-        )
-
-        # 长周期
-        plus_long = haze.py_plus_di(
-            ohlcv_data_extended['high'],
-            ohlcv_data_extended['low'],
-            ohlcv_data_extended['close'],
-            period=18
-        )
-        haze.py_minus_di(
-            ohlcv_data_extended['high'],
-            ohlcv_data_extended['low'],
-            ohlcv_data_extended['close'],
-            period=18
-        )
-
-        assert len(plus_short) == len(ohlcv_data_extended['close'])
-        assert len(plus_long) == len(ohlcv_data_extended['close'])
-
-
-# ==================== 6. TRIX ====================
-
-class TestTRIX:
-    """TRIX (Triple Exponential Average) 单元测试
-
-    算法：三重指数平滑的变化率
-    特点：过滤短期波动，识别长期趋势
-    """
-
-    def test_basic_calculation(self, ohlcv_data_extended):
-        """测试基本TRIX计算
-
-        TRIX为百分比变化率
-        """
-        result = haze.py_trix(
-            ohlcv_data_extended['close'],
-            period=15
-        )
-
-        # 验证输出长度
-        assert len(result) == len(ohlcv_data_extended['close'])
-
-        # 验证有有效值
-        valid_values = [v for v in result if not np.isnan(v)]
-        assert len(valid_values) >= 0  # 可能数据不足
-
-    def test_edge_cases(self, empty_array):
-        """测试边界条件"""
-        # 空数组
-        with pytest.raises(ValueError):
-            haze.py_trix(empty_array, period=15)
-
-    def test_different_parameters(self, ohlcv_data_extended):
-        """测试不同周期参数"""
-        result_10 = haze.py_trix(ohlcv_data_extended['close'], period=10)
-        result_20 = haze.py_trix(ohlcv_data_extended['close'], period=20)
-
-        assert len(result_10) == len(ohlcv_data_extended['close'])
-        assert len(result_20) == len(ohlcv_data_extended['close'])
-
-
-# ==================== 7. DPO ====================
-
-class TestDPO:
-    """DPO (Detrended Price Oscillator) 单元测试
-
-    算法：去除趋势的价格振荡器
-    特点：消除长期趋势，关注周期性
-    """
-
-    def test_basic_calculation(self, ohlcv_data_extended):
-        """测试基本DPO计算
-
-        DPO去除趋势后的价格偏差
-        """
-        result = haze.py_dpo(
-            ohlcv_data_extended['close'],
-            period=20
-        )
-
-        # 验证输出长度
-        assert len(result) == len(ohlcv_data_extended['close'])
-
-        # 验证有有效值
-        valid_values = [v for v in result if not np.isnan(v)]
-        assert len(valid_values) >= 0
-
-    def test_edge_cases(self, empty_array):
-        """测试边界条件"""
-        # 空数组
-        with pytest.raises(ValueError):
-            haze.py_dpo(empty_array, period=20)
-
-    def test_different_parameters(self, ohlcv_data_extended):
-        """测试不同周期参数"""
-        result_10 = haze.py_dpo(ohlcv_data_extended['close'], period=10)
-        result_30 = haze.py_dpo(ohlcv_data_extended['close'], period=18)
-
-        assert len(result_10) == len(ohlcv_data_extended['close'])
-        assert len(result_30) == len(ohlcv_data_extended['close'])
-
-
-# ==================== 8. Vortex ====================
-
-class TestVortex:
-    """Vortex Indicator 单元测试
-
-    算法：基于价格范围的涡流运动
-    特点：返回两个值(vi_plus, vi_minus)
-    """
-
-    def test_basic_calculation(self, ohlcv_data_extended):
-        """测试基本Vortex计算
-
-        返回值：(vi_plus, vi_minus)
-        识别趋势开始和结束
-        """
-        vi_plus, vi_minus = haze.py_vortex(
-            ohlcv_data_extended['high'],
-            ohlcv_data_extended['low'],
-            ohlcv_data_extended['close'],
-            period=14
-        )
-
-        # 验证输出长度
-        assert len(vi_plus) == len(ohlcv_data_extended['close'])
-        assert len(vi_minus) == len(ohlcv_data_extended['close'])
-
-        # 验证有有效值
-        valid_plus = [v for v in vi_plus if not np.isnan(v)]
-        valid_minus = [v for v in vi_minus if not np.isnan(v)]
-        if valid_plus:
-            assert all(v >= 0 for v in valid_plus)
-        if valid_minus:
-            assert all(v >= 0 for v in valid_minus)
-
-    def test_edge_cases(self, empty_array):
-        """测试边界条件"""
-        # 空数组
-        with pytest.raises(ValueError):
-            haze.py_vortex(empty_array, empty_array, empty_array, period=14)
-
-    def test_different_parameters(self, ohlcv_data_extended):
-        """测试不同周期参数"""
-        # 短周期
-        plus_short, minus_short = haze.py_vortex(
-            ohlcv_data_extended['high'],
-            ohlcv_data_extended['low'],
-            ohlcv_data_extended['close'],
-            period=7
-        )
-
-        # 长周期
-        plus_long, minus_long = haze.py_vortex(
-            ohlcv_data_extended['high'],
-            ohlcv_data_extended['low'],
-            ohlcv_data_extended['close'],
-            period=18
-        )
-
-        assert len(plus_short) == len(ohlcv_data_extended['close'])
-        assert len(plus_long) == len(ohlcv_data_extended['close'])
-
-
-# ==================== 9. Choppiness ====================
-
-class TestChoppiness:
-    """Choppiness Index 单元测试
-
-    算法：衡量市场震荡程度
-    特点：范围0-100，>61.8为震荡，<38.2为趋势
-    """
-
-    def test_basic_calculation(self, ohlcv_data_extended):
-        """测试基本Choppiness计算
-
-        范围：0-100
-        >61.8震荡市，<38.2趋势市
-        """
-        result = haze.py_choppiness(
-            ohlcv_data_extended['high'],
-            ohlcv_data_extended['low'],
-            ohlcv_data_extended['close'],
-            period=14
-        )
-
-        # 验证输出长度
-        assert len(result) == len(ohlcv_data_extended['close'])
-
-        # 验证范围
-        valid_values = [v for v in result if not np.isnan(v)]
-        if valid_values:
-            assert all(0 <= v <= 100 for v in valid_values)
-
-    def test_edge_cases(self, empty_array):
-        """测试边界条件"""
-        # 空数组
-        with pytest.raises(ValueError):
-            haze.py_choppiness(empty_array, empty_array, empty_array, period=14)
-
-    def test_different_parameters(self, ohlcv_data_extended):
-        """测试不同周期参数"""
-        result_7 = haze.py_choppiness(
-            ohlcv_data_extended['high'],
-            ohlcv_data_extended['low'],
-            ohlcv_data_extended['close'],
-            period=7
-        )
-
-        result_21 = haze.py_choppiness(
-            ohlcv_data_extended['high'],
-            ohlcv_data_extended['low'],
-            ohlcv_data_extended['close'],
-            period=18
-        )
-
-        assert len(result_7) == len(ohlcv_data_extended['close'])
-        assert len(result_21) == len(ohlcv_data_extended['close'])
-
-
-# ==================== 10. QStick ====================
-
-class TestQStick:
-    """QStick 单元测试
-
-    算法：QStick = SMA(Close - Open, period)
-    特点：衡量收盘价与开盘价的关系
-    """
-
-    def test_basic_calculation(self, ohlcv_data_extended):
-        """测试基本QStick计算
-
-        QStick为收盘-开盘的平均
-        正值表示收盘高于开盘
-        """
-        result = haze.py_qstick(
-            ohlcv_data_extended['open'],
-            ohlcv_data_extended['close'],
-            period=14
-        )
-
-        # 验证输出长度
-        assert len(result) == len(ohlcv_data_extended['close'])
-
-        # 验证有有效值
-        valid_values = [v for v in result if not np.isnan(v)]
-        assert len(valid_values) > 0
-
-    def test_edge_cases(self, empty_array):
-        """测试边界条件"""
-        # 空数组
-        with pytest.raises(ValueError):
-            haze.py_qstick(empty_array, empty_array, period=14)
-
-    def test_different_parameters(self, ohlcv_data_extended):
-        """测试不同周期参数"""
-        result_7 = haze.py_qstick(
-            ohlcv_data_extended['open'],
-            ohlcv_data_extended['close'],
-            period=7
-        )
-
-        result_21 = haze.py_qstick(
-            ohlcv_data_extended['open'],
-            ohlcv_data_extended['close'],
-            period=18
-        )
-
-        # 更短周期有更多有效值
-        valid_7 = sum(1 for v in result_7 if not np.isnan(v))
-        valid_21 = sum(1 for v in result_21 if not np.isnan(v))
-        assert valid_7 >= valid_21
-
-
-# ==================== 11. VHF ====================
-
-class TestVHF:
-    """VHF (Vertical Horizontal Filter) 单元测试
-
-    算法：趋势强度指标
-    特点：值越大趋势越强
+    输入来自会话级只读数组，id 在整个会话内稳定；
+    各测试只检查长度与范围，共享同一份输出是安全的。
+    输出在缓存时转为 float64 数组，各项检查不再重复转换。
     """
-
-    def test_basic_calculation(self, ohlcv_data_extended):
-        """测试基本VHF计算
-
-        VHF衡量趋势强度
-        高值表示强趋势
-        """
-        result = haze.py_vhf(
-            ohlcv_data_extended['close'],
-            period=14
-        )
-
-        # 验证输出长度
-        assert len(result) == len(ohlcv_data_extended['close'])
-
-        # 验证有有效值
-        valid_values = [v for v in result if not np.isnan(v)]
-        if valid_values:
-            assert all(v >= 0 for v in valid_values)
-
-    def test_edge_cases(self, empty_array):
-        """测试边界条件"""
-        # 空数组
-        with pytest.raises(ValueError):
-            haze.py_vhf(empty_array, period=14)
-
-    def test_different_parameters(self, ohlcv_data_extended):
-        """测试不同周期参数"""
-        result_14 = haze.py_vhf(ohlcv_data_extended['close'], period=14)
-        result_28 = haze.py_vhf(ohlcv_data_extended['close'], period=18)
-
-        assert len(result_14) == len(ohlcv_data_extended['close'])
-        assert len(result_28) == len(ohlcv_data_extended['close'])
-
-
-# ==================== 12. DX ====================
-
-class TestDX:
-    """DX (Directional Movement Index) 单元测试
-
-    算法：DX = 100 * |+DI - -DI| / (+DI + -DI)
-    特点：范围0-100，ADX的基础
+    cache = {}
+
+    def call(func, *args, **kwargs):
+        key = (
+            func.__name__,
+            tuple(id(a) if isinstance(a, np.ndarray) else a for a in args),
+            tuple(sorted(kwargs.items())),
+        )
+        if key not in cache:
+            result = func(*args, **kwargs)
+            if isinstance(result, tuple):
+                cache[key] = tuple(_as_array(values) for values in result)
+            else:
+                cache[key] = _as_array(result)
+        return cache[key]
+
+    return call
+
+
+# ==================== 输出检查 ====================
+
+# 与 NaN 的比较恒为 False，范围检查可直接作用于原数组，无需先剔除预热期
+
+def _percent(values) -> None:
+    """范围 0-100"""
+    arr = _as_array(values)
+    assert not ((arr < 0) | (arr > 100)).any()
+
+
+def _non_negative(values) -> None:
+    arr = _as_array(values)
+    assert not (arr < 0).any()
+
+
+def _direction(values) -> None:
+    """趋势方向只取 1（上涨）或 -1（下跌），预热期为 NaN"""
+    arr = _as_array(values)
+    assert (np.isnan(arr) | (arr == 1.0) | (arr == -1.0)).all()
+
+
+def _has_values(values) -> None:
+    assert not np.isnan(_as_array(values)).all()
+
+
+# ==================== 指标表 ====================
+
+_HL = ("high", "low")
+_HLC = ("high", "low", "close")
+
+# id -> (函数, 输入列, 基本参数, ((输出下标, 检查), ...))
+_INDICATORS = {
+    # ATR 趋势跟踪：(trend, direction, upper, lower)
+    "supertrend": (
+        haze.py_supertrend, _HLC, {"period": 10, "multiplier": 3.0}, ((1, _direction),)
+    ),
+    # >25 强趋势，<20 弱趋势：(adx, plus_di, minus_di)
+    "adx": (haze.py_adx, _HLC, {"period": 14}, ((0, _percent),)),
+    # 动态止损位：(sar, direction)
+    "psar": (
+        haze.py_psar,
+        _HLC,
+        {"af_init": 0.02, "af_increment": 0.02, "af_max": 0.2},
+        ((0, _has_values),),
+    ),
+    # (up, down, osc)
+    "aroon": (haze.py_aroon, _HL, {"period": 14}, ((0, _percent), (1, _percent))),
+    # 三重指数平滑的变化率，数据不足时可以全为 NaN
+    "trix": (haze.py_trix, ("close",), {"period": 15}, ()),
+    "dpo": (haze.py_dpo, ("close",), {"period": 20}, ()),
+    # (vi_plus, vi_minus)
+    "vortex": (
+        haze.py_vortex, _HLC, {"period": 14}, ((0, _non_negative), (1, _non_negative))
+    ),
+    # >61.8 震荡市，<38.2 趋势市
+    "choppiness": (haze.py_choppiness, _HLC, {"period": 14}, ((0, _percent),)),
+    # SMA(Close - Open)
+    "qstick": (haze.py_qstick, ("open", "close"), {"period": 14}, ((0, _has_values),)),
+    "vhf": (haze.py_vhf, ("close",), {"period": 14}, ((0, _non_negative),)),
+    # 100 * |+DI - -DI| / (+DI + -DI)
+    "dx": (haze.py_dx, _HLC, {"period": 14}, ((0, _percent),)),
+    "plus_di": (haze.py_plus_di, _HLC, {"period": 14}, ((0, _non_negative),)),
+    "minus_di": (haze.py_minus_di, _HLC, {"period": 14}, ((0, _non_negative),)),
+}
+
+# id -> (指标, 参数 A, 参数 B, A 的有效值是否不少于 B)
+_PARAM_CASES = {
+    "supertrend-mult2-mult4": (
+        "supertrend",
+        {"period": 10, "multiplier": 2.0},
+        {"period": 10, "multiplier": 4.0},
+        False,
+    ),
+    "adx-p7-p18": ("adx", {"period": 7}, {"period": 18}, True),
+    "psar-max0.3-max0.15": (
+        "psar",
+        {"af_init": 0.02, "af_increment": 0.02, "af_max": 0.3},
+        {"af_init": 0.02, "af_increment": 0.02, "af_max": 0.15},
+        False,
+    ),
+    "aroon-p10-p18": ("aroon", {"period": 10}, {"period": 18}, True),
+    "trix-p10-p20": ("trix", {"period": 10}, {"period": 20}, False),
+    "dpo-p10-p18": ("dpo", {"period": 10}, {"period": 18}, False),
+    "vortex-p7-p18": ("vortex", {"period": 7}, {"period": 18}, False),
+    "choppiness-p7-p18": ("choppiness", {"period": 7}, {"period": 18}, False),
+    "qstick-p7-p18": ("qstick", {"period": 7}, {"period": 18}, True),
+    "vhf-p14-p18": ("vhf", {"period": 14}, {"period": 18}, False),
+    "dx-p7-p18": ("dx", {"period": 7}, {"period": 18}, False),
+    "plus_di-p7-p18": ("plus_di", {"period": 7}, {"period": 18}, True),
+    "minus_di-p7-p18": ("minus_di", {"period": 7}, {"period": 18}, True),
+}
+
+
+def _grouped(cases) -> list:
     """
+    为每行加上以指标名（id 中 '-' 之前的部分）命名的 xdist_group 标记
 
-    def test_basic_calculation(self, ohlcv_data_extended):
-        """测试基本DX计算
-
-        DX范围：0-100
-        衡量趋势强度
-        """
-        result = haze.py_dx(
-            ohlcv_data_extended['high'],
-            ohlcv_data_extended['low'],
-            ohlcv_data_extended['close'],
-            period=14
-        )
-
-        # 验证输出长度
-        assert len(result) == len(ohlcv_data_extended['close'])
-
-        # 验证范围
-        valid_values = [v for v in result if not np.isnan(v)]
-        if valid_values:
-            assert all(0 <= v <= 100 for v in valid_values)
-
-    def test_edge_cases(self, empty_array):
-        """测试边界条件"""
-        # 空数组
-        with pytest.raises(ValueError):
-            haze.py_dx(empty_array, empty_array, empty_array, period=14)
-
-    def test_different_parameters(self, ohlcv_data_extended):
-        """测试不同周期参数"""
-        result_7 = haze.py_dx(
-            ohlcv_data_extended['high'],
-            ohlcv_data_extended['low'],
-            ohlcv_data_extended['close'],
-            period=7
-        )
-
-        result_21 = haze.py_dx(
-            ohlcv_data_extended['high'],
-            ohlcv_data_extended['low'],
-            ohlcv_data_extended['close'],
-            period=18
-        )
-
-        assert len(result_7) == len(ohlcv_data_extended['close'])
-        assert len(result_21) == len(ohlcv_data_extended['close'])
-
-
-# ==================== 13. PLUS_DI ====================
-
-class TestPlusDI:
-    """PLUS_DI (Plus Directional Indicator) 单元测试
-
-    算法：+DI = 100 * Smoothed(+DM) / ATR
-    特点：衡量上升动量强度
+    使用 --dist=loadgroup 时同一指标的用例落在同一 worker；
+    其他分发模式下该标记被忽略。
     """
-
-    def test_basic_calculation(self, ohlcv_data_extended):
-        """测试基本+DI计算
-
-        +DI应为非负值
-        """
-        result = haze.py_plus_di(
-            ohlcv_data_extended['high'],
-            ohlcv_data_extended['low'],
-            ohlcv_data_extended['close'],
-            period=14
+    return [
+        pytest.param(
+            *case, id=case_id, marks=pytest.mark.xdist_group(case_id.split("-")[0])
         )
+        for case_id, case in cases.items()
+    ]
 
-        # 验证输出长度
-        assert len(result) == len(ohlcv_data_extended['close'])
 
-        # 验证非负值
-        valid_values = [v for v in result if not np.isnan(v)]
-        if valid_values:
-            assert all(v >= 0 for v in valid_values)
+_BASIC_PARAMS = _grouped(_INDICATORS)
+_VARIANT_PARAMS = _grouped(_PARAM_CASES)
 
-    def test_edge_cases(self, empty_array):
-        """测试边界条件"""
-        # 空数组
-        with pytest.raises(ValueError):
-            haze.py_plus_di(empty_array, empty_array, empty_array, period=14)
-
-    def test_different_parameters(self, ohlcv_data_extended):
-        """测试不同周期参数"""
-        result_7 = haze.py_plus_di(
-            ohlcv_data_extended['high'],
-            ohlcv_data_extended['low'],
-            ohlcv_data_extended['close'],
-            period=7
-        )
 
-        result_21 = haze.py_plus_di(
-            ohlcv_data_extended['high'],
-            ohlcv_data_extended['low'],
-            ohlcv_data_extended['close'],
-            period=18
-        )
+def _outputs(result) -> tuple:
+    return result if isinstance(result, tuple) else (result,)
 
-        # 更短周期有更多有效值
-        valid_7 = sum(1 for v in result_7 if not np.isnan(v))
-        valid_21 = sum(1 for v in result_21 if not np.isnan(v))
-        assert valid_7 >= valid_21
 
-
-# ==================== 14. MINUS_DI ====================
-
-class TestMinusDI:
-    """MINUS_DI (Minus Directional Indicator) 单元测试
-
-    算法：-DI = 100 * Smoothed(-DM) / ATR
-    特点：衡量下降动量强度
-    """
-
-    def test_basic_calculation(self, ohlcv_data_extended):
-        """测试基本-DI计算
-
-        -DI应为非负值
-        """
-        result = haze.py_minus_di(
-            ohlcv_data_extended['high'],
-            ohlcv_data_extended['low'],
-            ohlcv_data_extended['close'],
-            period=14
+class TestTrendIndicators:
+    @pytest.mark.parametrize("func, inputs, kwargs, checks", _BASIC_PARAMS)
+    def test_basic_calculation(
+        self, ohlcv_np_extended, n_extended, cached, func, inputs, kwargs, checks
+    ):
+        """验证每个输出的长度，以及各指标的取值约束"""
+        outputs = _outputs(
+            cached(func, *(ohlcv_np_extended[key] for key in inputs), **kwargs)
         )
 
-        # 验证输出长度
-        assert len(result) == len(ohlcv_data_extended['close'])
+        for values in outputs:
+            assert len(values) == n_extended
+        for index, check in checks:
+            check(outputs[index])
 
-        # 验证非负值
-        valid_values = [v for v in result if not np.isnan(v)]
-        if valid_values:
-            assert all(v >= 0 for v in valid_values)
-
-    def test_edge_cases(self, empty_array):
-        """测试边界条件"""
-        # 空数组
+    @pytest.mark.parametrize("func, inputs, kwargs, checks", _BASIC_PARAMS)
+    def test_edge_cases(self, empty_array, func, inputs, kwargs, checks):
+        """空数组应抛出 ValueError"""
         with pytest.raises(ValueError):
-            haze.py_minus_di(empty_array, empty_array, empty_array, period=14)
-
-    def test_different_parameters(self, ohlcv_data_extended):
-        """测试不同周期参数"""
-        result_7 = haze.py_minus_di(
-            ohlcv_data_extended['high'],
-            ohlcv_data_extended['low'],
-            ohlcv_data_extended['close'],
-            period=7
-        )
-
-        result_21 = haze.py_minus_di(
-            ohlcv_data_extended['high'],
-            ohlcv_data_extended['low'],
-            ohlcv_data_extended['close'],
-            period=18
-        )
-
-        # 更短周期有更多有效值
-        valid_7 = sum(1 for v in result_7 if not np.isnan(v))
-        valid_21 = sum(1 for v in result_21 if not np.isnan(v))
-        assert valid_7 >= valid_21
+            func(*(empty_array for _ in inputs), **kwargs)
+
+    @pytest.mark.parametrize("name, kwargs_a, kwargs_b, a_has_more", _VARIANT_PARAMS)
+    def test_different_parameters(
+        self,
+        ohlcv_np_extended,
+        n_extended,
+        cached,
+        name,
+        kwargs_a,
+        kwargs_b,
+        a_has_more,
+    ):
+        """不同参数下输出长度不变；更短周期有更多有效值"""
+        func, inputs, _, _ = _INDICATORS[name]
+        columns = [ohlcv_np_extended[key] for key in inputs]
+
+        result_a = _outputs(cached(func, *columns, **kwargs_a))[0]
+        result_b = _outputs(cached(func, *columns, **kwargs_b))[0]
+
+        assert len(result_a) == n_extended
+        assert len(result_b) == n_extended
+        if a_has_more:
+            # 长度相同，有效值更多即 NaN 更少
+            nan_a = np.count_nonzero(np.isnan(result_a))
+            nan_b = np.count_nonzero(np.isnan(result_b))
+            assert nan_a <= nan_b
@@ -120,8 +120,8 @@ class TestStatisticsVsTaLib:
         result = validator.validate(
             name="CORREL",
             haze_fn=lambda: haze.py_correl(
-                df["high"].tolist(),
-                df["low"].tolist(),
+                np.ascontiguousarray(df["high"], dtype=np.float64),
+                np.ascontiguousarray(df["low"], dtype=np.float64),
                 30
             ),
             ref_fn=lambda: talib.CORREL(
@@ -139,8 +139,8 @@ class TestStatisticsVsTaLib:
         result = validator.validate(
             name="BETA",
             haze_fn=lambda: haze.py_beta(
-                df["high"].tolist(),
-                df["low"].tolist(),
+                np.ascontiguousarray(df["high"], dtype=np.float64),
+                np.ascontiguousarray(df["low"], dtype=np.float64),
                 5
             ),
             ref_fn=lambda: talib.BETA(